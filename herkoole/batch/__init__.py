@@ -0,0 +1,5 @@
+from .jobs import Job as Job
+from .jobs import discover as discover
+from .jobs import read_manifest as read_manifest
+from .jobs import run as run
+from .jobs import solve as solve
@@ -0,0 +1,70 @@
+import json
+import pathlib
+import sys
+import typing
+
+import click
+
+from .jobs import LOADERS, discover, read_manifest, run
+
+
+@click.command()
+@click.argument("source", type=click.Path(exists=True, path_type=pathlib.Path))
+@click.option(
+    "--problem",
+    "-p",
+    default="knapsack",
+    type=click.Choice(list(LOADERS), case_sensitive=False),
+    help="problem of the instances in a directory.",
+)
+@click.option("--pattern", default="*.txt", help="instances of a directory.")
+@click.option("--workers", "-w", default=None, type=int)
+@click.option("--output", "-o", default="-", type=click.File("w"))
+@click.option("--iterations", "-t", default=100, type=int)
+@click.option(
+    "--time-budget",
+    default=None,
+    type=float,
+    help="soft wall time budget (in seconds) of each job, "
+    "it is checked between generations.",
+)
+@click.option(
+    "--seed",
+    "-s",
+    default=None,
+    type=int,
+    help="seed of the jobs which their manifest has no seed.",
+)
+def main(  # noqa: PLR0913, PLR0917
+    source: pathlib.Path,
+    problem: str,
+    pattern: str,
+    workers: int | None,
+    output: typing.TextIO,
+    iterations: int,
+    time_budget: float | None,
+    seed: int | None,
+) -> None:
+    """
+    solves the instances of a directory or a json-lines manifest and
+    writes result of each job as one json object per line.
+    """
+    parameters = {"iterations": iterations, "time_budget": time_budget}
+    if source.is_dir():
+        jobs = discover(source, pattern, problem=problem, **parameters)
+    else:
+        jobs = read_manifest(source, **parameters)
+
+    failures = 0
+    for result in run(jobs, workers, seed):
+        failures += "error" in result
+        output.write(json.dumps(result) + "\n")
+        output.flush()
+
+    if failures > 0:
+        click.echo(f"{failures} of {len(jobs)} jobs failed", err=True)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
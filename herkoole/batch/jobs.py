@@ -0,0 +1,206 @@
+"""
+Batch solving of many problem instances. Jobs are read from a directory
+of instances or from a json-lines manifest, they run on a worker pool
+and their results are streamed as soon as each of them finishes.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import dataclasses
+import json
+import pathlib
+import time
+import typing
+
+import numpy as np
+
+from herkoole import knapsack, tsp
+from herkoole.ea import (
+    AnyOf,
+    EvolutionaryAlgorithm,
+    FitnessVariance,
+    MaxGenerations,
+    QTournament,
+    StochasticUniversalSampling,
+    TimeBudget,
+)
+from herkoole.rng import sequence
+
+if typing.TYPE_CHECKING:
+    from herkoole.model import Model
+
+LOADERS: dict[str, typing.Callable[[pathlib.Path], Model]] = {
+    "knapsack": knapsack.load,
+    "tsp": tsp.load,
+}
+
+
+@dataclasses.dataclass
+class Job:
+    """
+    Job is one run of the evolutionary algorithm on an instance, its
+    parameters are the same as the main command by default.
+    """
+
+    id: str
+    path: str
+    problem: str = "knapsack"
+    mu: int = 10
+    y: int = 20
+    iterations: int = 100
+    threshold: float = 0.0001
+    crossover_propability: float = 0.1
+    mutation_propability: float = 0.5
+    vectorized: bool = False
+    # wall time budget (in seconds) of the run, it does not include loading.
+    # It is soft, the budget is checked between generations, so a long
+    # generation overruns it and a hung job is not killed.
+    time_budget: float | None = None
+    seed: int | None = None
+    # error of an invalid manifest line, the job is reported without running.
+    error: str | None = None
+
+    def __post_init__(self) -> None:
+        if self.problem not in LOADERS:
+            msg = f"unknown problem {self.problem}"
+            raise ValueError(msg)
+
+
+def discover(
+    directory: str | pathlib.Path,
+    pattern: str = "*.txt",
+    **parameters: typing.Any,  # noqa: ANN401
+) -> list[Job]:
+    """
+    returns a job for each instance in the directory which matches
+    the pattern, all of them have the given parameters.
+    """
+    return [
+        Job(id=path.stem, path=str(path), **parameters)
+        for path in sorted(pathlib.Path(directory).glob(pattern))
+        if path.is_file()
+    ]
+
+
+def read_manifest(
+    path: str | pathlib.Path,
+    **parameters: typing.Any,  # noqa: ANN401
+) -> list[Job]:
+    """
+    returns jobs of a json-lines manifest which each line has the
+    path (relative to the manifest) and parameters of one job.
+    Given parameters are the defaults of the jobs. An invalid line
+    (e.g. with an unknown parameter) becomes a job with its error,
+    so it fails alone instead of the whole batch.
+    """
+    path = pathlib.Path(path)
+
+    jobs = []
+    with path.open(encoding="utf-8") as f:
+        for number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                fields = {**parameters, **json.loads(line)}
+                instance = path.parent / fields.pop("path")
+                fields.setdefault("id", f"{number}:{instance.stem}")
+                jobs.append(Job(path=str(instance), **fields))
+            except (ValueError, TypeError, KeyError) as error:
+                jobs.append(
+                    Job(
+                        id=f"{number}:invalid",
+                        path=str(path),
+                        error=f"{type(error).__name__}: {error}",
+                    ),
+                )
+
+    return jobs
+
+
+def solve(
+    job: Job,
+    sequence: np.random.SeedSequence | None = None,
+) -> dict[str, typing.Any]:
+    """
+    runs the job and returns its result, failures are reported
+    in the result instead of being raised. Jobs without a seed
+    use the given seed sequence.
+    """
+    result: dict[str, typing.Any] = {
+        "id": job.id,
+        "path": job.path,
+        "problem": job.problem,
+    }
+    if job.error is not None:
+        result["error"] = job.error
+        result["timings"] = {"total": 0.0}
+        return result
+
+    start = time.perf_counter()
+    try:
+        model = LOADERS[job.problem](pathlib.Path(job.path))
+        loaded = time.perf_counter()
+
+        criteria = [
+            MaxGenerations.new(job.iterations),
+            FitnessVariance.new(10, job.threshold),
+        ]
+        if job.time_budget is not None:
+            criteria.append(TimeBudget.new(job.time_budget))
+
+        ea = EvolutionaryAlgorithm(
+            job.mu,
+            job.y,
+            job.iterations,
+            model,
+            parent_selector=StochasticUniversalSampling.new(),
+            remaining_population_selector=QTournament.new(q=2),
+            threshold=job.threshold,
+            crossover_propability=job.crossover_propability,
+            mutation_propability=job.mutation_propability,
+            vectorized=job.vectorized,
+            stopping_criterion=AnyOf.new(*criteria),
+            seed=sequence if job.seed is None else job.seed,
+        )
+        answer = ea.run()
+    except Exception as error:  # noqa: BLE001
+        result["error"] = f"{type(error).__name__}: {error}"
+        result["timings"] = {"total": time.perf_counter() - start}
+        return result
+
+    solved = time.perf_counter()
+    result.update(
+        fitness=answer.fitness(),
+        solution=np.asarray(answer.genes).tolist(),
+        generations=ea.generation_counter,
+        evaluations=ea.fitness_cache.misses,
+        timings={
+            "load": loaded - start,
+            "solve": solved - loaded,
+            "total": solved - start,
+        },
+    )
+    return result
+
+
+def run(
+    jobs: typing.Iterable[Job],
+    workers: int | None = None,
+    seed: int | None = None,
+) -> typing.Iterator[dict[str, typing.Any]]:
+    """
+    solves the jobs on a pool of worker processes and yields the results
+    in the order they finish. Jobs without a seed get independent children
+    of the seed sequence (in their order), so the results do not depend
+    on the worker which runs each job.
+    """
+    jobs = list(jobs)
+    sequences = sequence(seed).spawn(len(jobs))
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(solve, job, s)
+            for job, s in zip(jobs, sequences, strict=True)
+        ]
+        for future in concurrent.futures.as_completed(futures):
+            yield future.result()
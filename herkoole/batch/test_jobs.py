@@ -0,0 +1,56 @@
+import json
+import pathlib
+import shutil
+
+from .jobs import Job, discover, read_manifest, run, solve
+
+ROOT = pathlib.Path(__file__).parents[2]
+
+
+def test_solve(tmp_path: pathlib.Path) -> None:
+    # instances are copied, so their parse cache is not written in the repository.
+    shutil.copy(ROOT / "knapsack_example.txt", tmp_path / "knapsack_example.txt")
+    result = solve(Job("k", str(tmp_path / "knapsack_example.txt"), iterations=5))
+    assert "error" not in result
+    assert result["generations"] <= 6
+    assert result["fitness"] > 0
+    assert set(result["timings"]) == {"load", "solve", "total"}
+
+    result = solve(Job("t", str(ROOT / "missing.txt"), problem="tsp"))
+    assert "error" in result
+
+
+def test_batch(tmp_path: pathlib.Path) -> None:
+    for name in ("knapsack_1.txt", "knapsack_example.txt"):
+        shutil.copy(ROOT / name, tmp_path / name)
+    shutil.copy(ROOT / "tsp_example.txt", tmp_path / "tsp.txt")
+
+    jobs = discover(tmp_path, "knapsack_*.txt", iterations=3)
+    assert [job.id for job in jobs] == ["knapsack_1", "knapsack_example"]
+
+    manifest = tmp_path / "manifest.jsonl"
+    manifest.write_text(
+        "\n".join(
+            json.dumps(line)
+            for line in [
+                {"path": "knapsack_1.txt", "id": "k", "vectorized": True},
+                {"path": "tsp.txt", "problem": "tsp", "mu": 6, "y": 12},
+                {"path": "missing.txt"},
+                {"path": "tsp.txt", "generations": 3},
+                {"problem": "tsp"},
+            ]
+        ),
+        encoding="utf-8",
+    )
+    jobs += read_manifest(manifest, iterations=3, time_budget=10)
+    assert jobs[2].vectorized is True
+    assert jobs[3].id == "2:tsp"
+    assert jobs[3].time_budget == 10
+
+    results = {result["id"]: result for result in run(jobs, workers=2)}
+    assert set(results) == {job.id for job in jobs}
+    assert "error" in results["3:missing"]
+    assert "generations" in results["4:invalid"]["error"]
+    assert "path" in results["5:invalid"]["error"]
+    assert all("error" not in results[job.id] for job in jobs[:4])
+    assert len(results["2:tsp"]["solution"]) == 4
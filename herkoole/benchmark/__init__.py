@@ -0,0 +1,9 @@
+from .instances import knapsack_instance as knapsack_instance
+from .instances import tsp_instance as tsp_instance
+from .suite import BENCHMARKS as BENCHMARKS
+from .suite import SCALES as SCALES
+from .suite import Benchmark as Benchmark
+from .suite import Result as Result
+from .suite import compare as compare
+from .suite import measure as measure
+from .suite import reference_throughput as reference_throughput
@@ -0,0 +1,74 @@
+import sys
+
+import click
+
+from .suite import (
+    BENCHMARKS,
+    SCALES,
+    compare,
+    load,
+    measure,
+    reference_throughput,
+    save,
+)
+
+
+@click.command()
+@click.option(
+    "--scale",
+    "-s",
+    "scales",
+    multiple=True,
+    default=["small"],
+    type=click.Choice(list(SCALES)),
+)
+@click.option("--filter", "-k", "pattern", default="", help="run matching benchmarks.")
+@click.option("--repeat", "-n", default=3, type=int)
+@click.option("--output", "-o", default=None, type=click.Path(dir_okay=False))
+@click.option("--baseline", "-b", default=None, type=click.Path(exists=True))
+@click.option(
+    "--tolerance",
+    default=0.2,
+    type=float,
+    help="relative slowdown (to the reference workload) which is a regression.",
+)
+def main(  # noqa: PLR0913, PLR0917
+    scales: tuple[str, ...],
+    pattern: str,
+    repeat: int,
+    output: str | None,
+    baseline: str | None,
+    tolerance: float,
+) -> None:
+    reference = reference_throughput(repeat)
+    results = []
+    for scale in scales:
+        for benchmark in BENCHMARKS:
+            if pattern not in benchmark.name:
+                continue
+            result = measure(benchmark, scale, repeat, reference=reference)
+            results.append(result)
+            click.echo(
+                f"{result.name:<36} {result.scale:<7} "
+                f"{result.throughput:>14,.1f} {result.unit}/s "
+                f"{result.peak_memory / 2**20:>10.1f} MiB",
+            )
+
+    if output is not None:
+        save(results, output)
+
+    if baseline is not None:
+        regressions = 0
+        for (name, scale), ratio in compare(results, load(baseline)).items():
+            regressed = ratio < 1 - tolerance
+            regressions += regressed
+            click.echo(
+                f"{name:<36} {scale:<7} {ratio:>6.2f}x"
+                + (" (regression)" if regressed else ""),
+            )
+        if regressions > 0:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""
+Seeded generators of synthetic problem instances, they are used
+for benchmarks which need instances larger than the bundled files.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from herkoole.knapsack import Model as KnapsackModel
+from herkoole.tsp import City
+from herkoole.tsp import Model as TSPModel
+
+
+def knapsack_instance(items: int, seed: int = 0) -> KnapsackModel:
+    """
+    returns a knapsack instance with weakly correlated values,
+    the capacity is half of the total weight.
+    """
+    rng = np.random.default_rng(seed)
+
+    weights = rng.integers(1, 101, size=items)
+    values = np.maximum(weights + rng.integers(-10, 11, size=items), 1)
+
+    return KnapsackModel(weights, values, int(weights.sum()) // 2)
+
+
+def tsp_instance(cities: int, seed: int = 0) -> TSPModel:
+    """
+    returns a tsp instance with cities uniformly distributed
+    in a (1000 x 1000) square.
+    """
+    rng = np.random.default_rng(seed)
+
+    coordinates = rng.uniform(0, 1000, size=(cities, 2))
+
+    return TSPModel(
+        [City(i + 1, float(x), float(y)) for i, (x, y) in enumerate(coordinates)],
+    )
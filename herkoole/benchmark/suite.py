@@ -0,0 +1,408 @@
+"""
+Benchmarks of the evolutionary algorithm hot paths. Each benchmark
+runs one operation on a synthetic instance of the given scale and
+reports its throughput and peak (python and numpy) memory.
+
+Absolute throughput depends on the machine, so each result also stores
+throughput of a fixed reference workload which is measured in the same
+run, and results are compared by their throughput relative to it.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import pathlib
+import time
+import tracemalloc
+import typing
+
+import numpy as np
+
+from herkoole import rng
+from herkoole.ea import EvolutionaryAlgorithm, QTournament, StochasticUniversalSampling
+from herkoole.population import ArrayPopulation
+from herkoole.tsp.crossover import CROSSOVERS
+
+from .instances import knapsack_instance, tsp_instance
+
+if typing.TYPE_CHECKING:
+    import numpy.typing as npt
+
+    from herkoole.ea.evolutionary_algorithm import (
+        NextPopulationSelector,
+        ParentSelector,
+    )
+    from herkoole.model import Model
+
+
+@dataclasses.dataclass(frozen=True)
+class Scale:
+    population: int
+    genes: int
+    # number of generations in the full run benchmarks.
+    generations: int
+
+
+SCALES: dict[str, Scale] = {
+    "tiny": Scale(population=100, genes=50, generations=2),
+    "small": Scale(population=1_000, genes=200, generations=5),
+    "medium": Scale(population=10_000, genes=1_000, generations=5),
+    "large": Scale(population=100_000, genes=5_000, generations=3),
+}
+
+
+@dataclasses.dataclass
+class Result:
+    name: str
+    scale: str
+    # number of processed items (e.g. evaluations) in one run.
+    units: int
+    unit: str
+    # best wall time of the repeats.
+    seconds: float
+    peak_memory: int
+    # throughput of the reference workload on the same machine.
+    reference: float
+
+    @property
+    def throughput(self) -> float:
+        return self.units / self.seconds if self.seconds > 0 else float("inf")
+
+    @property
+    def relative(self) -> float:
+        """
+        returns throughput relative to the reference workload,
+        it is comparable between machines.
+        """
+        return self.throughput / self.reference
+
+
+type Setup = typing.Callable[[Scale], typing.Callable[[], int]]
+type Problem = typing.Callable[[int], Model]
+
+
+@dataclasses.dataclass
+class Benchmark:
+    """
+    Benchmark prepares its inputs with setup (which is not measured),
+    then the returned function is measured and returns
+    number of the processed units.
+    """
+
+    name: str
+    unit: str
+    setup: Setup
+
+
+# number of values in the reference workload.
+REFERENCE_SIZE = 200_000
+
+
+def _reference(scale: Scale) -> typing.Callable[[], int]:  # noqa: ARG001
+    # numpy and python loops like the benchmarks, it does not use herkoole.
+    values = np.random.default_rng(0).random(REFERENCE_SIZE)
+
+    def _run() -> int:
+        np.sort(values)
+        total = 0.0
+        for value in values.tolist():
+            total += value
+        return REFERENCE_SIZE
+
+    return _run
+
+
+REFERENCE = Benchmark("reference", "values", _reference)
+
+
+def _genomes(model: Model, scale: Scale) -> npt.NDArray[typing.Any]:
+    return model.encode(model.initial_population(scale.population))
+
+
+def _fitness(problem: Problem) -> Setup:
+    def _setup(scale: Scale) -> typing.Callable[[], int]:
+        model = problem(scale.genes)
+        genomes = _genomes(model, scale)
+
+        def _run() -> int:
+            model.batch_fitness(genomes)
+            return len(genomes)
+
+        return _run
+
+    return _setup
+
+
+def _chromosome_fitness(problem: Problem) -> Setup:
+    def _setup(scale: Scale) -> typing.Callable[[], int]:
+        model = problem(scale.genes)
+        chromosomes = model.initial_population(scale.population)
+
+        def _run() -> int:
+            for chromosome in chromosomes:
+                chromosome.evaluate()
+            return len(chromosomes)
+
+        return _run
+
+    return _setup
+
+
+def _crossover(problem: Problem) -> Setup:
+    def _setup(scale: Scale) -> typing.Callable[[], int]:
+        model = problem(scale.genes)
+        genomes = _genomes(model, scale)
+        half = len(genomes) // 2
+
+        def _run() -> int:
+            model.batch_crossover(genomes[:half], genomes[half : 2 * half], 1)
+            return 2 * half
+
+        return _run
+
+    return _setup
+
+
+def _tsp_crossover(operator: str) -> Setup:
+    def _setup(scale: Scale) -> typing.Callable[[], int]:
+        genomes = _genomes(tsp_instance(scale.genes), scale)
+        half = len(genomes) // 2
+
+        def _run() -> int:
+            CROSSOVERS[operator](genomes[:half], genomes[half : 2 * half])
+            return 2 * half
+
+        return _run
+
+    return _setup
+
+
+def _mutation(problem: Problem) -> Setup:
+    def _setup(scale: Scale) -> typing.Callable[[], int]:
+        model = problem(scale.genes)
+        genomes = _genomes(model, scale)
+
+        def _run() -> int:
+            model.batch_mutate(genomes, 1)
+            return len(genomes)
+
+        return _run
+
+    return _setup
+
+
+# number of items of the knapsack instance which selectors are measured on,
+# their cost does not depend on the genome length.
+SELECTION_ITEMS = 10
+
+
+def _algorithm(scale: Scale) -> EvolutionaryAlgorithm:
+    return EvolutionaryAlgorithm(
+        scale.population,
+        scale.population,
+        0,
+        knapsack_instance(SELECTION_ITEMS),
+        parent_selector=StochasticUniversalSampling.new(),
+        remaining_population_selector=QTournament.new(q=2),
+        vectorized=True,
+    )
+
+
+def _parent_selection(
+    selector: typing.Callable[[EvolutionaryAlgorithm], ParentSelector],
+) -> Setup:
+    def _setup(scale: Scale) -> typing.Callable[[], int]:
+        ea = _algorithm(scale)
+        select = selector(ea)
+        fitnesses = ea.fitness(ea.population)
+        probs = fitnesses / np.sum(fitnesses) if select.normalized else fitnesses
+
+        def _run() -> int:
+            select(probs)
+            return scale.population
+
+        return _run
+
+    return _setup
+
+
+def _survivor_selection(
+    selector: typing.Callable[[EvolutionaryAlgorithm], NextPopulationSelector],
+) -> Setup:
+    def _setup(scale: Scale) -> typing.Callable[[], int]:
+        ea = _algorithm(scale)
+        select = selector(ea)
+        # the population competes with the same number of children.
+        children = ArrayPopulation(
+            ea.model,
+            ea.model.initial_genomes(scale.population, ea.rng),
+        )
+        items = ea.population.concat(children)
+        fitnesses = ea.fitness(items)
+        probs = fitnesses / np.sum(fitnesses)
+
+        def _run() -> int:
+            select(items, probs, scale.population)
+            return scale.population
+
+        return _run
+
+    return _setup
+
+
+def _generations(problem: Problem, *, vectorized: bool) -> Setup:
+    def _setup(scale: Scale) -> typing.Callable[[], int]:
+        model = problem(scale.genes)
+        # generations have mu / 10 parents and mu / 5 children.
+        mu = max(scale.population // 10, 2)
+
+        def _run() -> int:
+            ea = EvolutionaryAlgorithm(
+                mu,
+                2 * mu,
+                scale.generations - 1,
+                model,
+                parent_selector=StochasticUniversalSampling.new(),
+                remaining_population_selector=QTournament.new(q=2),
+                threshold=0,
+                vectorized=vectorized,
+            )
+            ea.run()
+            return ea.generation_counter
+
+        return _run
+
+    return _setup
+
+
+BENCHMARKS: list[Benchmark] = [
+    Benchmark("knapsack.batch_fitness", "evaluations", _fitness(knapsack_instance)),
+    Benchmark(
+        "knapsack.evaluate",
+        "evaluations",
+        _chromosome_fitness(knapsack_instance),
+    ),
+    Benchmark("knapsack.batch_crossover", "children", _crossover(knapsack_instance)),
+    Benchmark("knapsack.batch_mutate", "mutations", _mutation(knapsack_instance)),
+    Benchmark("tsp.batch_fitness", "evaluations", _fitness(tsp_instance)),
+    Benchmark("tsp.evaluate", "evaluations", _chromosome_fitness(tsp_instance)),
+    *(
+        Benchmark(f"tsp.crossover.{operator}", "children", _tsp_crossover(operator))
+        for operator in CROSSOVERS
+    ),
+    Benchmark("tsp.batch_mutate", "mutations", _mutation(tsp_instance)),
+    Benchmark(
+        "ea.stochastic_universal_sampling",
+        "selections",
+        _parent_selection(StochasticUniversalSampling.new()),
+    ),
+    Benchmark(
+        "ea.q_tournament",
+        "selections",
+        _survivor_selection(QTournament.new(q=2)),
+    ),
+    Benchmark(
+        "ea.run.knapsack",
+        "generations",
+        _generations(knapsack_instance, vectorized=False),
+    ),
+    Benchmark(
+        "ea.run.knapsack.vectorized",
+        "generations",
+        _generations(knapsack_instance, vectorized=True),
+    ),
+    Benchmark(
+        "ea.run.tsp",
+        "generations",
+        _generations(tsp_instance, vectorized=False),
+    ),
+    Benchmark(
+        "ea.run.tsp.vectorized",
+        "generations",
+        _generations(tsp_instance, vectorized=True),
+    ),
+]
+
+
+def reference_throughput(repeat: int = 3) -> float:
+    """
+    returns throughput of the reference workload on this machine.
+    """
+    return measure(REFERENCE, "tiny", repeat, reference=1.0).throughput
+
+
+def measure(
+    benchmark: Benchmark,
+    scale: str,
+    repeat: int = 3,
+    seed: int = 0,
+    reference: float | None = None,
+) -> Result:
+    """
+    runs the benchmark repeat times and returns its best time, peak memory
+    is measured in a separate run because tracing slows down allocations.
+    The reference throughput is measured when it is not given.
+    """
+    if reference is None:
+        reference = reference_throughput(repeat)
+
+    # algorithms without a seed draw it from the default generator.
+    rng.seed(seed)
+    run = benchmark.setup(SCALES[scale])
+
+    tracemalloc.start()
+    try:
+        run()
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    seconds = float("inf")
+    units = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        units = run()
+        seconds = min(seconds, time.perf_counter() - start)
+
+    return Result(
+        name=benchmark.name,
+        scale=scale,
+        units=units,
+        unit=benchmark.unit,
+        seconds=seconds,
+        peak_memory=peak_memory,
+        reference=reference,
+    )
+
+
+def save(results: list[Result], path: str | pathlib.Path) -> None:
+    pathlib.Path(path).write_text(
+        json.dumps([dataclasses.asdict(result) for result in results], indent=2) + "\n",
+        encoding="utf-8",
+    )
+
+
+def load(path: str | pathlib.Path) -> list[Result]:
+    return [
+        Result(**result)
+        for result in json.loads(pathlib.Path(path).read_text(encoding="utf-8"))
+    ]
+
+
+def compare(
+    results: list[Result],
+    baseline: list[Result],
+) -> dict[tuple[str, str], float]:
+    """
+    returns relative throughput of each result to the one of the baseline
+    (e.g. 2 is twice faster) for the benchmarks that are in both of them.
+    Throughputs are relative to the reference workload of each run,
+    so the baseline can come from another machine.
+    """
+    throughputs = {(b.name, b.scale): b.relative for b in baseline}
+    return {
+        (r.name, r.scale): r.relative / throughputs[r.name, r.scale]
+        for r in results
+        if (r.name, r.scale) in throughputs
+    }
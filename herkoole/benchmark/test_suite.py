@@ -0,0 +1,40 @@
+import dataclasses
+import pathlib
+
+import numpy as np
+
+from .instances import knapsack_instance, tsp_instance
+from .suite import BENCHMARKS, compare, load, measure, save
+
+
+def test_instances() -> None:
+    k1, k2 = knapsack_instance(30, seed=1), knapsack_instance(30, seed=1)
+    assert np.array_equal(k1.weights, k2.weights)
+    assert np.array_equal(k1.values, k2.values)
+    assert k1.max_weight == k2.max_weight
+
+    t = tsp_instance(20, seed=1)
+    assert t.length == 20
+    assert [c.x for c in t.cities] == [c.x for c in tsp_instance(20, seed=1).cities]
+
+
+def test_suite(tmp_path: pathlib.Path) -> None:
+    results = [
+        measure(benchmark, "tiny", repeat=1, reference=1e6) for benchmark in BENCHMARKS
+    ]
+    for result in results:
+        assert result.units > 0
+        assert result.throughput > 0
+        assert result.relative == result.throughput / 1e6
+
+    save(results, tmp_path / "baseline.json")
+    ratios = compare(results, load(tmp_path / "baseline.json"))
+    assert len(ratios) == len(BENCHMARKS)
+    assert all(np.isclose(ratio, 1) for ratio in ratios.values())
+
+    # a twice faster machine (e.g. the one of the baseline) is not a speedup.
+    faster = [
+        dataclasses.replace(r, seconds=r.seconds / 2, reference=2 * r.reference)
+        for r in results
+    ]
+    assert all(np.isclose(ratio, 1) for ratio in compare(results, faster).values())
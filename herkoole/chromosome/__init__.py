@@ -1 +1,3 @@
+from .bits import Bits as Bits
 from .chromosome import Chromosome as Chromosome
+from .chromosome import genome_key as genome_key
@@ -0,0 +1,168 @@
+"""
+Packed representation of binary genomes. Genes are stored as bits of
+a byte array (eight genes per byte) instead of a list of python booleans,
+which needs eight bytes (a pointer) per gene.
+"""
+
+from __future__ import annotations
+
+import collections.abc
+import typing
+
+import numpy as np
+import numpy.typing as npt
+
+from herkoole.rng import generator
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+
+class Bits(collections.abc.MutableSequence[bool]):
+    """
+    Bits is a fixed length sequence of booleans. Gene i is the bit (i % 8)
+    of byte (i // 8), and the unused bits of the last byte are always zero,
+    so genomes with the same genes have the same bytes.
+    """
+
+    __slots__ = ("data", "length")
+
+    def __init__(self, data: npt.NDArray[np.uint8], length: int) -> None:
+        self.data = data
+        self.length = length
+
+    @classmethod
+    def pack(cls, genes: npt.ArrayLike) -> Bits:
+        genes = np.asarray(genes, dtype=np.bool_)
+        return cls(np.packbits(genes, bitorder="little"), len(genes))
+
+    @classmethod
+    def zeros(cls, length: int) -> Bits:
+        return cls(np.zeros((length + 7) // 8, dtype=np.uint8), length)
+
+    @classmethod
+    def random(cls, length: int, rng: np.random.Generator | None = None) -> Bits:
+        """
+        returns length random genes, they are drawn together
+        as random bytes.
+        """
+        data = generator(rng).integers(0, 256, size=(length + 7) // 8, dtype=np.uint8)
+        if length % 8 != 0:
+            data[-1] &= (1 << (length % 8)) - 1
+        return cls(data, length)
+
+    @classmethod
+    def splice(cls, head: Bits, tail: Bits, cut: int) -> Bits:
+        """
+        returns genes before the cut point from head and the rest from tail
+        (one point crossover). Whole bytes are copied and only the byte which
+        contains the cut point is masked.
+        """
+        byte, bit = divmod(cut, 8)
+
+        data = tail.data.copy()
+        data[:byte] = head.data[:byte]
+        if bit:
+            mask = (1 << bit) - 1
+            data[byte] = (head.data[byte] & mask) | (tail.data[byte] & (0xFF ^ mask))
+
+        return cls(data, tail.length)
+
+    def unpack(self) -> npt.NDArray[np.bool_]:
+        return np.unpackbits(self.data, count=self.length, bitorder="little").view(
+            np.bool_,
+        )
+
+    def take(self, positions: npt.NDArray[np.intp]) -> npt.NDArray[np.bool_]:
+        """
+        returns genes on the given positions without unpacking the others.
+        """
+        return (self.data[positions >> 3] >> (positions & 7) & 1).astype(np.bool_)
+
+    def flip(self, index: int) -> bool:
+        """
+        inverts the gene on the given index and returns its previous value.
+        """
+        previous = self[index]
+        self.data[index >> 3] ^= 1 << (index & 7)
+        return previous
+
+    def copy(self) -> Bits:
+        return type(self)(self.data.copy(), self.length)
+
+    def __array__(
+        self,
+        dtype: npt.DTypeLike = None,
+        copy: bool | None = None,  # noqa: FBT001
+    ) -> npt.NDArray[typing.Any]:
+        genes = self.unpack()
+        return genes if dtype is None else genes.astype(dtype)
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __iter__(self) -> Iterator[bool]:
+        return iter(self.unpack().tolist())
+
+    def __repr__(self) -> str:
+        return f"Bits({''.join('1' if gene else '0' for gene in self)})"
+
+    def __eq__(self, o: object) -> bool:
+        if isinstance(o, Bits):
+            return self.length == o.length and np.array_equal(self.data, o.data)
+        if isinstance(o, collections.abc.Sequence):
+            return list(self) == list(o)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def _index(self, index: int) -> int:
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            msg = "bits index out of range"
+            raise IndexError(msg)
+        return index
+
+    @typing.overload
+    def __getitem__(self, index: int) -> bool: ...
+
+    @typing.overload
+    def __getitem__(self, index: slice) -> Bits: ...
+
+    def __getitem__(self, index: int | slice) -> bool | Bits:
+        if isinstance(index, slice):
+            return Bits.pack(self.unpack()[index])
+
+        index = self._index(index)
+        return bool(self.data[index >> 3] >> (index & 7) & 1)
+
+    @typing.overload
+    def __setitem__(self, index: int, value: bool) -> None: ...
+
+    @typing.overload
+    def __setitem__(self, index: slice, value: Iterable[bool]) -> None: ...
+
+    def __setitem__(self, index: int | slice, value: typing.Any) -> None:
+        if isinstance(index, slice):
+            genes = self.unpack()
+            # genomes have a fixed length, so numpy rejects a value
+            # with a different size.
+            genes[index] = np.asarray(
+                value if isinstance(value, Bits | np.ndarray) else list(value),
+                dtype=np.bool_,
+            )
+            self.data = np.packbits(genes, bitorder="little")
+            return
+
+        index = self._index(index)
+        if self[index] != bool(value):
+            self.data[index >> 3] ^= 1 << (index & 7)
+
+    def __delitem__(self, index: int | slice) -> None:
+        msg = "bits have a fixed length"
+        raise TypeError(msg)
+
+    def insert(self, index: int, value: bool) -> None:  # noqa: ARG002, FBT001
+        msg = "bits have a fixed length"
+        raise TypeError(msg)
@@ -1,16 +1,46 @@
 from __future__ import annotations
 
 import abc
+import asyncio
+import hashlib
 import typing
 
+import numpy as np
+import numpy.typing as npt
+
+
+def genome_key(genome: npt.NDArray[typing.Any]) -> bytes:
+    """
+    returns a hash of the genes that identifies
+    the same genomes between different chromosomes.
+    """
+    return hashlib.blake2b(genome.tobytes(), digest_size=16).digest()
+
 
 class Chromosome[T](abc.ABC):
     """
     Abstract Chromosome class that must be extended for each problem.
+
+    Fitness is memoized, so chromosomes must call `update` (or
+    `invalidate`) whenever they change their genes (e.g. in `mutate`).
+
+    Chromosomes can support delta evaluation by keeping an aggregate
+    `state` (e.g. tour length) in `evaluate` and implementing `delta`,
+    then changing a few genes costs O(changed genes) instead of
+    evaluating the whole chromosome again.
+
+    Chromosomes use __slots__, so subclasses must declare
+    their attributes in __slots__ too.
     """
 
+    __slots__ = ("cached_fitness", "genes", "state")
+
     def __init__(self) -> None:
         self.genes: typing.MutableSequence[T] = []
+        self.cached_fitness: float | None = None
+        # aggregate state of the genes for delta evaluation, it is None
+        # when the chromosome does not have a valid state.
+        self.state: typing.Any = None
 
     def __iter__(self) -> typing.Iterator[T]:
         return self.genes.__iter__()
@@ -20,12 +50,131 @@ class Chromosome[T](abc.ABC):
             return o.genes == self.genes
         return False
 
-    @abc.abstractmethod
     def fitness(self) -> float:
+        if self.cached_fitness is None:
+            self.cached_fitness = self.evaluate()
+        return self.cached_fitness
+
+    async def fitness_async(self) -> float:
+        if self.cached_fitness is None:
+            self.cached_fitness = await self.evaluate_async()
+        return self.cached_fitness
+
+    async def evaluate_async(self) -> float:
+        """
+        evaluates the chromosome without blocking the event loop, e.g. by
+        calling a simulation service. By default it calls evaluate.
+        """
+        return self.evaluate()
+
+    @classmethod
+    async def evaluate_batch_async(
+        cls,
+        chromosomes: typing.Sequence[Chromosome],
+    ) -> list[float]:
+        """
+        evaluates chromosomes together, chromosomes which their service
+        accepts batches override it to send one request per batch.
+        By default chromosomes are evaluated concurrently.
+        """
+        return list(
+            await asyncio.gather(
+                *(chromosome.evaluate_async() for chromosome in chromosomes),
+            ),
+        )
+
+    def invalidate(self) -> None:
+        """
+        drops the memoized fitness after genes are changed.
+        """
+        self.cached_fitness = None
+        self.state = None
+
+    def assign(self, genome: npt.NDArray[typing.Any]) -> None:
+        """
+        replaces genes with the given genome array.
+        """
+        self.genes[:] = genome.tolist()
+        self.invalidate()
+
+    def update(
+        self,
+        positions: typing.Sequence[int],
+        previous: typing.Sequence[T],
+    ) -> None:
+        """
+        updates fitness after genes on the given positions are changed,
+        previous contains their values before the change.
+        """
+        if self.state is None:
+            self.invalidate()
+            return
+
+        fitness = self.delta(
+            np.asarray(positions, dtype=np.intp),
+            np.asarray(previous),
+        )
+        if fitness is None:
+            self.invalidate()
+        else:
+            self.cached_fitness = fitness
+
+    def derive(self, *parents: Chromosome) -> None:
+        """
+        derives fitness of a new chromosome from the parent which has
+        a valid state and the least different genes.
+        """
+        genes = np.asarray(self.genes)
+
+        best: tuple[Chromosome, npt.NDArray[np.intp]] | None = None
+        for parent in parents:
+            if parent.state is None or len(parent.genes) != len(genes):
+                continue
+            positions = np.flatnonzero(genes != np.asarray(parent.genes))
+            if best is None or len(positions) < len(best[1]):
+                best = (parent, positions)
+
+        if best is None:
+            self.invalidate()
+            return
+
+        parent, positions = best
+        self.state = parent.state
+        self.cached_fitness = parent.cached_fitness
+        self.update(positions, np.asarray(parent.genes)[positions])
+
+    def delta(
+        self,
+        positions: npt.NDArray[np.intp],
+        previous: npt.NDArray[typing.Any],
+    ) -> float | None:
+        """
+        updates the state after genes on the given positions are changed
+        from previous values and returns the new fitness. Chromosomes
+        without delta evaluation return None to be evaluated again.
+        """
+        del positions, previous
+        return None
+
+    def key(self) -> bytes:
+        return genome_key(np.asarray(self.genes))
+
+    def fingerprint(self) -> bytes:
+        """
+        returns a hash which is the same for the equivalent genomes
+        (e.g. rotations of a tour), it is the genome hash by default.
+        """
+        return self.key()
+
+    @abc.abstractmethod
+    def evaluate(self) -> float:
+        """
+        calculates fitness of the chromosome.
+        """
         raise NotImplementedError
 
     @abc.abstractmethod
-    def mutate(self, prob: float) -> None:
+    def mutate(self, prob: float, rng: np.random.Generator | None = None) -> None:
         raise NotImplementedError
 
     @classmethod
@@ -35,5 +184,6 @@ class Chromosome[T](abc.ABC):
         parent1: Chromosome,
         parent2: Chromosome,
         prob: float,
+        rng: np.random.Generator | None = None,
     ) -> tuple[Chromosome, Chromosome]:
         raise NotImplementedError
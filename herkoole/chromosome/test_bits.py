@@ -0,0 +1,38 @@
+import numpy as np
+
+from .bits import Bits
+
+
+def test_pack() -> None:
+    genes = np.array([True, False, True, True, False, False, True, False, True, True])
+
+    bits = Bits.pack(genes)
+    assert len(bits) == len(genes)
+    assert len(bits.data) == 2
+    assert bits.unpack().tolist() == genes.tolist()
+    assert list(bits) == genes.tolist()
+    assert bits == genes.tolist()
+
+    assert bits.flip(1) is False
+    assert bits[1] is True
+    bits[1] = False
+    assert bits == Bits.pack(genes)
+    assert bits.take(np.array([0, 1, 9])).tolist() == [True, False, True]
+
+    bits[:] = ~genes
+    assert bits.unpack().tolist() == (~genes).tolist()
+
+
+def test_splice() -> None:
+    head = Bits.pack(np.ones(21, dtype=np.bool_))
+    tail = Bits.zeros(21)
+
+    for cut in range(22):
+        child = Bits.splice(head, tail, cut)
+        assert child.unpack().tolist() == [True] * cut + [False] * (21 - cut)
+        # unused bits of the last byte are zero.
+        assert child == Bits.pack(child.unpack())
+
+    bits = Bits.random(21)
+    assert len(bits) == 21
+    assert bits == Bits.pack(bits.unpack())
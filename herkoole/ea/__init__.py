@@ -1,3 +1,53 @@
+from .asynchronous import AsyncEvaluator as AsyncEvaluator
+from .asynchronous import AsyncEvolutionaryAlgorithm as AsyncEvolutionaryAlgorithm
+from .cache import FitnessCache as FitnessCache
+from .checkpoint import Checkpoint as Checkpoint
+from .checkpoint import load_checkpoint as load_checkpoint
+from .checkpoint import save_checkpoint as save_checkpoint
+from .diversity import DuplicateIndex as DuplicateIndex
+from .evaluator import Evaluator as Evaluator
+from .evaluator import ProcessPoolEvaluator as ProcessPoolEvaluator
+from .evaluator import SerialEvaluator as SerialEvaluator
+from .evaluator import ThreadPoolEvaluator as ThreadPoolEvaluator
 from .evolutionary_algorithm import EvolutionaryAlgorithm as EvolutionaryAlgorithm
+from .functions import CommaSelection as CommaSelection
+from .functions import Elitism as Elitism
 from .functions import QTournament as QTournament
+from .functions import RankSelection as RankSelection
+from .functions import RouletteWheel as RouletteWheel
 from .functions import StochasticUniversalSampling as StochasticUniversalSampling
+from .functions import TournamentSelection as TournamentSelection
+from .functions import Truncation as Truncation
+from .island import FullyConnected as FullyConnected
+from .island import IslandModel as IslandModel
+from .island import MigrationPolicy as MigrationPolicy
+from .island import RandomTopology as RandomTopology
+from .island import Ring as Ring
+from .mutation import BitFlip as BitFlip
+from .mutation import Insert as Insert
+from .mutation import Inversion as Inversion
+from .mutation import Mutation as Mutation
+from .mutation import OneFifthRule as OneFifthRule
+from .mutation import Scramble as Scramble
+from .mutation import Swap as Swap
+from .observer import CSVWriter as CSVWriter
+from .observer import GenerationStatistics as GenerationStatistics
+from .observer import History as History
+from .observer import JSONLinesWriter as JSONLinesWriter
+from .observer import Observer as Observer
+from .steady_state import Replacement as Replacement
+from .steady_state import ReplaceTournamentLoser as ReplaceTournamentLoser
+from .steady_state import ReplaceWorst as ReplaceWorst
+from .steady_state import (
+    SteadyStateEvolutionaryAlgorithm as SteadyStateEvolutionaryAlgorithm,
+)
+from .stopping import AllOf as AllOf
+from .stopping import AnyOf as AnyOf
+from .stopping import DiversityCollapse as DiversityCollapse
+from .stopping import EvaluationBudget as EvaluationBudget
+from .stopping import FitnessVariance as FitnessVariance
+from .stopping import MaxGenerations as MaxGenerations
+from .stopping import Stagnation as Stagnation
+from .stopping import StoppingCriterion as StoppingCriterion
+from .stopping import TargetFitness as TargetFitness
+from .stopping import TimeBudget as TimeBudget
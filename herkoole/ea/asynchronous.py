@@ -0,0 +1,169 @@
+"""
+Asynchronous evolutionary algorithm for the problems which their fitness
+is calculated by an I/O bound service (e.g. a simulation server), each
+generation is evaluated concurrently instead of one request at a time.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import typing
+
+import numpy as np
+import numpy.typing as npt
+
+from .evolutionary_algorithm import EvolutionaryAlgorithm
+
+if typing.TYPE_CHECKING:
+    from herkoole.chromosome import Chromosome
+    from herkoole.population import Population
+
+
+class AsyncEvaluator:
+    """
+    AsyncEvaluator evaluates chromosomes using their async fitness protocol.
+    Chromosomes are grouped into batches of batch_size (one request
+    for each batch), at most concurrency batches are in flight and each
+    of them must finish in timeout seconds otherwise TimeoutError is raised.
+    """
+
+    def __init__(
+        self,
+        ea: EvolutionaryAlgorithm,
+        concurrency: int = 16,
+        timeout: float | None = None,
+        batch_size: int = 1,
+    ) -> None:
+        if concurrency <= 0 or batch_size <= 0:
+            msg = "concurrency and batch size must be positive numbers"
+            raise ValueError(msg)
+        self.ea = ea
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.batch_size = batch_size
+
+    async def __call__(
+        self,
+        population: Population,
+        indices: npt.NDArray[np.intp],
+    ) -> npt.NDArray[np.float64]:
+        return await self.evaluate(population, indices)
+
+    @classmethod
+    def new(
+        cls,
+        *args,  # noqa: ANN002
+        **kwargs,  # noqa: ANN003
+    ) -> typing.Callable[[EvolutionaryAlgorithm], AsyncEvaluator]:
+        def _new(ea: EvolutionaryAlgorithm) -> AsyncEvaluator:
+            return cls(ea, *args, **kwargs)
+
+        return _new
+
+    async def evaluate(
+        self,
+        population: Population,
+        indices: npt.NDArray[np.intp],
+    ) -> npt.NDArray[np.float64]:
+        chromosomes = [population[i] for i in indices]
+        if len(chromosomes) == 0:
+            return np.empty(0)
+
+        # semaphore belongs to the running event loop, so it is
+        # created for each call.
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def _evaluate(batch: list[Chromosome]) -> list[float]:
+            async with semaphore:
+                return await asyncio.wait_for(
+                    type(batch[0]).evaluate_batch_async(batch),
+                    self.timeout,
+                )
+
+        batches = await asyncio.gather(
+            *(
+                _evaluate(list(batch))
+                for batch in itertools.batched(chromosomes, self.batch_size)
+            ),
+        )
+
+        return np.fromiter(
+            itertools.chain.from_iterable(batches),
+            dtype=np.float64,
+            count=len(chromosomes),
+        )
+
+
+class AsyncEvolutionaryAlgorithm(EvolutionaryAlgorithm):
+    """
+    AsyncEvolutionaryAlgorithm awaits evaluation of the population and
+    the children, other phases are the same as EvolutionaryAlgorithm.
+    """
+
+    def __init__(
+        self,
+        *args,  # noqa: ANN002
+        async_evaluator: typing.Callable[[EvolutionaryAlgorithm], AsyncEvaluator]
+        | None = None,
+        **kwargs,  # noqa: ANN003
+    ) -> None:
+        super().__init__(*args, **kwargs)
+
+        if async_evaluator is None:
+            async_evaluator = AsyncEvaluator.new()
+        self.async_evaluator = async_evaluator(self)
+
+    def run(self) -> Chromosome:
+        """
+        runs the algorithm in a new event loop.
+        """
+        return asyncio.run(self.run_async())
+
+    async def run_async(self) -> Chromosome:
+        try:
+            while True:
+                await self.step_async()
+
+                if self.stop_condition():
+                    break
+
+            answer = self.finish_run()
+        finally:
+            self.close()
+
+        return answer
+
+    async def step_async(self) -> None:
+        """
+        evolves the population for one generation. children are evaluated
+        before the survivor selection, so it only reads memoized fitness.
+        """
+        evaluations = self.start_generation()
+        fitnesses = await self.fitness_async(self.population)
+        population = self.population
+        self.record(fitnesses)
+
+        parents = self.parent_selection()
+        children = self.new_children(parents)
+        children_fitnesses = await self.fitness_async(children)
+        if self.mutation is not None:
+            self.mutation.adapt(fitnesses, children_fitnesses)
+        self.population = self.remaining_population_selection(
+            self.population,
+            children,
+        )
+
+        self.finish_generation(population, fitnesses, evaluations)
+
+    async def fitness_async(self, population: Population) -> npt.NDArray[np.float64]:
+        with self.phase("evaluation"):
+            evaluations = self.fitness_cache.misses
+            fitnesses = await population.fitness_async(
+                self.fitness_cache,
+                self.async_evaluator,
+            )
+
+        self.evaluated(population, fitnesses, evaluations)
+
+        return fitnesses
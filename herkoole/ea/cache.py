@@ -0,0 +1,58 @@
+"""
+Fitness cache that is shared between the chromosomes of a run.
+"""
+
+from __future__ import annotations
+
+import collections
+
+
+class FitnessCache:
+    """
+    FitnessCache stores fitness of the last `maxsize` genomes (LRU)
+    using their hash, so the same genomes, e.g. the ones that are created
+    by crossover of similar parents, are not evaluated again.
+    Setting maxsize to zero disables the cache but still counts
+    evaluations.
+    """
+
+    def __init__(self, maxsize: int = 0) -> None:
+        self.maxsize = maxsize
+        self.items: collections.OrderedDict[bytes, float] = collections.OrderedDict()
+
+        # fitness values that are memoized in the chromosomes.
+        self.reused = 0
+        # fitness values that are found in the cache.
+        self.hits = 0
+        # fitness values that are actually evaluated.
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def get(self, key: bytes) -> float | None:
+        fitness = self.items.get(key)
+        if fitness is not None:
+            self.items.move_to_end(key)
+        return fitness
+
+    def put(self, key: bytes, fitness: float) -> None:
+        if self.maxsize <= 0:
+            return
+        self.items[key] = fitness
+        self.items.move_to_end(key)
+        if len(self.items) > self.maxsize:
+            self.items.popitem(last=False)
+
+    @property
+    def lookups(self) -> int:
+        return self.reused + self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        ratio of fitness values that are not evaluated.
+        """
+        if self.lookups == 0:
+            return 0.0
+        return (self.reused + self.hits) / self.lookups
@@ -0,0 +1,217 @@
+"""
+Checkpoints store the state of an evolutionary algorithm run into
+a numpy archive (npz), so long runs can be resumed after a crash.
+
+Genomes are stored as raw arrays without compression, so writing
+a checkpoint costs about the same as copying the population. States of
+the algorithm generators (its own and the ones of its components) are
+stored too, so a resumed run continues as the original one. Statistics
+of the stopping criterion (e.g. stagnant generations and elapsed time)
+are stored, its parameters come from the resumed configuration.
+"""
+
+from __future__ import annotations
+
+import json
+import pathlib
+import typing
+
+import numpy as np
+
+from herkoole.population import ArrayPopulation, ChromosomePopulation
+
+from .observer import Observer
+
+if typing.TYPE_CHECKING:
+    import numpy.typing as npt
+
+    from herkoole.chromosome import Chromosome
+    from herkoole.population import Population
+
+    from .evolutionary_algorithm import EvolutionaryAlgorithm
+    from .observer import GenerationStatistics
+
+# components which their scalar parameters are stored in checkpoints.
+COMPONENTS = (
+    "parent_selector",
+    "remaining_population_selector",
+    "post_variation",
+    "mutation",
+    "replacement",
+)
+
+
+def _genomes(
+    ea: EvolutionaryAlgorithm, population: Population
+) -> npt.NDArray[typing.Any]:
+    if isinstance(population, ArrayPopulation):
+        return population.genomes
+    return ea.model.encode(list(population))
+
+
+def _parameters(component: object) -> dict[str, typing.Any]:
+    return {
+        "type": type(component).__qualname__,
+        "parameters": {
+            name: value
+            for name, value in vars(component).items()
+            if isinstance(value, bool | int | float | str)
+        },
+    }
+
+
+def _generators(ea: EvolutionaryAlgorithm) -> dict[str, np.random.Generator]:
+    """
+    returns generators of the algorithm and its components, components
+    which wrap another one (e.g. elitism) have their inner generator too.
+    """
+    generators = {"ea": ea.rng, "diversity": ea.diversity_rng}
+    for name in COMPONENTS:
+        component = getattr(ea, name, None)
+        if component is None or not hasattr(component, "rng"):
+            continue
+        generators[name] = component.rng
+        for inner, value in vars(component).items():
+            if inner != "ea" and isinstance(
+                getattr(value, "rng", None), np.random.Generator
+            ):
+                generators[f"{name}.{inner}"] = value.rng
+    return generators
+
+
+def _restore_generators(
+    ea: EvolutionaryAlgorithm,
+    states: dict[str, dict[str, typing.Any]],
+) -> None:
+    generators = _generators(ea)
+    for name, state in states.items():
+        if name not in generators:
+            msg = f"{name} of the checkpoint has no generator"
+            raise ValueError(msg)
+        generators[name].bit_generator.state = state
+
+
+def save_checkpoint(ea: EvolutionaryAlgorithm, path: str | pathlib.Path) -> None:
+    """
+    writes the run state into path, the previous checkpoint is
+    replaced atomically after the new one is written completely.
+    """
+    path = pathlib.Path(path)
+    # the criterion is updated (once per generation) before its state is
+    # taken, so the resumed run does not update it again.
+    ea.stopping_criterion.refresh()
+
+    arrays: dict[str, npt.NDArray[typing.Any]] = {
+        "genomes": _genomes(ea, ea.population),
+        "fitness": ea.population.known_fitness(),
+        "average_fitness": np.asarray(ea.average_fitness, dtype=np.float64),
+    }
+    if ea.best_chromosome is not None:
+        arrays["best_genome"] = ea.model.encode([ea.best_chromosome])[0]
+
+    metadata = {
+        "generation": ea.generation_counter,
+        "best_fitness": ea.best_chromosome_fitness_in_total,
+        "generators": {
+            name: generator.bit_generator.state
+            for name, generator in _generators(ea).items()
+        },
+        "fitness_cache": {
+            "reused": ea.fitness_cache.reused,
+            "hits": ea.fitness_cache.hits,
+            "misses": ea.fitness_cache.misses,
+        },
+        "stopping_criterion": {
+            "type": type(ea.stopping_criterion).__qualname__,
+            "state": ea.stopping_criterion.state(),
+        },
+        "components": {
+            name: _parameters(component)
+            for name in COMPONENTS
+            if (component := getattr(ea, name, None)) is not None
+        },
+    }
+
+    temporary = path.with_name(f"{path.name}.tmp")
+    with temporary.open("wb") as f:
+        np.savez(f, metadata=np.asarray(json.dumps(metadata)), **arrays)
+    temporary.replace(path)
+
+
+def load_checkpoint(ea: EvolutionaryAlgorithm, path: str | pathlib.Path) -> None:
+    """
+    restores the run state from path into an evolutionary algorithm
+    which is created with the same problem and configuration.
+    """
+    with np.load(pathlib.Path(path), allow_pickle=False) as checkpoint:
+        metadata = json.loads(str(checkpoint["metadata"]))
+
+        genomes = checkpoint["genomes"].astype(ea.model.genome_dtype)
+        fitness = checkpoint["fitness"]
+        if isinstance(ea.population, ArrayPopulation):
+            ea.population = ArrayPopulation(ea.model, genomes, fitness)
+        else:
+            chromosomes = []
+            for genome, f in zip(genomes, fitness, strict=True):
+                chromosome = ea.model.decode(genome)
+                if not np.isnan(f):
+                    chromosome.cached_fitness = float(f)
+                chromosomes.append(chromosome)
+            ea.population = ChromosomePopulation(chromosomes)
+
+        ea.average_fitness = checkpoint["average_fitness"].tolist()
+
+        if "best_genome" in checkpoint:
+            best = ea.model.decode(
+                checkpoint["best_genome"].astype(ea.model.genome_dtype),
+            )
+            best.cached_fitness = metadata["best_fitness"]
+            ea.best_chromosome = best
+            ea.best_chromosome_fitness_in_total = metadata["best_fitness"]
+
+    _restore_generators(ea, metadata["generators"])
+
+    ea.generation_counter = metadata["generation"]
+    for name, count in metadata["fitness_cache"].items():
+        setattr(ea.fitness_cache, name, count)
+
+    stored = metadata["stopping_criterion"]
+    if type(ea.stopping_criterion).__qualname__ != stored["type"]:
+        msg = f"stopping criterion of the checkpoint is {stored['type']}"
+        raise ValueError(msg)
+    ea.stopping_criterion.restore(stored["state"])
+
+    for name, stored in metadata["components"].items():
+        component = getattr(ea, name, None)
+        if component is None or type(component).__qualname__ != stored["type"]:
+            msg = f"{name} of the checkpoint is {stored['type']}"
+            raise ValueError(msg)
+        for parameter, value in stored["parameters"].items():
+            setattr(component, parameter, value)
+
+
+class Checkpoint(Observer):
+    """
+    Checkpoint saves the run state every interval generations
+    and at the end of the run.
+    """
+
+    def __init__(
+        self,
+        ea: EvolutionaryAlgorithm,
+        path: str | pathlib.Path,
+        interval: int = 10,
+    ) -> None:
+        if interval <= 0:
+            msg = "checkpoint interval must be a positive number"
+            raise ValueError(msg)
+        self.path = pathlib.Path(path)
+        self.interval = interval
+        super().__init__(ea)
+
+    def generation_end(self, statistics: GenerationStatistics) -> None:  # noqa: ARG002
+        if self.ea.generation_counter % self.interval == 0:
+            save_checkpoint(self.ea, self.path)
+
+    def run_end(self, answer: Chromosome) -> None:  # noqa: ARG002
+        save_checkpoint(self.ea, self.path)
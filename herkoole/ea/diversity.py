@@ -0,0 +1,125 @@
+"""
+Diversity of the population based on genome fingerprints (hashes which
+are the same for the equivalent genomes). Duplicates are found with a
+hash index in O(1) per chromosome, and distance between chromosomes is
+estimated on a few sampled pairs instead of all of them.
+"""
+
+from __future__ import annotations
+
+import collections
+import typing
+
+import numpy as np
+
+from herkoole.population import ArrayPopulation
+
+if typing.TYPE_CHECKING:
+    import numpy.typing as npt
+
+    from herkoole.model import Model
+    from herkoole.population import Population
+
+
+class DuplicateIndex:
+    """
+    DuplicateIndex counts fingerprints of the chromosomes in a population,
+    so a new chromosome is rejected when it is already in the population.
+    """
+
+    def __init__(self, fingerprints: typing.Iterable[bytes] = ()) -> None:
+        self.counts: collections.Counter[bytes] = collections.Counter()
+        # number of the rejected chromosomes in the whole run.
+        self.rejected = 0
+        self.reset(fingerprints)
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+    def __contains__(self, fingerprint: bytes) -> bool:
+        return fingerprint in self.counts
+
+    def reset(self, fingerprints: typing.Iterable[bytes]) -> None:
+        self.counts = collections.Counter(fingerprints)
+
+    def add(self, fingerprint: bytes) -> None:
+        self.counts[fingerprint] += 1
+
+    def discard(self, fingerprint: bytes) -> None:
+        if self.counts[fingerprint] <= 1:
+            self.counts.pop(fingerprint, None)
+        else:
+            self.counts[fingerprint] -= 1
+
+    def insert(self, fingerprint: bytes) -> bool:
+        """
+        adds the fingerprint when it is not in the index and
+        returns whether it is added.
+        """
+        if fingerprint in self.counts:
+            self.rejected += 1
+            return False
+        self.counts[fingerprint] = 1
+        return True
+
+    def unique(self, fingerprints: typing.Iterable[bytes]) -> npt.NDArray[np.intp]:
+        """
+        inserts the fingerprints in order and returns indices
+        of the ones which are not duplicates.
+        """
+        return np.array(
+            [
+                i
+                for i, fingerprint in enumerate(fingerprints)
+                if self.insert(fingerprint)
+            ],
+            dtype=np.intp,
+        )
+
+
+def unique_ratio(fingerprints: typing.Sequence[bytes]) -> float:
+    """
+    returns ratio of the distinct fingerprints.
+    """
+    if len(fingerprints) == 0:
+        return 1.0
+    return len(set(fingerprints)) / len(fingerprints)
+
+
+def mean_distance(
+    model: Model,
+    population: Population,
+    rng: np.random.Generator,
+    samples: int = 64,
+) -> float:
+    """
+    returns mean distance (in [0, 1]) of samples random pairs of
+    different chromosomes, e.g. hamming distance for knapsack and
+    edge distance for tsp.
+    """
+    size = len(population)
+    if size < 2:  # noqa: PLR2004
+        return 0.0
+
+    first = rng.integers(size, size=samples)
+    second = (first + rng.integers(1, size, size=samples)) % size
+    if isinstance(population, ArrayPopulation):
+        return float(
+            np.mean(
+                model.genome_distance(
+                    population.genomes[first],
+                    population.genomes[second],
+                ),
+            ),
+        )
+
+    # only the sampled chromosomes are encoded.
+    indices, rows = np.unique(np.concatenate((first, second)), return_inverse=True)
+    genomes = np.stack([population.genome(int(i)) for i in indices]).astype(
+        model.genome_dtype,
+    )
+    return float(
+        np.mean(
+            model.genome_distance(genomes[rows[:samples]], genomes[rows[samples:]]),
+        ),
+    )
@@ -0,0 +1,238 @@
+"""
+Evaluators calculate the fitness of chromosomes which have not
+been evaluated yet, either serially or in chunks on a worker pool.
+"""
+
+from __future__ import annotations
+
+import abc
+import concurrent.futures
+import os
+import typing
+
+import numpy as np
+import numpy.typing as npt
+
+from herkoole.population import ArrayPopulation, Population
+
+if typing.TYPE_CHECKING:
+    from herkoole.chromosome import Chromosome
+    from herkoole.model import Model
+
+    from .evolutionary_algorithm import EvolutionaryAlgorithm
+
+
+class Evaluator(abc.ABC):
+    """
+    With Evaluator you can customize how the evolutionary
+    algorithm evaluates fitness of its chromosomes.
+    """
+
+    def __init__(self, ea: EvolutionaryAlgorithm) -> None:
+        self.ea = ea
+
+    def __call__(
+        self,
+        population: Population,
+        indices: npt.NDArray[np.intp],
+    ) -> npt.NDArray[np.float64]:
+        return self.evaluate(population, indices)
+
+    @classmethod
+    def new(
+        cls,
+        *args,  # noqa: ANN002
+        **kwargs,  # noqa: ANN003
+    ) -> typing.Callable[[EvolutionaryAlgorithm], Evaluator]:
+        def _new(ea: EvolutionaryAlgorithm) -> Evaluator:
+            return cls(ea, *args, **kwargs)
+
+        return _new
+
+    @abc.abstractmethod
+    def evaluate(
+        self,
+        population: Population,
+        indices: npt.NDArray[np.intp],
+    ) -> npt.NDArray[np.float64]:
+        """
+        returns fitness of the chromosomes on the given indices.
+        """
+
+    def close(self) -> None:  # noqa: B027
+        """
+        releases resources (e.g. workers) of the evaluator.
+        """
+
+
+class SerialEvaluator(Evaluator):
+    def evaluate(
+        self,
+        population: Population,
+        indices: npt.NDArray[np.intp],
+    ) -> npt.NDArray[np.float64]:
+        return population.evaluate(indices)
+
+
+class PoolEvaluator(Evaluator):
+    """
+    PoolEvaluator splits chromosomes into chunks and scores each chunk on
+    a worker. Chunks of an array population are genome matrices which are
+    scored with the model batch fitness, other chromosomes are scored with
+    their own fitness.
+    """
+
+    def __init__(
+        self,
+        ea: EvolutionaryAlgorithm,
+        workers: int | None = None,
+        chunk_size: int | None = None,
+    ) -> None:
+        self.workers = workers or os.cpu_count() or 1
+        # by default each worker receives a few chunks to balance the load.
+        self.chunk_size = chunk_size
+        self.executor: concurrent.futures.Executor | None = None
+        super().__init__(ea)
+
+    @abc.abstractmethod
+    def executor_factory(self) -> concurrent.futures.Executor:
+        pass
+
+    @abc.abstractmethod
+    def task(
+        self,
+    ) -> typing.Callable[[npt.NDArray[typing.Any]], npt.NDArray[np.float64]]:
+        """
+        returns a function which scores a chunk on a worker.
+        """
+
+    def chromosome_chunk(
+        self,
+        population: Population,
+        chunk: npt.NDArray[np.intp],
+    ) -> typing.Any:  # noqa: ANN401
+        """
+        returns the chromosomes on the given indices as they are sent
+        to a worker, workers of the same process share the chromosomes.
+        """
+        return [population[i] for i in chunk]
+
+    def chromosome_task(self) -> typing.Callable[..., npt.NDArray[np.float64]]:
+        """
+        returns a function which scores a chromosome chunk on a worker.
+        """
+        return _evaluate_chromosomes
+
+    def evaluate(
+        self,
+        population: Population,
+        indices: npt.NDArray[np.intp],
+    ) -> npt.NDArray[np.float64]:
+        if len(indices) == 0:
+            return np.empty(0)
+
+        if self.executor is None:
+            self.executor = self.executor_factory()
+
+        chunk_size = self.chunk_size or -(-len(indices) // (self.workers * 4))
+        chunks = [
+            indices[start : start + chunk_size]
+            for start in range(0, len(indices), chunk_size)
+        ]
+
+        if isinstance(population, ArrayPopulation):
+            scores = self.executor.map(
+                self.task(),
+                [population.genomes[chunk] for chunk in chunks],
+            )
+        else:
+            scores = self.executor.map(
+                self.chromosome_task(),
+                [self.chromosome_chunk(population, chunk) for chunk in chunks],
+            )
+
+        return np.concatenate(list(scores))
+
+    def close(self) -> None:
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+
+class ThreadPoolEvaluator(PoolEvaluator):
+    """
+    ThreadPoolEvaluator is useful when fitness releases the GIL,
+    e.g. numpy operations or calling an external simulation.
+    """
+
+    def executor_factory(self) -> concurrent.futures.Executor:
+        return concurrent.futures.ThreadPoolExecutor(self.workers)
+
+    def task(
+        self,
+    ) -> typing.Callable[[npt.NDArray[typing.Any]], npt.NDArray[np.float64]]:
+        return self.ea.model.batch_fitness
+
+
+def _evaluate_chromosomes(chromosomes: list[Chromosome]) -> npt.NDArray[np.float64]:
+    return np.fromiter(
+        (chromosome.fitness() for chromosome in chromosomes),
+        dtype=np.float64,
+        count=len(chromosomes),
+    )
+
+
+# model of the process pool worker, it is shipped once
+# when the worker starts instead of pickling it with every chunk.
+_worker_model: Model | None = None
+
+
+def _initialize_worker(model: Model) -> None:
+    global _worker_model  # noqa: PLW0603
+    _worker_model = model
+
+
+def _evaluate_chunk(genomes: npt.NDArray[typing.Any]) -> npt.NDArray[np.float64]:
+    if _worker_model is None:
+        msg = "worker is not initialized with a model"
+        raise RuntimeError(msg)
+    return _worker_model.batch_fitness(genomes)
+
+
+def _evaluate_genomes(genomes: npt.NDArray[typing.Any]) -> npt.NDArray[np.float64]:
+    if _worker_model is None:
+        msg = "worker is not initialized with a model"
+        raise RuntimeError(msg)
+    return _evaluate_chromosomes([_worker_model.decode(genome) for genome in genomes])
+
+
+class ProcessPoolEvaluator(PoolEvaluator):
+    """
+    ProcessPoolEvaluator evaluates chunks on worker processes. The model
+    is sent to each worker once and then only genome matrices are
+    transferred. Chromosomes are encoded too (instead of pickling them
+    with their model) and workers decode them with the model to
+    score them with their own fitness.
+    """
+
+    def executor_factory(self) -> concurrent.futures.Executor:
+        return concurrent.futures.ProcessPoolExecutor(
+            self.workers,
+            initializer=_initialize_worker,
+            initargs=(self.ea.model,),
+        )
+
+    def task(
+        self,
+    ) -> typing.Callable[[npt.NDArray[typing.Any]], npt.NDArray[np.float64]]:
+        return _evaluate_chunk
+
+    def chromosome_chunk(
+        self,
+        population: Population,
+        chunk: npt.NDArray[np.intp],
+    ) -> npt.NDArray[typing.Any]:
+        return self.ea.model.encode([population[i] for i in chunk])
+
+    def chromosome_task(self) -> typing.Callable[..., npt.NDArray[np.float64]]:
+        return _evaluate_genomes
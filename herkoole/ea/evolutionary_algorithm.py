@@ -5,16 +5,35 @@ Evolutionary algorithm core types and selection algorithms.
 from __future__ import annotations
 
 import abc
+import contextlib
 import logging
-import random
+import time
 import typing
 
 import numpy as np
 import numpy.typing as npt
 
+from herkoole.population import ArrayPopulation, ChromosomePopulation, Population
+from herkoole.rng import sequence
+
+from .cache import FitnessCache
+from .diversity import DuplicateIndex, mean_distance, unique_ratio
+from .evaluator import Evaluator, SerialEvaluator
+from .observer import PHASES, GenerationStatistics
+from .stopping import AnyOf, FitnessVariance, MaxGenerations, StoppingCriterion
+
 if typing.TYPE_CHECKING:
     from herkoole.chromosome import Chromosome
     from herkoole.model import Model
+    from herkoole.rng import Seed
+
+    from .mutation import Mutation
+    from .observer import Observer
+
+
+# random chromosomes are drawn at most this many times to
+# refill a population without duplicates.
+REFILL_ATTEMPTS = 10
 
 
 class NextPopulationSelector(abc.ABC):
@@ -23,14 +42,24 @@ class NextPopulationSelector(abc.ABC):
     algorithm population selection phase.
     """
 
+    # selectors which only keep children set it to false, then the
+    # previous population never fills the place of dropped duplicates.
+    parents_survive = True
+
     def __init__(self, ea: EvolutionaryAlgorithm) -> None:
         self.ea = ea
+        self.rng = ea.spawn()
+        # index of the first child in the items of the current selection,
+        # items before it are the previous population.
+        self.children_start: int | None = None
 
     def __call__(
         self,
-        items: list[Chromosome],
+        items: Population,
         probs: npt.NDArray[np.float64],
-    ) -> list[Chromosome]:
+        children_start: int | None = None,
+    ) -> npt.NDArray[np.intp]:
+        self.children_start = children_start
         return self.select(items, probs)
 
     @classmethod
@@ -54,10 +83,12 @@ class NextPopulationSelector(abc.ABC):
     @abc.abstractmethod
     def select(
         self,
-        items: list[Chromosome],
+        items: Population,
         probs: npt.NDArray[np.float64],
-    ) -> list[Chromosome]:
-        pass
+    ) -> npt.NDArray[np.intp]:
+        """
+        returns indices of the selected items.
+        """
 
 
 class ParentSelector(abc.ABC):
@@ -66,10 +97,15 @@ class ParentSelector(abc.ABC):
     algorithm parent selection phase.
     """
 
+    # selectors which only compare the values set it to false, then they
+    # get fitness values instead of the (normalized) probabilities.
+    normalized = True
+
     def __init__(self, ea: EvolutionaryAlgorithm) -> None:
         self.ea = ea
+        self.rng = ea.spawn()
 
-    def __call__(self, probs: npt.NDArray[np.float64]) -> list[Chromosome]:
+    def __call__(self, probs: npt.NDArray[np.float64]) -> npt.NDArray[np.intp]:
         return self.select(probs)
 
     @classmethod
@@ -84,7 +120,38 @@ class ParentSelector(abc.ABC):
         return _new
 
     @abc.abstractmethod
-    def select(self, probs: npt.NDArray[np.float64]) -> list[Chromosome]:
+    def select(self, probs: npt.NDArray[np.float64]) -> npt.NDArray[np.intp]:
+        """
+        returns indices of the selected parents in the current population.
+        """
+
+
+class PostVariation(abc.ABC):
+    """
+    With PostVariation you can change children after crossover and
+    mutation, e.g. improving them with a local search (memetic algorithm).
+    """
+
+    def __init__(self, ea: EvolutionaryAlgorithm) -> None:
+        self.ea = ea
+        self.rng = ea.spawn()
+
+    def __call__(self, children: Population) -> Population:
+        return self.apply(children)
+
+    @classmethod
+    def new(
+        cls,
+        *args,  # noqa: ANN002
+        **kwargs,  # noqa: ANN003
+    ) -> typing.Callable[[EvolutionaryAlgorithm], PostVariation]:
+        def _new(ea: EvolutionaryAlgorithm) -> PostVariation:
+            return cls(ea, *args, **kwargs)
+
+        return _new
+
+    @abc.abstractmethod
+    def apply(self, children: Population) -> Population:
         pass
 
 
@@ -110,6 +177,22 @@ class EvolutionaryAlgorithm:
         threshold: float = 0.1,
         mutation_propability: float = 0.1,
         crossover_propability: float = 1,
+        *,
+        vectorized: bool = False,
+        fitness_cache_size: int = 0,
+        evaluator: typing.Callable[[EvolutionaryAlgorithm], Evaluator] | None = None,
+        post_variation: typing.Callable[[EvolutionaryAlgorithm], PostVariation]
+        | None = None,
+        mutation: typing.Callable[[EvolutionaryAlgorithm], Mutation] | None = None,
+        observers: list[typing.Callable[[EvolutionaryAlgorithm], Observer]]
+        | None = None,
+        stopping_criterion: typing.Callable[
+            [EvolutionaryAlgorithm],
+            StoppingCriterion,
+        ]
+        | None = None,
+        seed: Seed = None,
+        eliminate_duplicates: bool = False,
     ) -> None:
         # mu (population size)
         self.m = mu
@@ -121,85 +204,432 @@ class EvolutionaryAlgorithm:
         self.threshold = threshold
         self.window_size = window_size
 
-        self.population: list[Chromosome] = model.initial_population(mu)
+        # each component gets its own generator which is spawned from
+        # the seed sequence, so runs with the same seed are the same.
+        self.seed_sequence = sequence(seed)
+        self.rng = self.spawn()
+        # pairs of the diversity statistics are sampled with their own
+        # generator, so observers do not change the run.
+        self.diversity_rng = self.spawn()
+
+        # vectorized populations keep all genomes in one matrix and use
+        # the model batch operations instead of per chromosome calls.
+        self.model = model
+        self.population: Population
+        if vectorized is True:
+            self.population = ArrayPopulation(
+                model,
+                model.initial_genomes(mu, self.rng),
+            )
+        else:
+            self.population = ChromosomePopulation(
+                model.initial_population(mu, self.rng),
+            )
+
+        # fitness values are memoized in each chromosome, the cache also
+        # shares them between the chromosomes with the same genes.
+        self.fitness_cache = FitnessCache(fitness_cache_size)
 
-        self.best_chromosome_fitness_in_total = 0
+        # best chromosome that is seen during the run, it may
+        # not survive in the population.
+        self.best_chromosome: Chromosome | None = None
+        self.best_chromosome_fitness_in_total = float("-inf")
         self.generation_counter = 0
 
+        if evaluator is None:
+            evaluator = SerialEvaluator.new()
+        self.evaluator = evaluator(self)
+
         self.parent_selector = parent_selector(self)
         self.remaining_population_selector = remaining_population_selector(self)
+        self.post_variation = post_variation(self) if post_variation else None
+        # mutation operator replaces mutation of the chromosomes
+        # and its probability.
+        self.mutation = mutation(self) if mutation else None
+        self.observers = [observer(self) for observer in observers or []]
+        # children which are the same as a chromosome of the population
+        # (or another child) are rejected before their evaluation, and
+        # survivors are mu distinct chromosomes.
+        self.eliminate_duplicates = eliminate_duplicates
+        self.duplicates = DuplicateIndex()
+
+        # by default, algorithm stops after max_generation_count generations
+        # or when the average fitness does not change in the window.
+        if stopping_criterion is None:
+            stopping_criterion = AnyOf.new(
+                MaxGenerations.new(max_generation_count),
+                FitnessVariance.new(window_size, threshold),
+            )
+        self.stopping_criterion = stopping_criterion(self)
+
+        # wall time of each phase in the current generation.
+        self.timings: dict[str, float] = dict.fromkeys(PHASES, 0.0)
+        self._nested_time = 0.0
 
         self.mutation_propabiity = mutation_propability
         self.crossover_propability = crossover_propability
 
+    @property
+    def parent_count(self) -> int:
+        """
+        number of the parents which are selected for y children, children
+        are created from pairs of parents so it is even and at least two.
+        """
+        return max(2, self.y + self.y % 2)
+
+    def spawn(self) -> np.random.Generator:
+        """
+        returns a new generator which is independent of the others.
+        """
+        return np.random.default_rng(self.seed_sequence.spawn(1)[0])
+
     def run(self) -> Chromosome:
-        while True:
-            self.average_fitness.append(
-                float(np.average(np.array([p.fitness() for p in self.population]))),
-            )
-            self.logger.info(
-                "Generation %d - %f",
-                self.generation_counter,
-                self.average_fitness[self.generation_counter],
-            )
-            parents = self.parent_selection()
-            children = self.new_children(parents)
-            self.population = self.remaining_population_selection(
-                self.population,
-                children,
+        try:
+            while True:
+                self.step()
+
+                if self.stop_condition():
+                    break
+
+            answer = self.finish_run()
+        finally:
+            self.close()
+
+        return answer
+
+    def finish_run(self) -> Chromosome:
+        """
+        returns the answer after the last generation and notifies observers.
+        """
+        answer = self.get_answer()
+        for observer in self.observers:
+            observer.run_end(answer)
+
+        self.logger.info(
+            "Fitness evaluations: %d, cache hit rate: %.2f%% "
+            "(memoized: %d, cached: %d)",
+            self.fitness_cache.misses,
+            self.fitness_cache.hit_rate * 100,
+            self.fitness_cache.reused,
+            self.fitness_cache.hits,
+        )
+
+        return answer
+
+    def close(self) -> None:
+        """
+        releases the evaluator and observers resources.
+        """
+        try:
+            self.evaluator.close()
+        finally:
+            for observer in self.observers:
+                observer.close()
+
+    def step(self) -> None:
+        """
+        evolves the population for one generation.
+        """
+        evaluations = self.start_generation()
+        fitnesses = self.fitness(self.population)
+        # statistics describe the population at the start of generation.
+        population = self.population
+        self.record(fitnesses)
+
+        parents = self.parent_selection()
+        children = self.new_children(parents)
+        if self.mutation is not None:
+            # children are evaluated before the survivor selection,
+            # so the mutation can adapt to their fitness.
+            self.mutation.adapt(fitnesses, self.fitness(children))
+        self.population = self.remaining_population_selection(
+            self.population,
+            children,
+        )
+
+        self.finish_generation(population, fitnesses, evaluations)
+
+    def start_generation(self) -> int:
+        """
+        resets the generation timings, notifies observers and returns
+        number of the evaluations before the generation.
+        """
+        self.timings = dict.fromkeys(PHASES, 0.0)
+        self._nested_time = 0.0
+        for observer in self.observers:
+            observer.generation_start(self.generation_counter)
+
+        return self.fitness_cache.misses
+
+    def record(self, fitnesses: npt.NDArray[np.float64]) -> None:
+        """
+        records fitness of the population at the start of generation.
+        """
+        self.update_best(self.population, fitnesses)
+        self.average_fitness.append(float(np.average(fitnesses)))
+        self.logger.info(
+            "Generation %d - %f",
+            self.generation_counter,
+            self.average_fitness[self.generation_counter],
+        )
+
+    def finish_generation(
+        self,
+        population: Population,
+        fitnesses: npt.NDArray[np.float64],
+        evaluations: int,
+    ) -> None:
+        statistics = (
+            self.statistics(population, fitnesses, evaluations)
+            if self.observers
+            else None
+        )
+        self.generation_counter += 1
+
+        # observers see the state after the generation, e.g. for checkpoints.
+        if statistics is not None:
+            for observer in self.observers:
+                observer.generation_end(statistics)
+
+    def statistics(
+        self,
+        population: Population,
+        fitnesses: npt.NDArray[np.float64],
+        evaluations: int,
+    ) -> GenerationStatistics:
+        """
+        returns statistics of the current generation, evaluations is
+        number of the evaluations before it.
+        """
+        fingerprints = population.fingerprints(np.arange(len(population)))
+
+        return GenerationStatistics(
+            generation=self.generation_counter,
+            best=float(np.max(fitnesses)),
+            mean=float(np.mean(fitnesses)),
+            std=float(np.std(fitnesses)),
+            diversity=unique_ratio(fingerprints),
+            distance=mean_distance(self.model, population, self.diversity_rng),
+            evaluations=self.fitness_cache.misses - evaluations,
+            total_evaluations=self.fitness_cache.misses,
+            timings=self.timings,
+        )
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> typing.Iterator[None]:
+        """
+        measures wall time of a phase, time of the nested phases
+        (e.g. evaluation during selection) is not counted twice.
+        """
+        nested_time = self._nested_time
+        self._nested_time = 0.0
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.timings[name] = (
+                self.timings.get(name, 0.0) + elapsed - self._nested_time
             )
-            self.generation_counter += 1
+            self._nested_time = nested_time + elapsed
 
-            if self.stop_condition():
-                break
+    def fitness(self, population: Population) -> npt.NDArray[np.float64]:
+        with self.phase("evaluation"):
+            evaluations = self.fitness_cache.misses
+            fitnesses = population.fitness(self.fitness_cache, self.evaluator)
+
+        self.evaluated(population, fitnesses, evaluations)
 
-        return self.get_answer()
+        return fitnesses
+
+    def evaluated(
+        self,
+        population: Population,
+        fitnesses: npt.NDArray[np.float64],
+        evaluations: int,
+    ) -> None:
+        """
+        notifies observers about an evaluation, evaluations is
+        number of the evaluations before it.
+        """
+        for observer in self.observers:
+            observer.evaluation(
+                population,
+                fitnesses,
+                self.fitness_cache.misses - evaluations,
+            )
 
-    def parent_selection(self) -> list[Chromosome]:
-        fitnesses = np.array([p.fitness() for p in self.population])
-        probs = fitnesses / np.sum(fitnesses)
+    def parent_selection(self) -> Population:
+        with self.phase("parent_selection"):
+            fitnesses = self.fitness(self.population)
+            probs = (
+                fitnesses / np.sum(fitnesses)
+                if self.parent_selector.normalized
+                else fitnesses
+            )
 
-        return self.parent_selector(probs)
+            parents = self.population.take(self.parent_selector(probs))
 
-    def new_children(self, parents: list[Chromosome]) -> list[Chromosome]:
-        children: list[Chromosome] = []
+        for observer in self.observers:
+            observer.parent_selection(parents)
 
-        random.shuffle(parents)
+        return parents
 
-        chromosome_type: type[Chromosome] = type(parents[0])
+    def new_children(self, parents: Population) -> Population:
+        with self.phase("variation"):
+            parents = parents.take(self.rng.permutation(len(parents)))
 
-        for i in range(0, len(parents) - 1, 2):
-            chromosome1, chromosome2 = chromosome_type.crossover(
-                parents[i],
-                parents[i + 1],
+            children = parents.offspring(
+                self.y,
                 self.crossover_propability,
+                self.mutation_propabiity if self.mutation is None else 0,
+                self.rng,
             )
-            chromosome1.mutate(self.mutation_propabiity)
-            chromosome2.mutate(self.mutation_propabiity)
-            children.extend([chromosome1, chromosome2])
-            if len(children) >= self.y:
-                break
+            if self.mutation is not None:
+                children = self.mutation(children)
+
+            if self.post_variation is not None:
+                children = self.post_variation(children)
+
+            if self.eliminate_duplicates is True:
+                children = self.unique_children(children)
+
+        for observer in self.observers:
+            observer.variation(parents, children)
 
-        return children[: self.y]
+        return children
+
+    def unique_children(self, children: Population) -> Population:
+        """
+        returns the children which are not duplicates of the population
+        or of the previous children.
+        """
+        self.duplicates.reset(
+            self.population.fingerprints(np.arange(len(self.population))),
+        )
+        return children.take(
+            self.duplicates.unique(children.fingerprints(np.arange(len(children)))),
+        )
 
     def remaining_population_selection(
         self,
-        previous_population: list[Chromosome],
-        children: list[Chromosome],
-    ) -> list[Chromosome]:
-        items = [*previous_population, *children]
-        fitnesses = np.array([i.fitness() for i in items])
-        probs = fitnesses / np.sum(fitnesses)
+        previous_population: Population,
+        children: Population,
+    ) -> Population:
+        with self.phase("survivor_selection"):
+            items = previous_population.concat(children)
+            fitnesses = self.fitness(items)
+            self.update_best(items, fitnesses)
+            probs = fitnesses / np.sum(fitnesses)
+
+            selected = self.remaining_population_selector(
+                items,
+                probs,
+                len(previous_population),
+            )
+            if self.eliminate_duplicates is True:
+                survivors = self.unique_survivors(
+                    items,
+                    fitnesses,
+                    selected,
+                    len(previous_population),
+                )
+            else:
+                survivors = items.take(selected)
+
+        for observer in self.observers:
+            observer.survivor_selection(survivors)
+
+        return survivors
+
+    def unique_survivors(
+        self,
+        items: Population,
+        fitnesses: npt.NDArray[np.float64],
+        selected: npt.NDArray[np.intp],
+        children_start: int,
+    ) -> Population:
+        """
+        returns mu distinct survivors. Clones of the selected items are
+        dropped (e.g. tournament winners which are selected twice) and
+        the survivors are filled with the best of the other distinct items,
+        children before the previous population (only children when parents
+        do not survive the selector). When the items do not have mu distinct
+        genomes, random chromosomes are added.
+        """
+        fingerprints = items.fingerprints(np.arange(len(items)))
+        self.duplicates.reset(())
+        survivors = [
+            int(i) for i in selected if self.duplicates.insert(fingerprints[i])
+        ]
+
+        # lexsort uses the last key first, so children (which are after
+        # the previous population) come first and fitter ones first.
+        order = np.lexsort((-fitnesses, np.arange(len(items)) < children_start))
+        if not self.remaining_population_selector.parents_survive:
+            order = order[order >= children_start]
+        for i in order:
+            if len(survivors) >= self.m:
+                break
+            if fingerprints[i] not in self.duplicates:
+                self.duplicates.add(fingerprints[i])
+                survivors.append(int(i))
+
+        return self.refill(items.take(np.asarray(survivors, dtype=np.intp)))
+
+    def refill(self, survivors: Population) -> Population:
+        """
+        fills the survivors up to mu with random chromosomes which are not
+        in the duplicate index, duplicates are only accepted when a few
+        attempts cannot find enough distinct ones (e.g. tiny problems).
+        """
+        for attempt in range(REFILL_ATTEMPTS):
+            missing = self.m - len(survivors)
+            if missing <= 0:
+                break
+
+            randoms: Population
+            if isinstance(survivors, ArrayPopulation):
+                randoms = ArrayPopulation(
+                    self.model,
+                    self.model.initial_genomes(missing, self.rng),
+                )
+            else:
+                randoms = ChromosomePopulation(
+                    self.model.initial_population(missing, self.rng),
+                )
+
+            if attempt == REFILL_ATTEMPTS - 1:
+                return survivors.concat(randoms)
+            survivors = survivors.concat(
+                randoms.take(
+                    self.duplicates.unique(
+                        randoms.fingerprints(np.arange(len(randoms))),
+                    ),
+                ),
+            )
 
-        return self.remaining_population_selector(items, probs)
+        return survivors
 
     def stop_condition(self) -> bool:
-        var = float("inf")
-        if len(self.average_fitness) > self.window_size:
-            var = float(np.var(np.array(self.average_fitness[-self.window_size :])))
-        return (
-            self.generation_counter > self.max_generation_count or var < self.threshold
-        )
+        return self.stopping_criterion()
+
+    def update_best(
+        self,
+        population: Population,
+        fitnesses: npt.NDArray[np.float64],
+    ) -> None:
+        if len(fitnesses) == 0:
+            return
+        best = int(np.argmax(fitnesses))
+        if fitnesses[best] > self.best_chromosome_fitness_in_total:
+            self.best_chromosome = population[best]
+            self.best_chromosome_fitness_in_total = float(fitnesses[best])
 
     def get_answer(self) -> Chromosome:
-        return max(self.population, key=lambda p: p.fitness())
+        if self.best_chromosome is None:
+            self.update_best(self.population, self.fitness(self.population))
+        if self.best_chromosome is None:
+            msg = "there is no chromosome in the population"
+            raise ValueError(msg)
+        return self.best_chromosome
@@ -2,10 +2,12 @@
 Implementation of selectors which seems useful in many problems.
 """
 
+import typing
+
 import numpy as np
 import numpy.typing as npt
 
-from herkoole.chromosome import Chromosome
+from herkoole.population import Population
 
 from .evolutionary_algorithm import (
     EvolutionaryAlgorithm,
@@ -14,55 +16,308 @@ from .evolutionary_algorithm import (
 )
 
 
+def universal_pointers(
+    size: int,
+    rng: np.random.Generator,
+) -> npt.NDArray[np.float64]:
+    """
+    returns size equally spaced pointers on [0, 1) with a random offset.
+    """
+    return (rng.uniform(0, 1) + np.arange(size)) / size
+
+
+def roulette_pointers(
+    size: int,
+    rng: np.random.Generator,
+) -> npt.NDArray[np.float64]:
+    """
+    returns size independent pointers on [0, 1).
+    """
+    return rng.random(size)
+
+
+def spin(
+    probs: npt.NDArray[np.float64],
+    pointers: npt.NDArray[np.float64],
+) -> npt.NDArray[np.intp]:
+    """
+    returns index of the items which their cumulative probability
+    (wheel section) contains each pointer.
+    """
+    cum_sum = np.cumsum(probs)
+    return np.minimum(
+        np.searchsorted(cum_sum, pointers * cum_sum[-1], side="left"),
+        len(probs) - 1,
+    )
+
+
+def top(probs: npt.NDArray[np.float64], k: int) -> npt.NDArray[np.intp]:
+    """
+    returns indices of the k largest values in no specific order.
+    """
+    if k <= 0:
+        return np.array([], dtype=np.intp)
+    if k >= len(probs):
+        return np.arange(len(probs))
+    return np.argpartition(probs, len(probs) - k)[len(probs) - k :]
+
+
 class StochasticUniversalSampling(ParentSelector):
-    def select(self, probs: npt.NDArray[np.float64]) -> list[Chromosome]:
-        index = np.arange(self.ea.m)
-        np.random.shuffle(index)
-        items = np.array(self.ea.population)[index]
-        probs = probs[index]
-        start_index = np.random.uniform(0, 1 / self.ea.y, 1)
-        index_of_choose = np.linspace(start_index, 1, self.ea.y)
-        cum_sum = np.cumsum(probs)
-        selected_items = []
-        items_pointer = 0
+    def select(self, probs: npt.NDArray[np.float64]) -> npt.NDArray[np.intp]:
+        index = self.rng.permutation(len(probs))
+        return index[
+            spin(probs[index], universal_pointers(self.ea.parent_count, self.rng))
+        ]
+
+
+class TournamentSelection(ParentSelector):
+    """
+    TournamentSelection selects each parent as the best of q random
+    chromosomes. It only compares fitness values, so it does not need
+    normalized probabilities and costs O(parents * q) instead of O(mu).
+    """
+
+    normalized = False
+
+    def __init__(self, ea: EvolutionaryAlgorithm, q: int = 2) -> None:
+        if q <= 0:
+            msg = "Q must be a possitive number"
+            raise ValueError(msg)
+        self.q = q
+        super().__init__(ea)
 
-        for choice in index_of_choose:
-            while cum_sum[items_pointer] < choice:
-                if items_pointer == self.ea.m - 1:
-                    break
-                items_pointer += 1
+    def select(self, probs: npt.NDArray[np.float64]) -> npt.NDArray[np.intp]:
+        contestants = self.rng.integers(
+            len(probs),
+            size=(self.ea.parent_count, self.q),
+        )
+        winners = np.argmax(probs[contestants], axis=1)
+        return contestants[np.arange(len(contestants)), winners]
 
-            selected_items.append(items[items_pointer])
 
-        return selected_items
+class RouletteWheel(ParentSelector):
+    """
+    RouletteWheel selects each parent independently proportional
+    to its fitness.
+    """
+
+    def select(self, probs: npt.NDArray[np.float64]) -> npt.NDArray[np.intp]:
+        return spin(probs, roulette_pointers(self.ea.parent_count, self.rng))
+
+
+class RankSelection(ParentSelector):
+    """
+    RankSelection uses linear ranking, so selection probabilities only
+    depend on order of fitness values. The pressure is the expected
+    number of children of the best parent and must be in [1, 2].
+    """
+
+    def __init__(
+        self,
+        ea: EvolutionaryAlgorithm,
+        pressure: float = 1.5,
+        sampling: typing.Literal["universal", "roulette"] = "universal",
+    ) -> None:
+        if not 1 <= pressure <= 2:  # noqa: PLR2004
+            msg = "pressure must be between 1 and 2"
+            raise ValueError(msg)
+        self.pressure = pressure
+        self.pointers = (
+            universal_pointers if sampling == "universal" else roulette_pointers
+        )
+        super().__init__(ea)
+
+    def select(self, probs: npt.NDArray[np.float64]) -> npt.NDArray[np.intp]:
+        mu = len(probs)
+        if mu == 1:
+            return np.zeros(self.ea.parent_count, dtype=np.intp)
+
+        # rank zero is the worst parent.
+        ranks = np.empty(mu)
+        ranks[np.argsort(probs, kind="stable")] = np.arange(mu)
+        rank_probs = (2 - self.pressure) / mu + 2 * ranks * (self.pressure - 1) / (
+            mu * (mu - 1)
+        )
+
+        index = self.rng.permutation(mu)
+        return index[
+            spin(rank_probs[index], self.pointers(self.ea.parent_count, self.rng))
+        ]
+
+
+def sample_without_replacement(
+    n: int,
+    size: int,
+    k: int,
+    rng: np.random.Generator,
+) -> npt.NDArray[np.intp]:
+    """
+    returns a (size x k) matrix which each row is k distinct
+    items from [0, n). Rows are sampled together using Floyd's algorithm,
+    so it costs k numpy calls instead of one call per row.
+    """
+    if k > n:
+        msg = "cannot sample more items than the population"
+        raise ValueError(msg)
+
+    samples = np.empty((size, k), dtype=np.intp)
+    for i, j in enumerate(range(n - k, n)):
+        t = rng.integers(0, j + 1, size=size)
+        duplicated = (samples[:, :i] == t[:, np.newaxis]).any(axis=1)
+        samples[:, i] = np.where(duplicated, j, t)
+
+    return samples
 
 
 class QTournament(NextPopulationSelector):
-    def __init__(self, ea: EvolutionaryAlgorithm, q: int) -> None:
-        if q == 0:
+    """
+    QTournament selects each survivor as the best of q random contestants.
+    All tournaments are drawn together as one (mu x q) matrix.
+    """
+
+    def __init__(
+        self,
+        ea: EvolutionaryAlgorithm,
+        q: int,
+        *,
+        replace: bool = False,
+    ) -> None:
+        if q <= 0:
             msg = "Q must be a possitive number"
             raise ValueError(msg)
         self.q = q
+        # contestants of one tournament can be the same item.
+        self.replace = replace
         super().__init__(ea)
 
     def select(
         self,
-        items: list[Chromosome],
+        items: Population,
         probs: npt.NDArray[np.float64],
-    ) -> list[Chromosome]:
+    ) -> npt.NDArray[np.intp]:
         if self.ea.m == 0:
-            return []
+            return np.array([], dtype=np.intp)
+
+        if self.replace is True:
+            contestants = self.rng.integers(len(items), size=(self.ea.m, self.q))
+        else:
+            contestants = sample_without_replacement(
+                len(items),
+                self.ea.m,
+                self.q,
+                self.rng,
+            )
+
+        winners = np.argmax(probs[contestants], axis=1)
+
+        return contestants[np.arange(self.ea.m), winners]
+
+
+class Truncation(NextPopulationSelector):
+    """
+    Truncation keeps the mu best items. It uses a partial sort, so
+    it costs O(n) instead of sorting all items.
+    """
+
+    def select(
+        self,
+        items: Population,  # noqa: ARG002
+        probs: npt.NDArray[np.float64],
+    ) -> npt.NDArray[np.intp]:
+        return top(probs, self.ea.m)
+
+
+class CommaSelection(NextPopulationSelector):
+    """
+    CommaSelection implements (mu, lambda) selection which selects
+    survivors only from children, so parents are always discarded.
+    Children are selected with the given selector (Truncation by default).
+    When duplicate elimination leaves fewer than mu children, all of them
+    survive and the algorithm fills the rest with random chromosomes.
+    """
+
+    parents_survive = False
+
+    def __init__(
+        self,
+        ea: EvolutionaryAlgorithm,
+        selector: typing.Callable[[EvolutionaryAlgorithm], NextPopulationSelector]
+        | None = None,
+    ) -> None:
+        if ea.y < ea.m:
+            msg = "(mu, lambda) selection needs at least mu children"
+            raise ValueError(msg)
+        self.selector = (selector or Truncation.new())(ea)
+        super().__init__(ea)
+
+    def select(
+        self,
+        items: Population,
+        probs: npt.NDArray[np.float64],
+    ) -> npt.NDArray[np.intp]:
+        if self.children_start is None:
+            msg = "(mu, lambda) selection needs index of the first child"
+            raise ValueError(msg)
+
+        # items are previous population followed by its children.
+        children = np.arange(self.children_start, len(items))
+        if len(children) < self.ea.m:
+            if not self.ea.eliminate_duplicates:
+                msg = "(mu, lambda) selection needs at least mu children"
+                raise ValueError(msg)
+            return children
+
+        children_probs = probs[children]
+        children_probs = children_probs / np.sum(children_probs)
+
+        return children[self.selector(items.take(children), children_probs, 0)]
+
+
+class Elitism(NextPopulationSelector):
+    """
+    Elitism always carries forward the top elites items and fills
+    the rest of population with the fittest items which the given
+    selector selects from the other items.
+    """
+
+    def __init__(
+        self,
+        ea: EvolutionaryAlgorithm,
+        selector: typing.Callable[[EvolutionaryAlgorithm], NextPopulationSelector],
+        elites: int = 1,
+    ) -> None:
+        if not 0 <= elites <= ea.m:
+            msg = "number of elites must be between zero and mu"
+            raise ValueError(msg)
+        self.elites = elites
+        self.selector = selector(ea)
+        self.parents_survive = self.selector.parents_survive
+        super().__init__(ea)
+
+    def select(
+        self,
+        items: Population,
+        probs: npt.NDArray[np.float64],
+    ) -> npt.NDArray[np.intp]:
+        elites = top(probs, self.elites)
 
-        index = np.arange(len(items))
-        np.random.shuffle(index)
-        np_items = np.array(items)[index]
-        probs = probs[index]
+        # elites are not selected again by the selector.
+        others = np.ones(len(items), dtype=np.bool_)
+        others[elites] = False
+        rest = np.flatnonzero(others)
+        if len(rest) == 0:
+            return elites
 
-        selected_items = []
-        len_items = len(np_items)
+        children_start = self.children_start
+        if children_start is not None:
+            children_start -= int(np.count_nonzero(elites < children_start))
 
-        for _ in range(self.ea.m):
-            indexes = np.random.choice(np.arange(len_items), self.q, replace=False)
-            selected_items.append(np_items[indexes[np.argmax(probs[indexes])]])
+        rest_probs = probs[rest]
+        total = np.sum(rest_probs)
+        if total > 0:
+            rest_probs = rest_probs / total
+        selected = rest[self.selector(items.take(rest), rest_probs, children_start)]
+        # selectors return mu items (e.g. truncation in no specific order).
+        selected = selected[np.argsort(-probs[selected], kind="stable")]
 
-        return list(selected_items)
+        return np.concatenate((elites, selected[: self.ea.m - self.elites]))
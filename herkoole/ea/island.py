@@ -0,0 +1,394 @@
+"""
+Island model runs multiple evolutionary algorithms on separate processes,
+and periodically exchanges their best chromosomes (migration).
+"""
+
+from __future__ import annotations
+
+import abc
+import dataclasses
+import logging
+import multiprocessing
+import pickle
+import queue
+import typing
+
+import numpy as np
+import numpy.typing as npt
+
+from herkoole import rng
+from herkoole.population import ChromosomePopulation
+from herkoole.rng import generator
+
+if typing.TYPE_CHECKING:
+    from multiprocessing.queues import Queue
+
+    from herkoole.chromosome import Chromosome
+
+    from .evolutionary_algorithm import EvolutionaryAlgorithm
+
+    type Migrants = tuple[npt.NDArray[typing.Any], npt.NDArray[np.float64]]
+    type Outcome = tuple[Chromosome, IslandStatistics] | Exception
+
+
+class Topology(abc.ABC):
+    """
+    Topology specifies islands that receive migrants of each island.
+    """
+
+    @abc.abstractmethod
+    def neighbours(
+        self,
+        island: int,
+        islands: int,
+        rng: np.random.Generator | None = None,
+    ) -> list[int]:
+        pass
+
+
+class Ring(Topology):
+    def neighbours(
+        self,
+        island: int,
+        islands: int,
+        rng: np.random.Generator | None = None,  # noqa: ARG002
+    ) -> list[int]:
+        if islands == 1:
+            return []
+        return [(island + 1) % islands]
+
+
+class FullyConnected(Topology):
+    def neighbours(
+        self,
+        island: int,
+        islands: int,
+        rng: np.random.Generator | None = None,  # noqa: ARG002
+    ) -> list[int]:
+        return [i for i in range(islands) if i != island]
+
+
+class RandomTopology(Topology):
+    """
+    RandomTopology chooses k different islands on each migration.
+    """
+
+    def __init__(self, k: int = 1) -> None:
+        self.k = k
+
+    def neighbours(
+        self,
+        island: int,
+        islands: int,
+        rng: np.random.Generator | None = None,
+    ) -> list[int]:
+        others = [i for i in range(islands) if i != island]
+        chosen = generator(rng).choice(
+            len(others),
+            min(self.k, len(others)),
+            replace=False,
+        )
+        return [others[i] for i in chosen]
+
+
+class MigrationPolicy:
+    """
+    MigrationPolicy specifies how many and which chromosomes of an island
+    emigrate (best or random) and which chromosomes of the destination
+    island are replaced by them (worst or random).
+    """
+
+    def __init__(
+        self,
+        size: int = 1,
+        emigrants: typing.Literal["best", "random"] = "best",
+        replace: typing.Literal["worst", "random"] = "worst",
+    ) -> None:
+        if size <= 0:
+            msg = "migration size must be a positive number"
+            raise ValueError(msg)
+        self.size = size
+        self.emigrants = emigrants
+        self.replace = replace
+
+    def select_emigrants(
+        self,
+        fitness: npt.NDArray[np.float64],
+        rng: np.random.Generator | None = None,
+    ) -> npt.NDArray[np.intp]:
+        size = min(self.size, len(fitness))
+        if self.emigrants == "random":
+            return generator(rng).choice(len(fitness), size, replace=False)
+        return np.argpartition(fitness, len(fitness) - size)[len(fitness) - size :]
+
+    def select_replaced(
+        self,
+        fitness: npt.NDArray[np.float64],
+        size: int,
+        rng: np.random.Generator | None = None,
+    ) -> npt.NDArray[np.intp]:
+        size = min(size, len(fitness))
+        if self.replace == "random":
+            return generator(rng).choice(len(fitness), size, replace=False)
+        return np.argpartition(fitness, size - 1)[:size] if size else np.arange(0)
+
+
+@dataclasses.dataclass
+class IslandStatistics:
+    island: int
+    generations: int
+    best_fitness: float
+    average_fitness: list[float]
+    emigrants: int
+    immigrants: int
+    evaluations: int
+
+
+class IslandModel:
+    """
+    IslandModel starts one process per island factory, each factory creates
+    an (independently configured) evolutionary algorithm. Every
+    migration_interval generations each island sends its emigrants to its
+    neighbours and accepts the migrants that are waiting for it, so islands
+    never wait for each other. Each island process is seeded with its own
+    child of the seed sequence and its migrations (random neighbours and
+    migrants) draw from a generator which is spawned from it, so a seeded
+    model is reproducible up to the timing of the migrations.
+
+    Island factories are sent to the processes, so they must be picklable
+    (e.g. module level functions or partials of them) when processes are
+    not forked. A failure of an island is raised in the parent, and
+    an island which exits without any result is noticed after
+    poll_interval seconds.
+    """
+
+    logger = logging.getLogger(__name__)
+
+    def __init__(  # noqa: PLR0913
+        self,
+        islands: list[typing.Callable[[], EvolutionaryAlgorithm]],
+        migration_interval: int = 10,
+        topology: Topology | None = None,
+        policy: MigrationPolicy | None = None,
+        *,
+        seed: rng.Seed = None,
+        poll_interval: float = 1.0,
+    ) -> None:
+        if migration_interval <= 0:
+            msg = "migration interval must be a positive number"
+            raise ValueError(msg)
+        self.islands = islands
+        self.migration_interval = migration_interval
+        self.topology = topology or Ring()
+        self.policy = policy or MigrationPolicy()
+        self.seed_sequence = rng.sequence(seed)
+        self.poll_interval = poll_interval
+
+        self.statistics: list[IslandStatistics] = []
+
+    def run(self) -> Chromosome:
+        inboxes: list[Queue[Migrants]] = [multiprocessing.Queue() for _ in self.islands]
+        results: Queue[tuple[int, Outcome]] = multiprocessing.Queue()
+
+        sequences = self.seed_sequence.spawn(len(self.islands))
+        processes = [
+            multiprocessing.Process(
+                target=_island,
+                args=(i, factory, self, inboxes, results, sequences[i]),
+            )
+            for i, factory in enumerate(self.islands)
+        ]
+        try:
+            for process in processes:
+                process.start()
+            answers = self.collect(processes, results)
+        finally:
+            # remaining islands are stopped when one of them fails.
+            for process in processes:
+                if process.is_alive():
+                    process.terminate()
+                process.join()
+
+        self.statistics = [statistics for _, statistics in answers]
+        for statistics in self.statistics:
+            self.logger.info(
+                "Island %d - %d generations, best fitness: %f",
+                statistics.island,
+                statistics.generations,
+                statistics.best_fitness,
+            )
+
+        return max(answers, key=lambda answer: answer[1].best_fitness)[0]
+
+    def collect(
+        self,
+        processes: list[multiprocessing.Process],
+        results: Queue[tuple[int, Outcome]],
+    ) -> list[tuple[Chromosome, IslandStatistics]]:
+        """
+        waits for the result of each island (in the island order) and
+        raises the first failure. An island is lost when its process has
+        exited and its result does not arrive in the next poll interval.
+        """
+        outcomes: dict[int, tuple[Chromosome, IslandStatistics]] = {}
+        exited: set[int] = set()
+        while len(outcomes) < len(processes):
+            try:
+                index, outcome = results.get(timeout=self.poll_interval)
+            except queue.Empty:
+                lost = exited
+                exited = {
+                    i
+                    for i, process in enumerate(processes)
+                    if i not in outcomes and process.exitcode is not None
+                }
+                if lost & exited:
+                    i = min(lost & exited)
+                    msg = (
+                        f"island {i} exited with code {processes[i].exitcode} "
+                        "without any result"
+                    )
+                    raise RuntimeError(msg) from None
+                continue
+
+            if isinstance(outcome, tuple):
+                outcomes[index] = outcome
+                continue
+
+            msg = f"island {index} failed"
+            raise RuntimeError(msg) from outcome
+
+        return [outcomes[i] for i in range(len(processes))]
+
+    def emigrate(
+        self,
+        ea: EvolutionaryAlgorithm,
+        rng: np.random.Generator | None = None,
+    ) -> Migrants:
+        fitness = ea.fitness(ea.population)
+        emigrants = ea.population.take(self.policy.select_emigrants(fitness, rng))
+        return ea.model.encode(list(emigrants)), emigrants.known_fitness()
+
+    def immigrate(
+        self,
+        ea: EvolutionaryAlgorithm,
+        migrants: Migrants,
+        rng: np.random.Generator | None = None,
+    ) -> int:
+        genomes, fitness = migrants
+
+        immigrants: list[Chromosome] = []
+        for genome, f in zip(genomes, fitness, strict=True):
+            chromosome = ea.model.decode(genome)
+            chromosome.cached_fitness = float(f)
+            immigrants.append(chromosome)
+
+        replaced = self.policy.select_replaced(
+            ea.fitness(ea.population),
+            len(immigrants),
+            rng,
+        )
+        survivors = np.setdiff1d(np.arange(len(ea.population)), replaced)
+        ea.population = ea.population.take(survivors).concat(
+            ChromosomePopulation(immigrants[: len(replaced)]),
+        )
+
+        return len(replaced)
+
+
+def _island(  # noqa: PLR0913, PLR0917
+    index: int,
+    factory: typing.Callable[[], EvolutionaryAlgorithm],
+    model: IslandModel,
+    inboxes: list[Queue[Migrants]],
+    results: Queue[tuple[int, Outcome]],
+    sequence: np.random.SeedSequence,
+) -> None:
+    # islands must not share the random state of their parent process,
+    # algorithms which are created without a seed draw it from here.
+    rng.seed(sequence)
+    migrations = np.random.default_rng(sequence.spawn(1)[0])
+
+    # migrants that are left in the queues after an island stops
+    # must not block its process from exiting.
+    for inbox in inboxes:
+        inbox.cancel_join_thread()
+
+    # the parent waits for one outcome of each island, so failures
+    # are sent instead of the result.
+    outcome: Outcome
+    try:
+        outcome = _evolve(index, factory, model, inboxes, migrations)
+    except Exception as error:  # noqa: BLE001
+        outcome = _picklable(error)
+
+    results.put((index, outcome))
+
+
+def _picklable(error: Exception) -> Exception:
+    """
+    returns the error or (when it cannot be sent to the parent
+    process) a runtime error with its description.
+    """
+    try:
+        pickle.dumps(error)
+    except Exception:  # noqa: BLE001
+        return RuntimeError(f"{type(error).__name__}: {error}")
+    return error
+
+
+def _evolve(
+    index: int,
+    factory: typing.Callable[[], EvolutionaryAlgorithm],
+    model: IslandModel,
+    inboxes: list[Queue[Migrants]],
+    migrations: np.random.Generator,
+) -> tuple[Chromosome, IslandStatistics]:
+    ea = factory()
+    emigrants = 0
+    immigrants = 0
+
+    try:
+        while True:
+            ea.step()
+
+            if ea.generation_counter % model.migration_interval == 0:
+                migrants = model.emigrate(ea, migrations)
+                for neighbour in model.topology.neighbours(
+                    index,
+                    len(inboxes),
+                    migrations,
+                ):
+                    inboxes[neighbour].put(migrants)
+                    emigrants += len(migrants[0])
+
+                while True:
+                    try:
+                        immigrants += model.immigrate(
+                            ea,
+                            inboxes[index].get_nowait(),
+                            migrations,
+                        )
+                    except queue.Empty:
+                        break
+
+            if ea.stop_condition():
+                break
+
+        # observers get the end of the run, e.g. the last checkpoint.
+        answer = ea.finish_run()
+    finally:
+        ea.close()
+
+    return (
+        answer,
+        IslandStatistics(
+            island=index,
+            generations=ea.generation_counter,
+            best_fitness=answer.fitness(),
+            average_fitness=ea.average_fitness,
+            emigrants=emigrants,
+            immigrants=immigrants,
+            evaluations=ea.fitness_cache.misses,
+        ),
+    )
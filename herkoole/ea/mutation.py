@@ -0,0 +1,314 @@
+"""
+Mutation operators which change a whole batch of children (as a genome
+matrix) with a few numpy calls. Bit-flip works on binary genomes and
+the others on permutations, e.g. tsp tours.
+"""
+
+from __future__ import annotations
+
+import abc
+import typing
+
+import numpy as np
+import numpy.typing as npt
+
+from herkoole.population import ArrayPopulation, Population
+
+if typing.TYPE_CHECKING:
+    from .evolutionary_algorithm import EvolutionaryAlgorithm
+
+
+def bernoulli_positions(
+    size: int,
+    rate: float,
+    rng: np.random.Generator,
+) -> npt.NDArray[np.intp]:
+    """
+    returns the (sorted) positions of successes in size independent
+    bernoulli trials with the given rate. Gaps between successes are
+    geometric, so it costs O(successes) instead of O(size) and the number
+    of successes is binomially distributed.
+    """
+    if size <= 0 or rate <= 0:
+        return np.array([], dtype=np.intp)
+    if rate >= 1:
+        return np.arange(size)
+
+    chunks = []
+    last = -1
+    while last < size:
+        # expected number of successes in the remaining trials with a margin.
+        count = int((size - last) * rate * 1.1) + 16
+        positions = last + np.cumsum(rng.geometric(rate, size=count))
+        chunks.append(positions[positions < size])
+        last = int(positions[-1])
+
+    return np.concatenate(chunks).astype(np.intp)
+
+
+def segments(
+    size: int,
+    length: int,
+    rng: np.random.Generator,
+) -> tuple[npt.NDArray[np.intp], npt.NDArray[np.intp]]:
+    """
+    returns start and end (inclusive) of size random segments
+    which have at least two genes.
+    """
+    start = rng.integers(length, size=size)
+    end = (start + rng.integers(1, length, size=size)) % length
+    return np.minimum(start, end), np.maximum(start, end)
+
+
+class Mutation(abc.ABC):
+    """
+    With Mutation you can customize the evolutionary algorithm
+    mutation, it replaces mutation of the chromosomes (and their
+    mutation probability) when it is given.
+    """
+
+    def __init__(self, ea: EvolutionaryAlgorithm) -> None:
+        self.ea = ea
+        self.rng = ea.spawn()
+
+    def __call__(self, children: Population) -> Population:
+        if len(children) == 0:
+            return children
+        if isinstance(children, ArrayPopulation):
+            rows = self.mutate(children.genomes)
+            children.fitness_values[rows] = np.nan
+            return children
+
+        genomes = np.stack([children.genome(i) for i in range(len(children))])
+        for i in self.mutate(genomes):
+            children.set_genome(int(i), genomes[i])
+        return children
+
+    @classmethod
+    def new(
+        cls,
+        *args,  # noqa: ANN002
+        **kwargs,  # noqa: ANN003
+    ) -> typing.Callable[[EvolutionaryAlgorithm], Mutation]:
+        def _new(ea: EvolutionaryAlgorithm) -> Mutation:
+            return cls(ea, *args, **kwargs)
+
+        return _new
+
+    def adapt(  # noqa: B027
+        self,
+        fitnesses: npt.NDArray[np.float64],
+        children_fitnesses: npt.NDArray[np.float64],
+    ) -> None:
+        """
+        is called with fitness of the population and its children
+        after each generation, adaptive operators update their rate.
+        """
+
+    @abc.abstractmethod
+    def mutate(self, genomes: npt.NDArray[typing.Any]) -> npt.NDArray[np.intp]:
+        """
+        mutates rows of the genome matrix in place and
+        returns indices of the changed rows.
+        """
+
+
+class BitFlip(Mutation):
+    """
+    BitFlip flips each gene independently with the rate (1 / genes by
+    default), so large genomes change more than one gene.
+    """
+
+    def __init__(self, ea: EvolutionaryAlgorithm, rate: float | None = None) -> None:
+        self.rate = rate
+        super().__init__(ea)
+
+    def mutate(self, genomes: npt.NDArray[typing.Any]) -> npt.NDArray[np.intp]:
+        length = genomes.shape[1]
+        rate = 1 / length if self.rate is None else self.rate
+
+        rows, cols = np.divmod(
+            bernoulli_positions(genomes.size, rate, self.rng),
+            length,
+        )
+        genomes[rows, cols] = np.logical_not(genomes[rows, cols])
+
+        return np.unique(rows)
+
+
+class Swap(Mutation):
+    """
+    Swap exchanges each gene with another random gene of the
+    same permutation with the rate (1 / genes by default).
+    """
+
+    def __init__(self, ea: EvolutionaryAlgorithm, rate: float | None = None) -> None:
+        self.rate = rate
+        super().__init__(ea)
+
+    def mutate(self, genomes: npt.NDArray[typing.Any]) -> npt.NDArray[np.intp]:
+        n, length = genomes.shape
+        rate = 1 / length if self.rate is None else self.rate
+        if length < 2:  # noqa: PLR2004
+            return np.array([], dtype=np.intp)
+
+        # swaps of a row depend on each other, so they are applied in
+        # rounds which each of them swaps one pair in the remaining rows.
+        swaps = self.rng.binomial(length, min(rate, 1), size=n)
+        for r in range(int(swaps.max(initial=0))):
+            rows = np.flatnonzero(swaps > r)
+            i = self.rng.integers(length, size=len(rows))
+            j = (i + self.rng.integers(1, length, size=len(rows))) % length
+            genomes[rows, i], genomes[rows, j] = genomes[rows, j], genomes[rows, i]
+
+        return np.flatnonzero(swaps > 0)
+
+
+class _Segment(Mutation):
+    """
+    _Segment mutates a random segment of each chromosome
+    with the probability (per chromosome).
+    """
+
+    def __init__(self, ea: EvolutionaryAlgorithm, rate: float = 0.1) -> None:
+        self.rate = rate
+        super().__init__(ea)
+
+    def mutate(self, genomes: npt.NDArray[typing.Any]) -> npt.NDArray[np.intp]:
+        length = genomes.shape[1]
+        rows = np.flatnonzero(self.rng.random(len(genomes)) < self.rate)
+        if len(rows) == 0 or length < 2:  # noqa: PLR2004
+            return np.array([], dtype=np.intp)
+
+        start, end = segments(len(rows), length, self.rng)
+        order = self.order(start[:, np.newaxis], end[:, np.newaxis], length)
+        genomes[rows] = np.take_along_axis(genomes[rows], order, axis=1)
+
+        return rows
+
+    @abc.abstractmethod
+    def order(
+        self,
+        start: npt.NDArray[np.intp],
+        end: npt.NDArray[np.intp],
+        length: int,
+    ) -> npt.NDArray[np.intp]:
+        """
+        returns for each position of the mutated rows the position
+        of its new gene, start and end are (rows x 1) columns.
+        """
+
+
+class Inversion(_Segment):
+    """
+    Inversion reverses a random segment of the permutation.
+    """
+
+    def order(
+        self,
+        start: npt.NDArray[np.intp],
+        end: npt.NDArray[np.intp],
+        length: int,
+    ) -> npt.NDArray[np.intp]:
+        k = np.arange(length)
+        return np.where((start <= k) & (k <= end), start + end - k, k)
+
+
+class Scramble(_Segment):
+    """
+    Scramble shuffles genes of a random segment of the permutation.
+    """
+
+    def order(
+        self,
+        start: npt.NDArray[np.intp],
+        end: npt.NDArray[np.intp],
+        length: int,
+    ) -> npt.NDArray[np.intp]:
+        k = np.arange(length)
+        # genes of the segment get random keys in [start, end + 1),
+        # so sorting the keys only shuffles the segment.
+        inside = (start <= k) & (k <= end)
+        keys = np.where(
+            inside,
+            start + self.rng.random((len(start), length)) * (end - start + 1),
+            k,
+        )
+        return np.argsort(keys, axis=1, kind="stable")
+
+
+class Insert(_Segment):
+    """
+    Insert moves the gene on one end of a random segment
+    to its other end and shifts the genes between them.
+    """
+
+    def order(
+        self,
+        start: npt.NDArray[np.intp],
+        end: npt.NDArray[np.intp],
+        length: int,
+    ) -> npt.NDArray[np.intp]:
+        k = np.arange(length)
+        forward = self.rng.random(start.shape) < 0.5  # noqa: PLR2004
+        # forward moves the start gene to the end, otherwise the end
+        # gene is moved to the start.
+        moved = np.where(
+            forward,
+            np.where(k == end, start, k + 1),
+            np.where(k == start, end, k - 1),
+        )
+        return np.where((start <= k) & (k <= end), moved, k)
+
+
+class OneFifthRule(Mutation):
+    """
+    OneFifthRule adapts rate of the given operator using Rechenberg's
+    one-fifth success rule, the rate grows when more than one fifth of
+    the children are better than the median of the population and
+    shrinks otherwise.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        ea: EvolutionaryAlgorithm,
+        mutation: typing.Callable[[EvolutionaryAlgorithm], Mutation],
+        rate: float | None = None,
+        *,
+        factor: float = 0.85,
+        minimum: float = 1e-4,
+        maximum: float = 0.5,
+    ) -> None:
+        if not 0 < factor < 1:
+            msg = "factor must be between zero and one"
+            raise ValueError(msg)
+        self.mutation = mutation(ea)
+        if not hasattr(self.mutation, "rate"):
+            msg = "adaptive mutation needs an operator with rate"
+            raise TypeError(msg)
+        self.rate = rate
+        self.factor = factor
+        self.minimum = minimum
+        self.maximum = maximum
+        super().__init__(ea)
+
+    def mutate(self, genomes: npt.NDArray[typing.Any]) -> npt.NDArray[np.intp]:
+        if self.rate is None:
+            self.rate = self.mutation.rate or 1 / genomes.shape[1]
+        self.mutation.rate = self.rate
+        return self.mutation.mutate(genomes)
+
+    def adapt(
+        self,
+        fitnesses: npt.NDArray[np.float64],
+        children_fitnesses: npt.NDArray[np.float64],
+    ) -> None:
+        if self.rate is None or len(fitnesses) == 0 or len(children_fitnesses) == 0:
+            return
+
+        success = np.mean(children_fitnesses > np.median(fitnesses))
+        if success > 1 / 5:
+            self.rate /= self.factor
+        elif success < 1 / 5:
+            self.rate *= self.factor
+        self.rate = float(np.clip(self.rate, self.minimum, self.maximum))
@@ -0,0 +1,172 @@
+"""
+Observers are notified about the phases of each generation, so runs
+can be monitored (e.g. streaming statistics into a file) without
+changing the evolutionary algorithm loop.
+"""
+
+from __future__ import annotations
+
+import abc
+import collections
+import csv
+import dataclasses
+import json
+import pathlib
+import typing
+
+if typing.TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+    from herkoole.chromosome import Chromosome
+    from herkoole.population import Population
+
+    from .evolutionary_algorithm import EvolutionaryAlgorithm
+
+# phases of a generation which their wall time is measured.
+PHASES = ("evaluation", "parent_selection", "variation", "survivor_selection")
+
+
+@dataclasses.dataclass
+class GenerationStatistics:
+    """
+    GenerationStatistics describes the population at the start of a
+    generation and the work that is done during it. Diversity is the ratio
+    of distinct genomes (by their fingerprints), distance is the mean
+    distance of sampled pairs of chromosomes and timings are the wall
+    time (in seconds) of each phase excluding its nested phases.
+    """
+
+    generation: int
+    best: float
+    mean: float
+    std: float
+    diversity: float
+    distance: float
+    evaluations: int
+    total_evaluations: int
+    timings: dict[str, float]
+
+    def flatten(self) -> dict[str, float | int]:
+        """
+        returns statistics as one flat record, e.g. for a csv row.
+        """
+        record: dict[str, float | int] = {
+            field.name: getattr(self, field.name)
+            for field in dataclasses.fields(self)
+            if field.name != "timings"
+        }
+        for phase in PHASES:
+            record[f"{phase}_time"] = self.timings.get(phase, 0.0)
+        return record
+
+
+class Observer(abc.ABC):  # noqa: B024
+    """
+    With Observer you can follow the evolutionary algorithm run,
+    every hook does nothing by default.
+    """
+
+    def __init__(self, ea: EvolutionaryAlgorithm) -> None:
+        self.ea = ea
+
+    @classmethod
+    def new(
+        cls,
+        *args,  # noqa: ANN002
+        **kwargs,  # noqa: ANN003
+    ) -> typing.Callable[[EvolutionaryAlgorithm], Observer]:
+        def _new(ea: EvolutionaryAlgorithm) -> Observer:
+            return cls(ea, *args, **kwargs)
+
+        return _new
+
+    def generation_start(self, generation: int) -> None:  # noqa: B027
+        pass
+
+    def evaluation(  # noqa: B027
+        self,
+        population: Population,
+        fitness: npt.NDArray[np.float64],
+        evaluations: int,
+    ) -> None:
+        """
+        is called after fitness of a population is computed, evaluations is
+        number of the chromosomes that are actually evaluated.
+        """
+
+    def parent_selection(self, parents: Population) -> None:  # noqa: B027
+        pass
+
+    def variation(self, parents: Population, children: Population) -> None:  # noqa: B027
+        pass
+
+    def survivor_selection(self, survivors: Population) -> None:  # noqa: B027
+        pass
+
+    def generation_end(self, statistics: GenerationStatistics) -> None:  # noqa: B027
+        pass
+
+    def run_end(self, answer: Chromosome) -> None:  # noqa: B027
+        pass
+
+    def close(self) -> None:  # noqa: B027
+        """
+        releases resources of the observer, it is called
+        at the end of the run even when it fails.
+        """
+
+
+class History(Observer):
+    """
+    History keeps statistics of the last maxlen generations in memory.
+    """
+
+    def __init__(self, ea: EvolutionaryAlgorithm, maxlen: int | None = 1000) -> None:
+        self.statistics: collections.deque[GenerationStatistics] = collections.deque(
+            maxlen=maxlen,
+        )
+        super().__init__(ea)
+
+    def generation_end(self, statistics: GenerationStatistics) -> None:
+        self.statistics.append(statistics)
+
+
+class JSONLinesWriter(Observer):
+    """
+    JSONLinesWriter streams statistics of each generation
+    as one json object per line.
+    """
+
+    def __init__(self, ea: EvolutionaryAlgorithm, path: str | pathlib.Path) -> None:
+        self.file = pathlib.Path(path).open("w", encoding="utf-8")  # noqa: SIM115
+        super().__init__(ea)
+
+    def generation_end(self, statistics: GenerationStatistics) -> None:
+        self.file.write(json.dumps(statistics.flatten()) + "\n")
+        self.file.flush()
+
+    def close(self) -> None:
+        self.file.close()
+
+
+class CSVWriter(Observer):
+    """
+    CSVWriter streams statistics of each generation as csv rows.
+    """
+
+    def __init__(self, ea: EvolutionaryAlgorithm, path: str | pathlib.Path) -> None:
+        self.file = pathlib.Path(path).open("w", encoding="utf-8", newline="")  # noqa: SIM115
+        self.writer: csv.DictWriter[str] | None = None
+        super().__init__(ea)
+
+    def generation_end(self, statistics: GenerationStatistics) -> None:
+        record = statistics.flatten()
+        if self.writer is None:
+            self.writer = csv.DictWriter(self.file, fieldnames=list(record))
+            self.writer.writeheader()
+        self.writer.writerow(record)
+        self.file.flush()
+
+    def close(self) -> None:
+        self.file.close()
@@ -0,0 +1,266 @@
+"""
+Steady-state evolutionary algorithm which creates a few children per
+iteration and replaces chromosomes of the population in place, instead
+of selecting a new population after all of the children are created.
+"""
+
+from __future__ import annotations
+
+import abc
+import heapq
+import math
+import typing
+
+import numpy as np
+import numpy.typing as npt
+
+from .evolutionary_algorithm import EvolutionaryAlgorithm
+from .functions import Truncation
+
+if typing.TYPE_CHECKING:
+    from herkoole.model import Model
+    from herkoole.population import Population
+
+    from .evolutionary_algorithm import ParentSelector
+
+
+class Replacement(abc.ABC):
+    """
+    With Replacement you can customize which chromosome of the
+    steady-state population is replaced by each child.
+    """
+
+    def __init__(self, ea: EvolutionaryAlgorithm) -> None:
+        self.ea = ea
+        self.rng = ea.spawn()
+
+    def __call__(self, fitness: float) -> int | None:
+        return self.select(fitness)
+
+    @classmethod
+    def new(
+        cls,
+        *args,  # noqa: ANN002
+        **kwargs,  # noqa: ANN003
+    ) -> typing.Callable[[EvolutionaryAlgorithm], Replacement]:
+        def _new(ea: EvolutionaryAlgorithm) -> Replacement:
+            return cls(ea, *args, **kwargs)
+
+        return _new
+
+    def reset(self, fitnesses: npt.NDArray[np.float64]) -> None:  # noqa: B027
+        """
+        is called with fitness of the population at the start of
+        each generation, before any replacement.
+        """
+
+    def replaced(self, index: int, fitness: float) -> None:  # noqa: B027
+        """
+        is called after the chromosome on index is replaced by a child.
+        """
+
+    @abc.abstractmethod
+    def select(self, fitness: float) -> int | None:
+        """
+        returns index of the chromosome which is replaced by a child with
+        the given fitness or None when the child must be discarded.
+        """
+
+
+class ReplaceWorst(Replacement):
+    """
+    ReplaceWorst replaces the worst chromosome, it is found with a
+    heap in O(log mu). By default children which are worse than the
+    worst chromosome are discarded.
+    """
+
+    def __init__(self, ea: EvolutionaryAlgorithm, *, always: bool = False) -> None:
+        self.always = always
+        self.heap: list[tuple[float, int]] = []
+        super().__init__(ea)
+
+    def reset(self, fitnesses: npt.NDArray[np.float64]) -> None:
+        self.heap = [(float(f), i) for i, f in enumerate(fitnesses)]
+        heapq.heapify(self.heap)
+
+    def select(self, fitness: float) -> int | None:
+        if not self.heap:
+            return None
+        worst, index = self.heap[0]
+        if not self.always and fitness < worst:
+            return None
+        return index
+
+    def replaced(self, index: int, fitness: float) -> None:
+        # only the worst chromosome is replaced, so it is on the top.
+        heapq.heapreplace(self.heap, (fitness, index))
+
+
+class ReplaceTournamentLoser(Replacement):
+    """
+    ReplaceTournamentLoser replaces the worst of q random contestants,
+    so the worst chromosomes are not always replaced.
+    """
+
+    def __init__(self, ea: EvolutionaryAlgorithm, q: int = 2) -> None:
+        if q <= 0:
+            msg = "Q must be a possitive number"
+            raise ValueError(msg)
+        self.q = q
+        self.fitnesses = np.empty(0)
+        super().__init__(ea)
+
+    def reset(self, fitnesses: npt.NDArray[np.float64]) -> None:
+        self.fitnesses = fitnesses.copy()
+
+    def select(self, fitness: float) -> int | None:  # noqa: ARG002
+        if len(self.fitnesses) == 0:
+            return None
+        contestants = self.rng.integers(len(self.fitnesses), size=self.q)
+        return int(contestants[np.argmin(self.fitnesses[contestants])])
+
+    def replaced(self, index: int, fitness: float) -> None:
+        self.fitnesses[index] = fitness
+
+
+class SteadyStateEvolutionaryAlgorithm(EvolutionaryAlgorithm):
+    """
+    SteadyStateEvolutionaryAlgorithm creates y children in each iteration
+    and puts them into the population in place using the replacement.
+    A generation is ceil(mu / y) iterations, so observers and stopping
+    criteria see about mu new children per generation.
+
+    Fitness proportional parent selectors need normalized probabilities,
+    so their iterations cost O(mu). With TournamentSelection (and
+    ReplaceWorst) an iteration costs O(y log mu).
+    """
+
+    def __init__(  # noqa: PLR0913, PLR0917
+        self,
+        mu: int,
+        y: int,
+        max_generation_count: int,
+        model: Model,
+        parent_selector: typing.Callable[[EvolutionaryAlgorithm], ParentSelector],
+        replacement: typing.Callable[[EvolutionaryAlgorithm], Replacement]
+        | None = None,
+        **kwargs,  # noqa: ANN003
+    ) -> None:
+        if y <= 0:
+            msg = "steady-state algorithm needs at least one child per iteration"
+            raise ValueError(msg)
+
+        # survivors are chosen by the replacement, so the population
+        # selector is never called.
+        super().__init__(
+            mu,
+            y,
+            max_generation_count,
+            model,
+            parent_selector,
+            Truncation.new(),
+            **kwargs,
+        )
+
+        if replacement is None:
+            replacement = ReplaceWorst.new()
+        self.replacement = replacement(self)
+
+    def step(self) -> None:
+        """
+        evolves the population for one generation.
+        """
+        evaluations = self.start_generation()
+        fitnesses = self.fitness(self.population)
+        # population changes in place, so statistics need a copy of it.
+        population = (
+            self.population.take(np.arange(len(self.population)))
+            if self.observers
+            else self.population
+        )
+        self.record(fitnesses)
+
+        current = fitnesses.copy()
+        self.replacement.reset(current)
+        if self.eliminate_duplicates is True:
+            self.duplicates.reset(
+                self.population.fingerprints(np.arange(len(self.population))),
+            )
+        for _ in range(math.ceil(self.m / self.y)):
+            self.iterate(current)
+
+        self.finish_generation(population, fitnesses, evaluations)
+
+    def unique_children(self, children: Population) -> Population:
+        # the index follows the population in place, so it is
+        # only reset at the start of each generation.
+        return children.take(
+            self.duplicates.unique(children.fingerprints(np.arange(len(children)))),
+        )
+
+    def iterate(self, fitnesses: npt.NDArray[np.float64]) -> None:
+        """
+        creates y children and replaces them in the population,
+        fitnesses of the population is updated in place.
+        """
+        with self.phase("parent_selection"):
+            probs = (
+                fitnesses / np.sum(fitnesses)
+                if self.parent_selector.normalized
+                else fitnesses
+            )
+            parents = self.population.take(self.parent_selector(probs))
+
+        for observer in self.observers:
+            observer.parent_selection(parents)
+
+        children = self.new_children(parents)
+        children_fitnesses = self.fitness(children)
+        self.update_best(children, children_fitnesses)
+        if self.mutation is not None:
+            self.mutation.adapt(fitnesses, children_fitnesses)
+
+        with self.phase("survivor_selection"):
+            indices: list[int] = []
+            selected: list[int] = []
+            for i, fitness in enumerate(children_fitnesses):
+                index = self.replacement(float(fitness))
+                if index is None:
+                    continue
+                indices.append(index)
+                selected.append(i)
+                fitnesses[index] = fitness
+                self.replacement.replaced(index, float(fitness))
+
+            if self.eliminate_duplicates is True:
+                self.forget_replaced(children, indices, selected)
+
+            if indices:
+                self.population.replace(
+                    np.asarray(indices, dtype=np.intp),
+                    children.take(np.asarray(selected, dtype=np.intp)),
+                )
+
+        for observer in self.observers:
+            observer.survivor_selection(self.population)
+
+    def forget_replaced(
+        self,
+        children: Population,
+        indices: list[int],
+        selected: list[int],
+    ) -> None:
+        """
+        removes the chromosomes which are replaced by the selected children
+        and the children which do not stay in the population from the
+        duplicate index, it must be called before the replacement.
+        """
+        # later children win for the repeated indices.
+        staying = set(dict(zip(indices, selected, strict=True)).values())
+        leaving = [i for i in range(len(children)) if i not in staying]
+
+        for fingerprint in (
+            *self.population.fingerprints(np.unique(np.asarray(indices, np.intp))),
+            *children.fingerprints(np.asarray(leaving, dtype=np.intp)),
+        ):
+            self.duplicates.discard(fingerprint)
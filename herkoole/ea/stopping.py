@@ -0,0 +1,340 @@
+"""
+Stopping criteria decide when the evolutionary algorithm stops.
+They are updated once per generation and keep their statistics
+incrementally, so checking them costs O(1) per generation
+(except DiversityCollapse which hashes the population).
+"""
+
+from __future__ import annotations
+
+import abc
+import collections
+import math
+import time
+import typing
+
+import numpy as np
+
+from .diversity import unique_ratio
+
+if typing.TYPE_CHECKING:
+    from .evolutionary_algorithm import EvolutionaryAlgorithm
+
+
+class WindowStatistics:
+    """
+    WindowStatistics keeps mean and variance of the last size values
+    using Welford's algorithm, the oldest value is removed (by reversing
+    its update) when a new value is pushed into a full window.
+    """
+
+    def __init__(self, size: int) -> None:
+        if size <= 0:
+            msg = "window size must be a positive number"
+            raise ValueError(msg)
+        self.size = size
+        self.values: collections.deque[float] = collections.deque()
+        self.mean = 0.0
+        # sum of squared differences from the mean.
+        self.m2 = 0.0
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def push(self, value: float) -> None:
+        if len(self.values) == self.size:
+            self._remove(self.values.popleft())
+
+        self.values.append(value)
+        delta = value - self.mean
+        self.mean += delta / len(self.values)
+        self.m2 += delta * (value - self.mean)
+
+    def _remove(self, value: float) -> None:
+        n = len(self.values)
+        if n == 0:
+            self.mean, self.m2 = 0.0, 0.0
+            return
+
+        delta = value - self.mean
+        self.mean -= delta / n
+        self.m2 = max(self.m2 - delta * (value - self.mean), 0.0)
+
+    @property
+    def variance(self) -> float:
+        """
+        population variance (same as np.var) of the window.
+        """
+        if len(self.values) == 0:
+            return math.nan
+        return self.m2 / len(self.values)
+
+
+class StoppingCriterion(abc.ABC):
+    """
+    With StoppingCriterion you can customize when the evolutionary
+    algorithm stops. Criteria are updated at most once per generation
+    even when they are checked many times.
+    """
+
+    def __init__(self, ea: EvolutionaryAlgorithm) -> None:
+        self.ea = ea
+        # generation of the last update.
+        self.generation: int | None = None
+
+    def __call__(self) -> bool:
+        self.refresh()
+        return self.satisfied()
+
+    @classmethod
+    def new(
+        cls,
+        *args,  # noqa: ANN002
+        **kwargs,  # noqa: ANN003
+    ) -> typing.Callable[[EvolutionaryAlgorithm], StoppingCriterion]:
+        def _new(ea: EvolutionaryAlgorithm) -> StoppingCriterion:
+            return cls(ea, *args, **kwargs)
+
+        return _new
+
+    def refresh(self) -> None:
+        if self.generation != self.ea.generation_counter:
+            self.generation = self.ea.generation_counter
+            self.update()
+
+    def update(self) -> None:  # noqa: B027
+        """
+        updates statistics of the criterion after a generation.
+        """
+
+    @abc.abstractmethod
+    def satisfied(self) -> bool:
+        """
+        returns true when the algorithm must stop.
+        """
+
+    def state(self) -> dict[str, typing.Any]:
+        """
+        returns statistics of the criterion for checkpoints, its
+        parameters come from the configuration of the resumed run.
+        """
+        return {}
+
+    def restore(self, state: dict[str, typing.Any]) -> None:  # noqa: ARG002
+        """
+        restores statistics of a checkpoint which is taken after
+        updating the criterion in the current generation.
+        """
+        self.generation = self.ea.generation_counter
+
+
+class MaxGenerations(StoppingCriterion):
+    def __init__(self, ea: EvolutionaryAlgorithm, generations: int) -> None:
+        self.generations = generations
+        super().__init__(ea)
+
+    def satisfied(self) -> bool:
+        return self.ea.generation_counter > self.generations
+
+
+class FitnessVariance(StoppingCriterion):
+    """
+    FitnessVariance stops when variance of the average fitness
+    in the last window generations is below the threshold.
+    """
+
+    def __init__(
+        self,
+        ea: EvolutionaryAlgorithm,
+        window: int = 10,
+        threshold: float = 0.1,
+    ) -> None:
+        self.statistics = WindowStatistics(window)
+        self.threshold = threshold
+        # number of the average fitness values that are pushed.
+        self.seen = 0
+        super().__init__(ea)
+
+    def update(self) -> None:
+        history = self.ea.average_fitness
+        # values are pushed from the history, so criterion catches up
+        # after being created on a resumed run.
+        start = max(self.seen, len(history) - self.statistics.size)
+        for value in history[start:]:
+            self.statistics.push(value)
+        self.seen = len(history)
+
+    def satisfied(self) -> bool:
+        # the full window is needed, as there are no values for the
+        # generations before the first one.
+        return (
+            self.seen > self.statistics.size
+            and self.statistics.variance < self.threshold
+        )
+
+
+class Stagnation(StoppingCriterion):
+    """
+    Stagnation stops when the best-ever fitness has not improved
+    more than tolerance in the last generations.
+    """
+
+    def __init__(
+        self,
+        ea: EvolutionaryAlgorithm,
+        generations: int,
+        tolerance: float = 0,
+    ) -> None:
+        self.generations = generations
+        self.tolerance = tolerance
+        self.best = -math.inf
+        self.stagnant = 0
+        super().__init__(ea)
+
+    def update(self) -> None:
+        best = self.ea.best_chromosome_fitness_in_total
+        if best > self.best + self.tolerance:
+            self.best = best
+            self.stagnant = 0
+        else:
+            self.stagnant += 1
+
+    def satisfied(self) -> bool:
+        return self.stagnant >= self.generations
+
+    def state(self) -> dict[str, typing.Any]:
+        return {"best": self.best, "stagnant": self.stagnant}
+
+    def restore(self, state: dict[str, typing.Any]) -> None:
+        self.best = state["best"]
+        self.stagnant = state["stagnant"]
+        super().restore(state)
+
+
+class TimeBudget(StoppingCriterion):
+    """
+    TimeBudget stops when the wall time since creation
+    of the algorithm passes the budget (in seconds). Resumed runs
+    continue with the remaining budget of their checkpoint.
+    """
+
+    def __init__(self, ea: EvolutionaryAlgorithm, seconds: float) -> None:
+        self.seconds = seconds
+        self.start = time.perf_counter()
+        super().__init__(ea)
+
+    def satisfied(self) -> bool:
+        return time.perf_counter() - self.start >= self.seconds
+
+    def state(self) -> dict[str, typing.Any]:
+        # clocks of processes are not comparable, so elapsed time is stored.
+        return {"elapsed": time.perf_counter() - self.start}
+
+    def restore(self, state: dict[str, typing.Any]) -> None:
+        self.start = time.perf_counter() - state["elapsed"]
+        super().restore(state)
+
+
+class EvaluationBudget(StoppingCriterion):
+    """
+    EvaluationBudget stops when the number of fitness
+    evaluations reaches the budget.
+    """
+
+    def __init__(self, ea: EvolutionaryAlgorithm, evaluations: int) -> None:
+        self.evaluations = evaluations
+        super().__init__(ea)
+
+    def satisfied(self) -> bool:
+        return self.ea.fitness_cache.misses >= self.evaluations
+
+
+class TargetFitness(StoppingCriterion):
+    def __init__(self, ea: EvolutionaryAlgorithm, target: float) -> None:
+        self.target = target
+        super().__init__(ea)
+
+    def satisfied(self) -> bool:
+        return self.ea.best_chromosome_fitness_in_total >= self.target
+
+
+class DiversityCollapse(StoppingCriterion):
+    """
+    DiversityCollapse stops when the ratio of distinct genomes (by their
+    fingerprints) in the population is at most the threshold.
+    """
+
+    def __init__(self, ea: EvolutionaryAlgorithm, threshold: float = 0.1) -> None:
+        self.threshold = threshold
+        self.diversity = 1.0
+        super().__init__(ea)
+
+    def update(self) -> None:
+        population = self.ea.population
+        if len(population) == 0:
+            return
+        self.diversity = unique_ratio(
+            population.fingerprints(np.arange(len(population))),
+        )
+
+    def satisfied(self) -> bool:
+        return self.diversity <= self.threshold
+
+    def state(self) -> dict[str, typing.Any]:
+        return {"diversity": self.diversity}
+
+    def restore(self, state: dict[str, typing.Any]) -> None:
+        self.diversity = state["diversity"]
+        super().restore(state)
+
+
+class _Composite(StoppingCriterion):
+    def __init__(
+        self,
+        ea: EvolutionaryAlgorithm,
+        *criteria: typing.Callable[[EvolutionaryAlgorithm], StoppingCriterion],
+    ) -> None:
+        self.criteria = [criterion(ea) for criterion in criteria]
+        super().__init__(ea)
+
+    def update(self) -> None:
+        # every criterion is updated, because short-circuiting
+        # would miss the statistics of a generation.
+        for criterion in self.criteria:
+            criterion.refresh()
+
+    def state(self) -> dict[str, typing.Any]:
+        return {
+            "criteria": [
+                {"type": type(criterion).__qualname__, "state": criterion.state()}
+                for criterion in self.criteria
+            ],
+        }
+
+    def restore(self, state: dict[str, typing.Any]) -> None:
+        stored = state["criteria"]
+        types = [type(criterion).__qualname__ for criterion in self.criteria]
+        if types != [criterion["type"] for criterion in stored]:
+            msg = f"stopping criteria of the checkpoint are {stored}"
+            raise ValueError(msg)
+        for criterion, criterion_state in zip(self.criteria, stored, strict=True):
+            criterion.restore(criterion_state["state"])
+        super().restore(state)
+
+
+class AnyOf(_Composite):
+    """
+    AnyOf stops when one of its criteria is satisfied.
+    """
+
+    def satisfied(self) -> bool:
+        return any(criterion.satisfied() for criterion in self.criteria)
+
+
+class AllOf(_Composite):
+    """
+    AllOf stops when all of its criteria are satisfied.
+    """
+
+    def satisfied(self) -> bool:
+        return all(criterion.satisfied() for criterion in self.criteria)
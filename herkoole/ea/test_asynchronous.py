@@ -0,0 +1,162 @@
+import asyncio
+import json
+import time
+import typing
+
+import numpy as np
+import pytest
+
+from herkoole import knapsack
+from herkoole.knapsack.model import Chromosome
+
+from .asynchronous import AsyncEvaluator, AsyncEvolutionaryAlgorithm
+from .functions import QTournament, StochasticUniversalSampling
+
+LATENCY = 0.05
+
+
+class Server:
+    """
+    Server is a local stand-in of a fitness service, it receives
+    one batch of genomes per line and answers with their fitness.
+    """
+
+    def __init__(self, model: knapsack.Model, latency: float = LATENCY) -> None:
+        self.model = model
+        self.latency = latency
+        self.requests = 0
+        self.active = 0
+        self.peak = 0
+
+    async def handle(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        self.requests += 1
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            genomes = np.array(json.loads(await reader.readline()), dtype=bool)
+            await asyncio.sleep(self.latency)
+            writer.write(
+                json.dumps(self.model.batch_fitness(genomes).tolist()).encode()
+            )
+            writer.write(b"\n")
+            await writer.drain()
+        finally:
+            self.active -= 1
+            writer.close()
+
+
+class RemoteChromosome(Chromosome):
+    port = 0
+
+    @classmethod
+    async def evaluate_batch_async(
+        cls,
+        chromosomes: typing.Sequence[typing.Any],
+    ) -> list[float]:
+        reader, writer = await asyncio.open_connection("127.0.0.1", cls.port)
+        try:
+            genomes = [np.asarray(c.genes).tolist() for c in chromosomes]
+            writer.write(json.dumps(genomes).encode() + b"\n")
+            await writer.drain()
+            return json.loads(await reader.readline())
+        finally:
+            writer.close()
+            await writer.wait_closed()
+
+
+class RemoteModel(knapsack.Model):
+    def initial_population(
+        self,
+        mu: int,
+        rng: np.random.Generator | None = None,
+    ) -> list[typing.Any]:
+        population = []
+        for _ in range(mu):
+            chromosome = RemoteChromosome(self)
+            chromosome.random(rng)
+            population.append(chromosome)
+        return population
+
+
+def _algorithm(
+    model: knapsack.Model,
+    async_evaluator: typing.Callable[..., AsyncEvaluator] | None = None,
+    *,
+    vectorized: bool = False,
+) -> AsyncEvolutionaryAlgorithm:
+    return AsyncEvolutionaryAlgorithm(
+        10,
+        20,
+        3,
+        model,
+        parent_selector=StochasticUniversalSampling.new(),
+        remaining_population_selector=QTournament.new(q=2),
+        threshold=0,
+        fitness_cache_size=100,
+        vectorized=vectorized,
+        async_evaluator=async_evaluator,
+    )
+
+
+def test_async_evolutionary_algorithm() -> None:
+    model = RemoteModel(np.arange(1, 51), np.arange(50, 0, -1), 400)
+    server = Server(model)
+
+    async def run(
+        async_evaluator: typing.Callable[..., AsyncEvaluator],
+    ) -> tuple[AsyncEvolutionaryAlgorithm, float]:
+        listener = await asyncio.start_server(server.handle, "127.0.0.1", 0)
+        RemoteChromosome.port = listener.sockets[0].getsockname()[1]
+        async with listener:
+            ea = _algorithm(model, async_evaluator)
+            start = time.perf_counter()
+            answer = await ea.run_async()
+            elapsed = time.perf_counter() - start
+        # the answer fitness is the one that service calculated.
+        assert (
+            answer.fitness() == model.batch_fitness(np.asarray(answer.genes)[None])[0]
+        )
+        return ea, elapsed
+
+    ea, elapsed = asyncio.run(run(AsyncEvaluator.new(concurrency=4)))
+    assert ea.generation_counter == 4
+    assert server.requests == ea.fitness_cache.misses
+    assert 1 < server.peak <= 4
+    # requests of a generation are concurrent, so the run is faster
+    # than sending them one by one.
+    assert elapsed < server.requests * LATENCY
+
+    server.requests, server.peak = 0, 0
+    ea, _ = asyncio.run(
+        run(AsyncEvaluator.new(concurrency=4, batch_size=8)),
+    )
+    # population and children of each generation are sent in batches.
+    assert server.requests < ea.fitness_cache.misses
+
+
+def test_async_evaluator_timeout() -> None:
+    model = RemoteModel(np.arange(1, 11), np.arange(10, 0, -1), 20)
+    server = Server(model, latency=1)
+
+    async def run() -> None:
+        listener = await asyncio.start_server(server.handle, "127.0.0.1", 0)
+        RemoteChromosome.port = listener.sockets[0].getsockname()[1]
+        async with listener:
+            ea = _algorithm(model, AsyncEvaluator.new(timeout=0.05))
+            await ea.run_async()
+
+    with pytest.raises(TimeoutError):
+        asyncio.run(run())
+
+
+def test_async_evaluation_of_local_chromosomes() -> None:
+    # chromosomes without an async protocol are evaluated synchronously.
+    model = knapsack.Model(np.arange(1, 21), np.arange(20, 0, -1), 100)
+    for vectorized in (False, True):
+        ea = _algorithm(model, vectorized=vectorized)
+        answer = ea.run()
+        assert answer.fitness() == ea.best_chromosome_fitness_in_total
@@ -0,0 +1,91 @@
+import pathlib
+
+import numpy as np
+
+from herkoole.knapsack import Model
+
+from .checkpoint import Checkpoint, load_checkpoint
+from .evolutionary_algorithm import EvolutionaryAlgorithm
+from .functions import QTournament, StochasticUniversalSampling
+from .stopping import AnyOf, MaxGenerations, Stagnation, TimeBudget
+
+
+def test_resume(tmp_path: pathlib.Path) -> None:
+    m = Model(np.arange(1, 51), np.arange(50, 0, -1), 400)
+
+    def ea(
+        generations: int,
+        *,
+        vectorized: bool,
+        seed: int | None = None,
+    ) -> EvolutionaryAlgorithm:
+        return EvolutionaryAlgorithm(
+            10,
+            20,
+            generations,
+            m,
+            parent_selector=StochasticUniversalSampling.new(),
+            remaining_population_selector=QTournament.new(q=2),
+            threshold=0,
+            vectorized=vectorized,
+            observers=[Checkpoint.new(tmp_path / "run.npz", interval=5)],
+            seed=seed,
+        )
+
+    for vectorized in (False, True):
+        expected = ea(20, vectorized=vectorized, seed=7)
+        expected_answer = expected.run()
+
+        ea(9, vectorized=vectorized, seed=7).run()
+
+        # the last checkpoint is written at the end of the interrupted run.
+        resumed = ea(20, vectorized=vectorized)
+        load_checkpoint(resumed, tmp_path / "run.npz")
+        assert resumed.generation_counter == 10
+        answer = resumed.run()
+
+        assert resumed.generation_counter == expected.generation_counter
+        assert resumed.average_fitness == expected.average_fitness
+        assert answer.fitness() == expected_answer.fitness()
+
+
+def test_resume_stopping_criterion(tmp_path: pathlib.Path) -> None:
+    m = Model(np.arange(1, 21), np.arange(20, 0, -1), 100)
+
+    def ea(generations: int, seed: int | None = None) -> EvolutionaryAlgorithm:
+        return EvolutionaryAlgorithm(
+            10,
+            20,
+            generations,
+            m,
+            parent_selector=StochasticUniversalSampling.new(),
+            remaining_population_selector=QTournament.new(q=2),
+            threshold=0,
+            observers=[Checkpoint.new(tmp_path / "run.npz", interval=1)],
+            stopping_criterion=AnyOf.new(
+                MaxGenerations.new(generations),
+                Stagnation.new(8),
+                TimeBudget.new(600),
+            ),
+            seed=seed,
+        )
+
+    expected = ea(200, seed=11)
+    expected.run()
+    assert expected.generation_counter < 200
+
+    # interrupted while the best fitness stagnates.
+    ea(expected.generation_counter - 3, seed=11).run()
+
+    resumed = ea(200)
+    load_checkpoint(resumed, tmp_path / "run.npz")
+    criteria = getattr(resumed.stopping_criterion, "criteria", [])
+    assert criteria[1].stagnant > 0
+    # the time budget continues after the elapsed time of the checkpoint.
+    criteria[2].restore({"elapsed": 600})
+    assert criteria[2].satisfied()
+    criteria[2].restore({"elapsed": 0})
+    resumed.run()
+
+    assert resumed.generation_counter == expected.generation_counter
+    assert resumed.average_fitness == expected.average_fitness
@@ -0,0 +1,111 @@
+import numpy as np
+
+from herkoole.knapsack import Model
+from herkoole.population import ChromosomePopulation
+
+from .diversity import DuplicateIndex, unique_ratio
+from .evolutionary_algorithm import EvolutionaryAlgorithm
+from .functions import (
+    CommaSelection,
+    QTournament,
+    StochasticUniversalSampling,
+    Truncation,
+)
+from .observer import History
+from .steady_state import SteadyStateEvolutionaryAlgorithm
+
+
+def test_duplicate_index() -> None:
+    index = DuplicateIndex([b"a", b"a", b"b"])
+    assert len(index) == 2
+
+    assert np.array_equal(index.unique([b"c", b"a", b"c", b"d"]), [0, 3])
+    assert index.rejected == 2
+
+    # a fingerprint stays while one of its chromosomes is in the population.
+    index.discard(b"a")
+    assert b"a" in index
+    index.discard(b"a")
+    assert b"a" not in index
+    assert index.insert(b"a")
+
+    assert unique_ratio([b"a", b"a", b"b", b"c"]) == 3 / 4
+
+
+def test_eliminate_duplicates() -> None:
+    # a few items, so the population fills with clones without elimination.
+    m = Model(np.arange(1, 9), np.arange(8, 0, -1), 20)
+
+    for vectorized in (False, True):
+        for survivor_selector in (
+            Truncation.new(),
+            QTournament.new(q=2, replace=True),
+            CommaSelection.new(),
+        ):
+            ea = EvolutionaryAlgorithm(
+                10,
+                12,
+                15,
+                m,
+                StochasticUniversalSampling.new(),
+                survivor_selector,
+                threshold=0,
+                vectorized=vectorized,
+                observers=[History.new()],
+                eliminate_duplicates=True,
+                seed=3,
+            )
+            ea.run()
+
+            history = ea.observers[0]
+            assert isinstance(history, History)
+            # survivors of each generation are mu distinct chromosomes.
+            assert len(ea.population) == 10
+            assert all(s.diversity == 1 for s in list(history.statistics)[1:])
+            assert all(0 < s.distance <= 1 for s in history.statistics)
+            assert ea.duplicates.rejected > 0
+
+        ea = SteadyStateEvolutionaryAlgorithm(
+            10,
+            4,
+            15,
+            m,
+            StochasticUniversalSampling.new(),
+            threshold=0,
+            vectorized=vectorized,
+            observers=[History.new()],
+            eliminate_duplicates=True,
+            seed=3,
+        )
+        ea.run()
+
+        history = ea.observers[0]
+        assert isinstance(history, History)
+        # children never add a clone, so only the initial ones are left.
+        diversity = [s.diversity for s in history.statistics]
+        assert all(np.diff(diversity) >= 0)
+        assert diversity[-1] == 1
+
+
+def test_comma_selection_duplicates() -> None:
+    m = Model(np.arange(1, 51), np.arange(50, 0, -1), 400)
+    ea = EvolutionaryAlgorithm(
+        10,
+        12,
+        1,
+        m,
+        StochasticUniversalSampling.new(),
+        CommaSelection.new(),
+        eliminate_duplicates=True,
+        seed=5,
+    )
+    parents = set(ea.population.fingerprints(np.arange(10)))
+
+    # clones of a few children (or fewer than mu children) are dropped,
+    # random chromosomes take their place instead of the parents.
+    distinct = ChromosomePopulation(m.initial_population(3))
+    for children in (distinct.take(np.arange(12) % 3), distinct):
+        survivors = ea.remaining_population_selection(ea.population, children)
+        fingerprints = survivors.fingerprints(np.arange(len(survivors)))
+        assert len(set(fingerprints)) == 10
+        assert not parents & set(fingerprints)
@@ -0,0 +1,85 @@
+import pickle
+import typing
+
+import numpy as np
+
+from herkoole.chromosome import Bits
+from herkoole.knapsack import Model
+from herkoole.knapsack.model import Chromosome as KnapsackChromosome
+from herkoole.population import ArrayPopulation, ChromosomePopulation
+
+from .evaluator import ProcessPoolEvaluator, SerialEvaluator, ThreadPoolEvaluator
+from .evolutionary_algorithm import EvolutionaryAlgorithm
+from .functions import QTournament, StochasticUniversalSampling
+
+
+def test_pool_evaluators() -> None:
+    m = Model(np.arange(1, 51), np.arange(50, 0, -1), 400)
+    ea = EvolutionaryAlgorithm(
+        4,
+        4,
+        1,
+        m,
+        parent_selector=StochasticUniversalSampling.new(),
+        remaining_population_selector=QTournament.new(q=2),
+    )
+
+    chromosomes = m.initial_population(37)
+    expected = np.array([c.evaluate() for c in chromosomes])
+    indices = np.arange(37)
+
+    for evaluator in (
+        SerialEvaluator(ea),
+        ThreadPoolEvaluator(ea, workers=2),
+        ProcessPoolEvaluator(ea, workers=2, chunk_size=5),
+    ):
+        for population in (
+            ChromosomePopulation(chromosomes),
+            ArrayPopulation(m, m.encode(chromosomes)),
+        ):
+            assert np.array_equal(evaluator(population, indices), expected)
+        evaluator.close()
+
+
+class Chromosome(KnapsackChromosome):
+    # fitness of the chromosome is not the model batch fitness.
+    def evaluate(self) -> float:
+        return float(sum(self.genes))
+
+
+class ChromosomeModel(Model):
+    # workers decode chromosomes with the model.
+    def chromosome(self, genes: list[typing.Any]) -> Chromosome:
+        chromosome = Chromosome(self)
+        chromosome.genes = Bits.pack(genes)
+        return chromosome
+
+
+def test_chromosome_fitness() -> None:
+    m = ChromosomeModel(np.arange(1, 21), np.arange(20, 0, -1), 100)
+    chromosomes = []
+    for _ in range(13):
+        chromosome = Chromosome(m)
+        chromosome.random()
+        chromosomes.append(chromosome)
+    expected = np.array([float(sum(c.genes)) for c in chromosomes])
+
+    ea = EvolutionaryAlgorithm(
+        4,
+        4,
+        1,
+        m,
+        parent_selector=StochasticUniversalSampling.new(),
+        remaining_population_selector=QTournament.new(q=2),
+    )
+    for evaluator in (
+        ThreadPoolEvaluator(ea, workers=2),
+        ProcessPoolEvaluator(ea, workers=2, chunk_size=3),
+    ):
+        population = ChromosomePopulation(chromosomes)
+        assert np.array_equal(evaluator(population, np.arange(13)), expected)
+        evaluator.close()
+
+    # chunks of worker processes do not carry the model.
+    chunk = ProcessPoolEvaluator(ea).chromosome_chunk(population, np.arange(2))
+    assert len(pickle.dumps(chunk)) < len(pickle.dumps(m))
@@ -0,0 +1,108 @@
+import numpy as np
+import pytest
+
+from herkoole.knapsack import Model
+from herkoole.population import ChromosomePopulation
+
+from .evolutionary_algorithm import EvolutionaryAlgorithm
+from .functions import (
+    CommaSelection,
+    Elitism,
+    QTournament,
+    RankSelection,
+    RouletteWheel,
+    StochasticUniversalSampling,
+    Truncation,
+    sample_without_replacement,
+)
+
+
+def ea(mu: int, y: int) -> EvolutionaryAlgorithm:
+    return EvolutionaryAlgorithm(
+        mu,
+        y,
+        1,
+        Model([1, 2], [2, 1], 2),
+        parent_selector=StochasticUniversalSampling.new(),
+        remaining_population_selector=QTournament.new(q=2),
+    )
+
+
+def test_stochastic_universal_sampling() -> None:
+    probs = np.array([0.5, 0.25, 0.125, 0.125])
+    selector = StochasticUniversalSampling(ea(4, 1000))
+
+    for _ in range(10):
+        counts = np.bincount(selector(probs), minlength=4)
+        # each item is selected floor or ceil of its expected count.
+        assert np.all(np.abs(counts - probs * 1000) <= 1)
+
+
+def test_proportional_selectors() -> None:
+    probs = np.array([0.0, 0.7, 0.0, 0.3])
+
+    for selector in (
+        RouletteWheel(ea(4, 1000)),
+        RankSelection(ea(4, 1000), pressure=2),
+    ):
+        indices = selector(probs)
+        assert indices.shape == (1000,)
+        assert set(indices.tolist()) <= {0, 1, 2, 3}
+
+    assert set(RouletteWheel(ea(4, 100))(probs).tolist()) <= {1, 3}
+    # the worst item has zero probability with the maximum pressure.
+    assert 0 not in RankSelection(ea(4, 100), pressure=2)(probs).tolist()
+
+
+def test_q_tournament() -> None:
+    items = ChromosomePopulation(Model([1, 2], [2, 1], 2).initial_population(4))
+    probs = np.array([0.1, 0.4, 0.2, 0.3])
+
+    indices = QTournament(ea(1000, 1), q=4)(items, probs)
+    assert np.all(indices == 1)
+
+    indices = QTournament(ea(1000, 1), q=2)(items, probs)
+    # the worst item never wins a tournament without replacement.
+    assert set(indices.tolist()) == {1, 2, 3}
+
+    indices = QTournament(ea(1000, 1), q=2, replace=True)(items, probs)
+    assert set(indices.tolist()) == {0, 1, 2, 3}
+
+
+def test_sample_without_replacement() -> None:
+    rng = np.random.default_rng(0)
+    samples = sample_without_replacement(10, 1000, 10, rng)
+    assert np.all(np.sort(samples, axis=1) == np.arange(10))
+
+    samples = sample_without_replacement(10, 10000, 3, rng)
+    assert np.all(np.sort(samples, axis=1)[:, 1:] != np.sort(samples, axis=1)[:, :-1])
+    assert np.all(np.abs(np.bincount(samples.ravel()) - 3000) < 300)
+
+
+def test_survivor_selection() -> None:
+    algorithm = ea(2, 3)
+    items = ChromosomePopulation(Model([1, 2], [2, 1], 2).initial_population(5))
+    probs = np.array([0.3, 0.1, 0.25, 0.05, 0.3])
+
+    assert sorted(Truncation(algorithm)(items, probs).tolist()) == [0, 4]
+    # parents are never selected by (mu, lambda).
+    assert sorted(CommaSelection(algorithm)(items, probs, 2).tolist()) == [2, 4]
+    with pytest.raises(ValueError, match="at least mu children"):
+        CommaSelection(algorithm)(items, probs, 4)
+    with pytest.raises(ValueError, match="first child"):
+        CommaSelection(algorithm)(items, probs)
+
+    for _ in range(10):
+        selected = Elitism(algorithm, QTournament.new(q=2, replace=True), elites=1)(
+            items,
+            probs,
+        )
+        assert len(selected) == 2
+        assert selected[0] in {0, 4}
+
+    # elites are not selected again by the inner selector.
+    selected = Elitism(algorithm, Truncation.new(), elites=1)(items, probs)
+    assert sorted(selected.tolist()) == [0, 4]
+    selected = Elitism(algorithm, CommaSelection.new(), elites=1)(items, probs, 2)
+    assert selected[0] in {0, 4}
+    assert selected[1] in {2, 4} - {selected[0]}
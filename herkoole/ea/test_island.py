@@ -0,0 +1,112 @@
+import functools
+import os
+import pathlib
+
+import numpy as np
+import pytest
+
+from herkoole.knapsack import Model
+
+from .checkpoint import Checkpoint
+from .evolutionary_algorithm import EvolutionaryAlgorithm
+from .functions import QTournament, StochasticUniversalSampling
+from .island import FullyConnected, IslandModel, MigrationPolicy, RandomTopology
+
+
+def island(q: int) -> EvolutionaryAlgorithm:
+    return EvolutionaryAlgorithm(
+        10,
+        20,
+        12,
+        Model(np.arange(1, 21), np.arange(20, 0, -1), 60),
+        parent_selector=StochasticUniversalSampling.new(),
+        remaining_population_selector=QTournament.new(q=q),
+        window_size=100,
+    )
+
+
+def test_island_model() -> None:
+    islands = IslandModel(
+        [functools.partial(island, q) for q in (2, 3, 4)],
+        migration_interval=3,
+        topology=FullyConnected(),
+        policy=MigrationPolicy(size=2),
+    )
+
+    answer = islands.run()
+
+    assert len(islands.statistics) == 3
+    for i, statistics in enumerate(islands.statistics):
+        assert statistics.island == i
+        assert statistics.generations == 13
+        assert statistics.emigrants == 4 * 2 * 2
+        assert statistics.best_fitness <= answer.fitness()
+    assert answer.fitness() == max(s.best_fitness for s in islands.statistics)
+
+
+def failing_island() -> EvolutionaryAlgorithm:
+    msg = "broken island"
+    raise ValueError(msg)
+
+
+def test_island_failure() -> None:
+    islands = IslandModel(
+        [functools.partial(island, 2), failing_island],
+        migration_interval=3,
+        poll_interval=0.1,
+    )
+
+    with pytest.raises(RuntimeError, match="island 1 failed") as error:
+        islands.run()
+    assert isinstance(error.value.__cause__, ValueError)
+
+
+def dying_island() -> EvolutionaryAlgorithm:
+    os._exit(3)
+
+
+def test_lost_island() -> None:
+    islands = IslandModel([dying_island], poll_interval=0.1)
+
+    with pytest.raises(RuntimeError, match="exited with code 3"):
+        islands.run()
+
+
+def checkpoint_island(path: pathlib.Path) -> EvolutionaryAlgorithm:
+    return EvolutionaryAlgorithm(
+        10,
+        20,
+        4,
+        Model(np.arange(1, 21), np.arange(20, 0, -1), 60),
+        parent_selector=StochasticUniversalSampling.new(),
+        remaining_population_selector=QTournament.new(q=2),
+        observers=[Checkpoint.new(path, interval=100)],
+    )
+
+
+def test_island_observers(tmp_path: pathlib.Path) -> None:
+    paths = [tmp_path / f"island-{i}.npz" for i in range(2)]
+    islands = IslandModel(
+        [functools.partial(checkpoint_island, path) for path in paths],
+        migration_interval=2,
+    )
+    islands.run()
+
+    # the run end is written although no interval has passed.
+    assert all(path.exists() for path in paths)
+
+
+def test_migration_generator() -> None:
+    policy = MigrationPolicy(size=3, emigrants="random", replace="random")
+    topology = RandomTopology(k=2)
+    fitness = np.arange(20, dtype=np.float64)
+
+    draws = [
+        (
+            topology.neighbours(0, 8, generator),
+            policy.select_emigrants(fitness, generator).tolist(),
+            policy.select_replaced(fitness, 3, generator).tolist(),
+        )
+        for generator in (np.random.default_rng(4), np.random.default_rng(4))
+    ]
+    assert draws[0] == draws[1]
@@ -0,0 +1,109 @@
+import types
+import typing
+
+import numpy as np
+
+from herkoole.knapsack import Model as KnapsackModel
+from herkoole.tsp import City
+from herkoole.tsp import Model as TSPModel
+
+from .evolutionary_algorithm import EvolutionaryAlgorithm
+from .functions import QTournament, StochasticUniversalSampling
+from .mutation import (
+    BitFlip,
+    Insert,
+    Inversion,
+    Mutation,
+    OneFifthRule,
+    Scramble,
+    Swap,
+    bernoulli_positions,
+)
+
+# operators only spawn their generator from the algorithm.
+EA = typing.cast(
+    "EvolutionaryAlgorithm",
+    types.SimpleNamespace(spawn=lambda: np.random.default_rng(0)),
+)
+
+
+def test_bernoulli_positions() -> None:
+    rng = np.random.default_rng(0)
+    positions = bernoulli_positions(1_000_000, 0.01, rng)
+    assert np.all(np.diff(positions) > 0)
+    assert positions[0] >= 0
+    assert positions[-1] < 1_000_000
+    # the number of successes is binomial(1e6, 0.01) (sd is about 100).
+    assert abs(len(positions) - 10_000) < 600
+
+    assert len(bernoulli_positions(100, 0, rng)) == 0
+    assert np.array_equal(bernoulli_positions(5, 1, rng), np.arange(5))
+
+
+def test_bit_flip() -> None:
+    genomes = np.zeros((200, 500), dtype=np.bool_)
+    rows = BitFlip(EA, 0.02).mutate(genomes)
+
+    # about 10 genes of each genome are flipped.
+    assert abs(genomes.sum(axis=1).mean() - 10) < 1
+    assert np.array_equal(rows, np.flatnonzero(genomes.any(axis=1)))
+
+
+def test_permutation_operators() -> None:
+    operators: list[Mutation] = [
+        Swap(EA, 0.1),
+        Inversion(EA, 1),
+        Scramble(EA, 1),
+        Insert(EA, 1),
+    ]
+    for operator in operators:
+        genomes = np.tile(np.arange(30, dtype=np.int32), (100, 1))
+        rows = operator.mutate(genomes)
+
+        assert len(rows) > 0
+        # children are still permutations and only mutated rows change.
+        assert np.array_equal(
+            np.sort(genomes, axis=1), np.tile(np.arange(30), (100, 1))
+        )
+        changed = np.flatnonzero((genomes != np.arange(30)).any(axis=1))
+        assert set(changed) <= set(rows)
+
+    # inversion reverses one segment.
+    genomes = np.tile(np.arange(10), (50, 1))
+    Inversion(EA, 1).mutate(genomes)
+    for genome in genomes:
+        (changed,) = np.nonzero(genome != np.arange(10))
+        segment = genome[changed.min() : changed.max() + 1]
+        assert np.array_equal(
+            segment, np.arange(changed.min(), changed.max() + 1)[::-1]
+        )
+
+
+def test_mutation_in_evolutionary_algorithm() -> None:
+    knapsack = KnapsackModel(np.arange(1, 51), np.arange(50, 0, -1), 400)
+    tsp = TSPModel([City(i, i % 7, i // 7) for i in range(30)])
+
+    for model, mutation in (
+        (knapsack, BitFlip.new()),
+        (knapsack, OneFifthRule.new(BitFlip.new(), rate=0.05)),
+        (tsp, Inversion.new(0.5)),
+        (tsp, OneFifthRule.new(Swap.new())),
+    ):
+        for vectorized in (False, True):
+            ea = EvolutionaryAlgorithm(
+                10,
+                20,
+                10,
+                model,
+                parent_selector=StochasticUniversalSampling.new(),
+                remaining_population_selector=QTournament.new(q=2),
+                threshold=0,
+                vectorized=vectorized,
+                mutation=mutation,
+            )
+            answer = ea.run()
+            assert answer.fitness() == ea.best_chromosome_fitness_in_total
+
+            if isinstance(ea.mutation, OneFifthRule):
+                assert ea.mutation.rate is not None
+                assert ea.mutation.minimum <= ea.mutation.rate <= ea.mutation.maximum
@@ -0,0 +1,80 @@
+import csv
+import json
+import pathlib
+
+import numpy as np
+
+from herkoole.knapsack import Model
+
+from .evolutionary_algorithm import EvolutionaryAlgorithm
+from .functions import QTournament, StochasticUniversalSampling
+from .observer import PHASES, CSVWriter, History, JSONLinesWriter, Observer
+
+
+class Counter(Observer):
+    def __init__(self, ea: EvolutionaryAlgorithm) -> None:
+        self.calls: dict[str, int] = {}
+        super().__init__(ea)
+
+    def count(self, hook: str) -> None:
+        self.calls[hook] = self.calls.get(hook, 0) + 1
+
+    def generation_start(self, generation: int) -> None:  # noqa: ARG002
+        self.count("generation_start")
+
+    def variation(self, parents, children) -> None:  # noqa: ANN001, ARG002
+        self.count("variation")
+
+    def close(self) -> None:
+        self.count("close")
+
+
+def test_observers(tmp_path: pathlib.Path) -> None:
+    m = Model(np.arange(1, 51), np.arange(50, 0, -1), 400)
+    ea = EvolutionaryAlgorithm(
+        10,
+        20,
+        5,
+        m,
+        parent_selector=StochasticUniversalSampling.new(),
+        remaining_population_selector=QTournament.new(q=2),
+        threshold=0,
+        observers=[
+            History.new(maxlen=3),
+            JSONLinesWriter.new(tmp_path / "run.jsonl"),
+            CSVWriter.new(tmp_path / "run.csv"),
+            Counter,
+        ],
+    )
+    ea.run()
+
+    history, _, _, counter = ea.observers
+    assert isinstance(history, History)
+    assert isinstance(counter, Counter)
+
+    generations = ea.generation_counter
+    assert counter.calls == {
+        "generation_start": generations,
+        "variation": generations,
+        "close": 1,
+    }
+
+    assert [s.generation for s in history.statistics] == list(
+        range(generations - 3, generations),
+    )
+    for statistics in history.statistics:
+        assert statistics.best >= statistics.mean
+        assert 0 < statistics.diversity <= 1
+        assert statistics.evaluations <= 20
+        assert set(statistics.timings) == set(PHASES)
+
+    lines = (tmp_path / "run.jsonl").read_text().splitlines()
+    assert len(lines) == generations
+    records = [json.loads(line) for line in lines]
+    # children fitness may be derived from their parents (delta evaluation).
+    assert 10 <= records[0]["evaluations"] <= 30
+    assert records[-1]["total_evaluations"] == ea.fitness_cache.misses
+
+    with (tmp_path / "run.csv").open() as f:
+        rows = list(csv.DictReader(f))
+    assert [float(row["mean"]) for row in rows] == ea.average_fitness
@@ -0,0 +1,92 @@
+import types
+
+import numpy as np
+
+from herkoole.knapsack import Model
+
+from .functions import StochasticUniversalSampling, TournamentSelection
+from .mutation import BitFlip
+from .observer import History
+from .steady_state import (
+    ReplaceTournamentLoser,
+    ReplaceWorst,
+    SteadyStateEvolutionaryAlgorithm,
+)
+
+
+def test_steady_state() -> None:
+    m = Model(np.arange(1, 51), np.arange(50, 0, -1), 400)
+
+    for vectorized in (False, True):
+        for replacement in (ReplaceWorst.new(), ReplaceTournamentLoser.new(q=3)):
+            ea = SteadyStateEvolutionaryAlgorithm(
+                20,
+                2,
+                10,
+                m,
+                StochasticUniversalSampling.new(),
+                replacement,
+                threshold=0,
+                vectorized=vectorized,
+                observers=[History.new()],
+            )
+            worst = -np.inf
+            while True:
+                ea.step()
+                fitnesses = ea.fitness(ea.population)
+                assert len(fitnesses) == 20
+                # the worst chromosome is replaced only by a better child.
+                if isinstance(ea.replacement, ReplaceWorst):
+                    assert fitnesses.min() >= worst
+                    worst = fitnesses.min()
+                if ea.stop_condition():
+                    break
+
+            answer = ea.get_answer()
+            assert answer.fitness() == ea.best_chromosome_fitness_in_total
+            assert answer.fitness() >= fitnesses.max()
+            assert ea.generation_counter == 11
+
+            history = ea.observers[0]
+            assert isinstance(history, History)
+            assert len(history.statistics) == 11
+            # each generation creates (about) mu children.
+            assert all(s.evaluations <= 20 for s in list(history.statistics)[1:])
+
+
+def test_replace_worst() -> None:
+    rng = np.random.default_rng(0)
+    fitnesses = rng.random(50)
+    ea = types.SimpleNamespace(spawn=lambda: rng)
+    replacement = ReplaceWorst(ea, always=True)  # type: ignore[arg-type]
+    replacement.reset(fitnesses)
+
+    for value in rng.random(100):
+        index = replacement(float(value))
+        assert index is not None
+        assert fitnesses[index] == fitnesses.min()
+        fitnesses[index] = value
+        replacement.replaced(index, float(value))
+
+
+def test_single_child() -> None:
+    m = Model(np.arange(1, 51), np.arange(50, 0, -1), 400)
+
+    for vectorized in (False, True):
+        for selector in (StochasticUniversalSampling.new(), TournamentSelection.new()):
+            for mutation in (None, BitFlip.new()):
+                ea = SteadyStateEvolutionaryAlgorithm(
+                    20,
+                    1,
+                    10,
+                    m,
+                    selector,
+                    threshold=0,
+                    vectorized=vectorized,
+                    mutation=mutation,
+                    seed=1,
+                )
+                ea.run()
+
+                # each iteration creates one child which replaces the worst.
+                assert ea.average_fitness[-1] > ea.average_fitness[0]
@@ -0,0 +1,69 @@
+import typing
+
+import numpy as np
+
+from herkoole.knapsack import Model
+
+from .evolutionary_algorithm import EvolutionaryAlgorithm
+from .functions import QTournament, StochasticUniversalSampling
+from .stopping import (
+    AllOf,
+    AnyOf,
+    DiversityCollapse,
+    EvaluationBudget,
+    MaxGenerations,
+    Stagnation,
+    StoppingCriterion,
+    TargetFitness,
+    WindowStatistics,
+)
+
+
+def test_window_statistics() -> None:
+    values = np.random.random(50) * 100
+    statistics = WindowStatistics(7)
+
+    for i, value in enumerate(values):
+        statistics.push(float(value))
+        window = values[max(0, i - 6) : i + 1]
+        assert len(statistics) == len(window)
+        assert np.isclose(statistics.mean, np.mean(window))
+        assert np.isclose(statistics.variance, np.var(window))
+
+
+def test_stopping_criteria() -> None:
+    m = Model(np.arange(1, 51), np.arange(50, 0, -1), 400)
+
+    def run(
+        criterion: "typing.Callable[[EvolutionaryAlgorithm], StoppingCriterion]",
+        *,
+        vectorized: bool = False,
+    ) -> EvolutionaryAlgorithm:
+        ea = EvolutionaryAlgorithm(
+            10,
+            20,
+            1000,
+            m,
+            parent_selector=StochasticUniversalSampling.new(),
+            remaining_population_selector=QTournament.new(q=2),
+            stopping_criterion=AnyOf.new(MaxGenerations.new(200), criterion),
+            vectorized=vectorized,
+        )
+        ea.run()
+        return ea
+
+    # vectorized populations evaluate all children (no delta evaluation).
+    ea = run(EvaluationBudget.new(100), vectorized=True)
+    assert 100 <= ea.fitness_cache.misses < 100 + 20
+
+    ea = run(TargetFitness.new(0))
+    assert ea.generation_counter == 1
+
+    ea = run(Stagnation.new(5))
+    assert ea.generation_counter < 200
+
+    ea = run(AllOf.new(MaxGenerations.new(3), MaxGenerations.new(6)))
+    assert ea.generation_counter == 7
+
+    ea = run(DiversityCollapse.new(1))
+    assert ea.generation_counter == 1
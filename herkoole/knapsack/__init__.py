@@ -1 +1,3 @@
+from .loader import load as load
 from .model import Model as Model
+from .repair import Repair as Repair
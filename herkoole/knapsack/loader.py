@@ -0,0 +1,61 @@
+"""
+Loader of knapsack instances with the following format:
+
+    <number of items> <knapsack capacity>
+    <item value> <item weight>
+    ...
+"""
+
+from __future__ import annotations
+
+import typing
+
+import numpy as np
+
+from herkoole.model import load_array
+
+from .model import Model
+
+if typing.TYPE_CHECKING:
+    import pathlib
+
+    import numpy.typing as npt
+
+    from .model import Seeding
+
+
+def parse(path: pathlib.Path) -> npt.NDArray[np.int64]:
+    """
+    returns the instance as a (items + 1 x 2) matrix, the first row is
+    the header (number of items and capacity) and others are items.
+    """
+    data = np.loadtxt(path, dtype=np.int64, ndmin=2)
+    if data.shape[1] != 2 or len(data) == 0:  # noqa: PLR2004
+        msg = f"{path} is not a knapsack instance"
+        raise ValueError(msg)
+
+    items = int(data[0, 0])
+    if len(data) - 1 < items:
+        msg = f"{path} has {len(data) - 1} items instead of {items}"
+        raise ValueError(msg)
+
+    return data[: items + 1]
+
+
+def load(
+    path: str | pathlib.Path,
+    *,
+    cache: bool = True,
+    seeding: Seeding = "random",
+) -> Model:
+    """
+    reads a problem instance from a given file.
+    """
+    data = load_array(path, parse, cache=cache)
+
+    return Model(
+        weights=data[1:, 1],
+        values=data[1:, 0],
+        max_weight=int(data[0, 1]),
+        seeding=seeding,
+    )
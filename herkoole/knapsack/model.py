@@ -9,62 +9,239 @@ and the total value is as large as possible
 
 from __future__ import annotations
 
-import random
+import typing
+
+import numpy as np
+import numpy.typing as npt
 
 import herkoole.chromosome
 import herkoole.model
+from herkoole.chromosome import Bits
+from herkoole.rng import generator
+
+type Seeding = typing.Literal["random", "greedy", "randomized_greedy"]
 
 
 class Model(herkoole.model.Model):
+    """
+    Model of a knapsack instance. The initial population is random by
+    default, greedy seeding starts from one greedy solution and
+    randomized greedy solutions (which items are picked by their
+    value per weight ratio with a random noise).
+    """
+
+    genome_dtype = np.bool_
+
     def __init__(
         self,
-        weights: list[int],
-        values: list[int],
+        weights: npt.ArrayLike,
+        values: npt.ArrayLike,
         max_weight: int,
+        seeding: Seeding = "random",
     ) -> None:
-        self.weights = weights
-        self.values = values
+        self.weights: npt.NDArray[np.int64] = np.asarray(weights, dtype=np.int64)
+        self.values: npt.NDArray[np.int64] = np.asarray(values, dtype=np.int64)
         self.max_weight = max_weight
-        if len(self.weights) != len(self.values):
+        if self.weights.shape != self.values.shape:
             raise ValueError
         self.length: int = len(self.weights)
+        self.seeding = seeding
+
+        # value per weight of the items, items without weight come last.
+        self.ratios: npt.NDArray[np.float64] = np.divide(
+            self.values,
+            self.weights,
+            out=np.full(self.length, np.inf),
+            where=self.weights > 0,
+        )
+        # items by ascending ratio, repair drops items from the start.
+        self.order: npt.NDArray[np.intp] = np.argsort(self.ratios, kind="stable")
+
+    def initial_population(
+        self,
+        mu: int,
+        rng: np.random.Generator | None = None,
+    ) -> list[herkoole.chromosome.Chromosome]:
+        if self.seeding != "random":
+            return [self.decode(genome) for genome in self.initial_genomes(mu, rng)]
 
-    def initial_population(self, mu: int) -> list[herkoole.chromosome.Chromosome]:
         population: list[herkoole.chromosome.Chromosome] = []
 
         for _ in range(mu):
             chromosome = Chromosome(self)
-            chromosome.random()
+            chromosome.random(rng)
             population.append(chromosome)
 
         return population
 
+    def initial_genomes(
+        self,
+        mu: int,
+        rng: np.random.Generator | None = None,
+    ) -> npt.NDArray[np.bool_]:
+        if self.seeding == "random":
+            return super().initial_genomes(mu, rng)
+
+        # ratios are perturbed, so each genome picks different items.
+        noise = generator(rng).lognormal(0, 0.5, size=(mu, self.length))
+        keys = self.ratios * noise
+        if self.seeding == "greedy" and mu > 0:
+            keys[0] = self.ratios
+        orders = np.argsort(-keys, axis=1, kind="stable")
+
+        genomes = np.zeros((mu, self.length), dtype=np.bool_)
+        self.fill(genomes, orders)
+        return genomes
+
+    def fill(
+        self,
+        genomes: npt.NDArray[np.bool_],
+        orders: npt.NDArray[np.intp],
+    ) -> None:
+        """
+        picks the items of each genome in its order (row of orders)
+        when they fit in the knapsack, genomes are changed in place.
+        """
+        rows = np.arange(len(genomes))
+        total_weight = genomes @ self.weights
+        for items in orders.T:
+            fits = ~genomes[rows, items] & (
+                total_weight + self.weights[items] <= self.max_weight
+            )
+            genomes[rows, items] |= fits
+            total_weight += np.where(fits, self.weights[items], 0)
+
+    def fingerprints(self, genomes: npt.NDArray[np.bool_]) -> list[bytes]:
+        """
+        returns the packed bits of each genome, they are as short
+        as a hash and two genomes never have the same bits.
+        """
+        packed = np.packbits(genomes, axis=1, bitorder="little")
+        return [row.tobytes() for row in packed]
+
+    def repair(
+        self,
+        genomes: npt.NDArray[np.bool_],
+        *,
+        fill: bool = False,
+    ) -> npt.NDArray[np.intp]:
+        """
+        drops items of the overweight genomes by ascending value per weight
+        until they fit, then (with fill) picks the items which still fit by
+        descending ratio. Genomes are changed in place and indices of the
+        changed ones are returned.
+        """
+        total_weight = genomes @ self.weights
+        rows = np.flatnonzero(total_weight > self.max_weight)
+
+        if len(rows) > 0:
+            picked = genomes[rows][:, self.order]
+            weights = picked * self.weights[self.order]
+            # an item is dropped while the weight of the items after
+            # it (and itself) is more than the capacity.
+            remaining = total_weight[rows, np.newaxis] - (
+                np.cumsum(weights, axis=1) - weights
+            )
+            picked &= remaining <= self.max_weight
+            genomes[rows[:, np.newaxis], self.order] = picked
+
+        if not fill:
+            return rows
+
+        before = genomes.copy()
+        self.fill(genomes, np.broadcast_to(self.order[::-1], genomes.shape))
+        return np.union1d(rows, np.flatnonzero((genomes != before).any(axis=1)))
+
+    def totals(
+        self,
+        genomes: npt.NDArray[np.bool_],
+    ) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]:
+        """
+        returns total weight and total value of each item selection (row)
+        in the (population x items) selection matrix.
+        """
+        return genomes @ self.weights, genomes @ self.values
+
+    def batch_fitness(self, genomes: npt.NDArray[np.bool_]) -> npt.NDArray[np.float64]:
+        return self.penalize(*self.totals(genomes))
+
+    def penalize(
+        self,
+        total_weight: npt.NDArray[np.int64],
+        total_value: npt.NDArray[np.int64],
+    ) -> npt.NDArray[np.float64]:
+        """
+        returns fitness of item selections with the given totals.
+        """
+        fitness = np.asarray(total_value, dtype=np.float64)
+
+        # reduce the fitnees to make sure we don't passes
+        # the constraints. overweight selections without
+        # value keep zero instead of an infinite fitness.
+        overweight = (total_weight > self.max_weight) & (fitness > 0)
+        np.divide(1, fitness, out=fitness, where=overweight)
+
+        return fitness
+
+    def chromosome(self, genes: list[typing.Any]) -> Chromosome:
+        chromosome = Chromosome(self)
+        chromosome.genes = Bits.pack(genes)
+        return chromosome
+
+    def batch_mutate(
+        self,
+        genomes: npt.NDArray[np.bool_],
+        prob: float,
+        rng: np.random.Generator | None = None,
+    ) -> None:
+        rng = generator(rng)
+        rows = np.flatnonzero(rng.random(len(genomes)) < prob)
+        cols = rng.integers(self.length, size=len(rows))
+        genomes[rows, cols] = ~genomes[rows, cols]
+
+    def batch_crossover(
+        self,
+        parents1: npt.NDArray[np.bool_],
+        parents2: npt.NDArray[np.bool_],
+        prob: float,
+        rng: np.random.Generator | None = None,
+    ) -> tuple[npt.NDArray[np.bool_], npt.NDArray[np.bool_]]:
+        rng = generator(rng)
+        pairs = len(parents1)
+
+        # one point crossover, genes before the cut point come from the
+        # first parent. pairs without crossover keep their parents genes.
+        cuts = rng.integers(self.length, size=pairs)
+        mask = np.arange(self.length) < cuts[:, np.newaxis]
+        mask[rng.random(pairs) >= prob] = True
+
+        return np.where(mask, parents1, parents2), np.where(mask, parents2, parents1)
+
 
 class Chromosome(herkoole.chromosome.Chromosome[bool]):
     """
     Chromosome represents a one solution for knapsack problem which shows
     an item selection. Each gens coresponds into an item which is picked
     or not.
+
+    Genes are packed into bits, so a chromosome needs one byte
+    for every eight items.
     """
 
+    __slots__ = ("model",)
+
     def __init__(self, model: Model) -> None:
         self.model = model
         super().__init__()
+        self.genes: Bits = Bits.zeros(model.length)
 
     def __str__(self) -> str:
-        total_weight = 0
-        total_value = 0
-
-        for i, gene in enumerate(self.genes):
-            if gene is True:
-                total_weight += self.model.weights[i]
-                total_value += self.model.values[i]
+        genome = self.genome()
+        total_weight, total_value = self.model.totals(genome)
 
         genes = "\n".join(
-            f"\t - {i}: weight: {self.model.weights[i]}"
-            f", value: {self.model.values[i]}"
-            for i, gene in enumerate(self.genes)
-            if gene is True
+            f"\t - {i}: weight: {self.model.weights[i]}, value: {self.model.values[i]}"
+            for i in np.flatnonzero(genome)
         )
         return (
             f"weight: {total_weight}, "
@@ -72,36 +249,52 @@ class Chromosome(herkoole.chromosome.Chromosome[bool]):
             f"genes:\n{genes}"
         )
 
-    def random(self) -> None:
+    def random(self, rng: np.random.Generator | None = None) -> None:
         """
         set values for gens randomly
         """
-        for _ in range(self.model.length):
-            self.genes.append(random.randint(0, 1) == 1)
+        self.genes = Bits.random(self.model.length, rng)
 
-    def fitness(self) -> float:
-        total_weight = 0
-        total_value = 0
+    def genome(self) -> npt.NDArray[np.bool_]:
+        """
+        returns genes as an item selection vector.
+        """
+        return self.genes.unpack()
 
-        for i, gene in enumerate(self.genes):
-            if gene is True:
-                total_weight += self.model.weights[i]
-                total_value += self.model.values[i]
+    def assign(self, genome: npt.NDArray[typing.Any]) -> None:
+        self.genes = Bits.pack(genome)
+        self.invalidate()
 
-        fitness = total_value
+    def fingerprint(self) -> bytes:
+        # genes are already packed the same as the model fingerprints.
+        return self.genes.data.tobytes()
 
-        # reduce the fitnees to make sure we don't passes
-        # the constraints.
-        if total_weight > self.model.max_weight:
-            return 1 / fitness
+    def evaluate(self) -> float:
+        total_weight, total_value = self.model.totals(self.genome())
+        self.state = (int(total_weight), int(total_value))
+        return float(self.model.penalize(total_weight, total_value))
 
-        return fitness
+    def delta(
+        self,
+        positions: npt.NDArray[np.intp],
+        previous: npt.NDArray[np.bool_],
+    ) -> float | None:
+        total_weight, total_value = self.state
 
-    def mutate(self, prob: float) -> None:
-        rand = random.random()
+        # +1 for the picked items and -1 for the dropped ones.
+        sign = self.genes.take(positions).astype(np.int64) - previous.astype(np.int64)
+        total_weight += int(sign @ self.model.weights[positions])
+        total_value += int(sign @ self.model.values[positions])
+
+        self.state = (total_weight, total_value)
+        return float(self.model.penalize(total_weight, total_value))
+
+    def mutate(self, prob: float, rng: np.random.Generator | None = None) -> None:
+        rng = generator(rng)
+        rand = rng.random()
         if rand < prob:
-            i = random.randrange(self.model.length)
-            self.genes[i] = not self.genes[i]
+            i = int(rng.integers(self.model.length))
+            self.update([i], [self.genes.flip(i)])
 
     @classmethod
     def crossover(
@@ -109,25 +302,28 @@ class Chromosome(herkoole.chromosome.Chromosome[bool]):
         parent1: herkoole.chromosome.Chromosome,
         parent2: herkoole.chromosome.Chromosome,
         prob: float,
+        rng: np.random.Generator | None = None,
     ) -> tuple[herkoole.chromosome.Chromosome, herkoole.chromosome.Chromosome]:
         if not isinstance(parent1, cls) or not isinstance(parent2, cls):
             raise TypeError
 
-        idx = random.randrange(parent1.model.length)
+        rng = generator(rng)
+        idx = int(rng.integers(parent1.model.length))
 
         chromosome1, chromosome2 = (
-            Chromosome(parent1.model),
-            Chromosome(parent2.model),
+            cls(parent1.model),
+            cls(parent2.model),
         )
 
-        rand = random.random()
+        rand = rng.random()
         if rand < prob:
-            chromosome1.genes[:idx] = parent1.genes[:idx]
-            chromosome1.genes[idx:] = parent2.genes[idx:]
-            chromosome2.genes[:idx] = parent2.genes[:idx]
-            chromosome2.genes[idx:] = parent1.genes[idx:]
+            chromosome1.genes = Bits.splice(parent1.genes, parent2.genes, idx)
+            chromosome2.genes = Bits.splice(parent2.genes, parent1.genes, idx)
         else:
-            chromosome1.genes[:] = parent1.genes[:]
-            chromosome2.genes[:] = parent2.genes[:]
+            chromosome1.genes = parent1.genes.copy()
+            chromosome2.genes = parent2.genes.copy()
+
+        chromosome1.derive(parent1, parent2)
+        chromosome2.derive(parent1, parent2)
 
         return chromosome1, chromosome2
@@ -0,0 +1,51 @@
+"""
+Repair keeps children of the evolutionary algorithm in the feasible
+region, so the population is not wasted on overweight selections.
+"""
+
+from __future__ import annotations
+
+import typing
+
+import numpy as np
+
+from herkoole.ea.evolutionary_algorithm import PostVariation
+from herkoole.population import ArrayPopulation
+
+from .model import Model
+
+if typing.TYPE_CHECKING:
+    from herkoole.ea import EvolutionaryAlgorithm
+    from herkoole.population import Population
+
+
+class Repair(PostVariation):
+    """
+    Repair drops items of the overweight children by ascending value
+    per weight, and with fill it also picks the items which still fit.
+    """
+
+    def __init__(self, ea: EvolutionaryAlgorithm, *, fill: bool = False) -> None:
+        if not isinstance(ea.model, Model):
+            msg = "repair only works with knapsack model"
+            raise TypeError(msg)
+        self.model = ea.model
+        self.fill = fill
+
+        # number of the repaired children in the whole run.
+        self.repaired = 0
+
+        super().__init__(ea)
+
+    def apply(self, children: Population) -> Population:
+        if isinstance(children, ArrayPopulation):
+            rows = self.model.repair(children.genomes, fill=self.fill)
+            children.fitness_values[rows] = np.nan
+        else:
+            genomes = self.model.encode(list(children))
+            rows = self.model.repair(genomes, fill=self.fill)
+            for i in rows:
+                children.set_genome(int(i), genomes[i])
+
+        self.repaired += len(rows)
+        return children
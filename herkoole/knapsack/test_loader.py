@@ -0,0 +1,20 @@
+import pathlib
+
+from .loader import load
+
+
+def test_load(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "knapsack.txt"
+    path.write_text("3 50\n60 10\n100 20\n120 30\n", encoding="utf-8")
+
+    m = load(path)
+    assert m.weights.tolist() == [10, 20, 30]
+    assert m.values.tolist() == [60, 100, 120]
+    assert m.max_weight == 50
+
+    # the second load uses the cache.
+    assert path.with_name("knapsack.txt.npy").exists()
+    cached = load(path)
+    assert cached.weights.tolist() == m.weights.tolist()
+    assert cached.values.tolist() == m.values.tolist()
+    assert cached.max_weight == m.max_weight
@@ -0,0 +1,118 @@
+import numpy as np
+
+from .model import Chromosome, Model
+
+
+def test_batch_fitness() -> None:
+    m = Model([23, 26, 20, 18], [505, 352, 458, 220], 67)
+
+    genomes = np.array(
+        [
+            [True, False, True, True],
+            [True, True, True, False],
+            [False, False, False, False],
+        ],
+    )
+
+    total_weight, total_value = m.totals(genomes)
+    assert total_weight.tolist() == [61, 69, 0]
+    assert total_value.tolist() == [1183, 1315, 0]
+
+    fitness = m.batch_fitness(genomes)
+    assert fitness.tolist() == [1183, 1 / 1315, 0]
+
+    for genome, f in zip(genomes, fitness, strict=True):
+        ch = m.decode(genome)
+        assert isinstance(ch, Chromosome)
+        assert ch.fitness() == f
+
+
+def test_delta_fitness() -> None:
+    m = Model([23, 26, 20, 18], [505, 352, 458, 220], 67)
+
+    parent1 = m.chromosome([True, False, True, True])
+    parent2 = m.chromosome([True, True, True, False])
+    parent1.fitness()
+    parent2.fitness()
+
+    for _ in range(20):
+        child1, child2 = Chromosome.crossover(parent1, parent2, 1)
+        for ch in (child1, child2):
+            ch.mutate(1)
+            assert ch.cached_fitness is not None
+            assert ch.cached_fitness == m.chromosome(ch.genes[:]).fitness()
+
+
+def test_compact_genes() -> None:
+    m = Model([23, 26, 20, 18], [505, 352, 458, 220], 67)
+
+    ch = m.initial_population(1)[0]
+    assert not hasattr(ch, "__dict__")
+    assert ch.genome().tolist() == m.encode([ch])[0].tolist()
+
+    ch.assign(np.array([True, False, True, True]))
+    assert ch.fitness() == 1183
+
+
+def test_overweight_without_value() -> None:
+    m = Model([5, 5], [0, 0], 4)
+    assert m.batch_fitness(np.array([[True, True], [False, False]])).tolist() == [0, 0]
+
+
+def test_repair() -> None:
+    rng = np.random.default_rng(0)
+    weights, values = rng.integers(1, 50, 40), rng.integers(1, 50, 40)
+    m = Model(weights, values, int(weights.sum()) // 3)
+
+    genomes = rng.random((100, 40)) < 0.5
+    original = genomes.copy()
+    overweight = np.flatnonzero(m.totals(genomes)[0] > m.max_weight)
+
+    rows = m.repair(genomes)
+    assert np.array_equal(rows, overweight)
+    assert np.all(m.totals(genomes)[0] <= m.max_weight)
+    # items are only dropped, by ascending value per weight.
+    assert not np.any(genomes & ~original)
+    for row in rows:
+        dropped = np.flatnonzero(original[row] & ~genomes[row])
+        kept = np.flatnonzero(genomes[row])
+        assert m.ratios[dropped].max() <= m.ratios[kept].min()
+
+    filled = genomes.copy()
+    m.repair(filled, fill=True)
+    assert not np.any(genomes & ~filled)
+    assert np.all(m.totals(filled)[0] <= m.max_weight)
+    # after filling, no missing item fits in any knapsack.
+    slack = m.max_weight - m.totals(filled)[0]
+    assert np.all(filled | (m.weights[np.newaxis] > slack[:, np.newaxis]))
+
+
+def test_greedy_seeding() -> None:
+    m = Model([23, 26, 20, 18, 32, 27], [505, 352, 458, 220, 354, 414], 67)
+
+    greedy = Model(m.weights, m.values, m.max_weight, seeding="greedy")
+    genomes = greedy.initial_genomes(20)
+    # the first genome is the (deterministic) greedy solution.
+    assert genomes[0].tolist() == [True, False, True, True, False, False]
+    assert np.all(greedy.totals(genomes)[0] <= greedy.max_weight)
+
+    randomized = Model(m.weights, m.values, m.max_weight, seeding="randomized_greedy")
+    population = randomized.initial_population(20)
+    assert len({ch.key() for ch in population}) > 1
+    assert all(ch.fitness() > 1 for ch in population)
+
+
+def test_fingerprints() -> None:
+    m = Model(np.arange(1, 12), np.arange(11, 0, -1), 20)
+    population = m.initial_population(20)
+    genomes = m.encode(population)
+
+    # chromosomes use their packed genes as the fingerprint.
+    assert m.fingerprints(genomes) == [c.fingerprint() for c in population]
+    assert len(set(m.fingerprints(genomes))) == len(
+        {g.tobytes() for g in genomes},
+    )
+    assert np.array_equal(
+        m.genome_distance(genomes, ~genomes),
+        np.ones(len(genomes)),
+    )
@@ -0,0 +1,34 @@
+import numpy as np
+
+from herkoole.ea import EvolutionaryAlgorithm, QTournament, StochasticUniversalSampling
+
+from .model import Model
+from .repair import Repair
+
+
+def test_repair() -> None:
+    rng = np.random.default_rng(1)
+    weights = rng.integers(1, 100, 200)
+    m = Model(weights, rng.integers(1, 100, 200), int(weights.sum()) // 10)
+
+    for vectorized in (False, True):
+        ea = EvolutionaryAlgorithm(
+            10,
+            20,
+            5,
+            m,
+            parent_selector=StochasticUniversalSampling.new(),
+            remaining_population_selector=QTournament.new(q=2),
+            threshold=0,
+            mutation_propability=1,
+            vectorized=vectorized,
+            post_variation=Repair.new(fill=True),
+        )
+        ea.run()
+
+        assert isinstance(ea.post_variation, Repair)
+        assert ea.post_variation.repaired > 0
+        # random initial selections are overweight, children are repaired.
+        assert ea.best_chromosome_fitness_in_total > 1
+        genomes = m.encode(list(ea.population))
+        assert np.all(m.totals(genomes)[0] <= m.max_weight)
@@ -1 +1,2 @@
+from .loader import load_array as load_array
 from .model import Model as Model
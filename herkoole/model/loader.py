@@ -0,0 +1,55 @@
+"""
+Problem instances are parsed from their text files in one numpy pass
+and the parsed array is cached beside the text file (as .npy),
+so the next runs memory-map it instead of parsing the file again.
+"""
+
+from __future__ import annotations
+
+import logging
+import pathlib
+import typing
+
+import numpy as np
+
+if typing.TYPE_CHECKING:
+    import numpy.typing as npt
+
+logger = logging.getLogger(__name__)
+
+
+def cache_path(path: pathlib.Path) -> pathlib.Path:
+    return path.with_name(f"{path.name}.npy")
+
+
+def load_array(
+    path: str | pathlib.Path,
+    parse: typing.Callable[[pathlib.Path], npt.NDArray[typing.Any]],
+    *,
+    cache: bool = True,
+) -> npt.NDArray[typing.Any]:
+    """
+    returns the parsed array of the instance file. The cache is used
+    when it is newer than the file, and it is written (when possible)
+    after parsing the file.
+    """
+    path = pathlib.Path(path)
+    cached = cache_path(path)
+
+    if cache and cached.exists() and cached.stat().st_mtime >= path.stat().st_mtime:
+        return np.load(cached, mmap_mode="r")
+
+    array = parse(path)
+
+    if cache:
+        # write into a temporary file to never leave a partial cache.
+        temporary = cached.with_name(f"{cached.name}.tmp")
+        try:
+            with temporary.open("wb") as f:
+                np.save(f, array)
+            temporary.replace(cached)
+        except OSError:
+            logger.warning("cannot write instance cache %s", cached)
+            temporary.unlink(missing_ok=True)
+
+    return array
@@ -1,16 +1,137 @@
 import abc
+import typing
 
-from herkoole.chromosome import Chromosome
+import numpy as np
+import numpy.typing as npt
+
+from herkoole.chromosome import Chromosome, genome_key
 
 
 class Model(abc.ABC):
     """
     Model represents the actual problem with its configuration.
     Everything starts here by defining the problem model.
+
+    Models which want to use the array population backend must provide
+    `genome_dtype` and `chromosome`, the batch operations are
+    implemented here using chromosomes and can be overridden
+    with vectorized versions.
     """
 
+    genome_dtype: npt.DTypeLike = np.int64
+
     @abc.abstractmethod
-    def initial_population(self, mu: int) -> list[Chromosome]:
+    def initial_population(
+        self,
+        mu: int,
+        rng: np.random.Generator | None = None,
+    ) -> list[Chromosome]:
         """
         Generate the initial chromosomes.
         """
+
+    def chromosome(self, genes: list[typing.Any]) -> Chromosome:
+        """
+        Create a chromosome of this problem with the given genes.
+        """
+        raise NotImplementedError
+
+    def encode(
+        self, chromosomes: typing.Sequence[Chromosome]
+    ) -> npt.NDArray[typing.Any]:
+        """
+        Convert chromosomes into a (chromosomes x genes) matrix.
+        """
+        return np.array(
+            [np.asarray(c.genes) for c in chromosomes],
+            dtype=self.genome_dtype,
+        )
+
+    def decode(self, genome: npt.NDArray[typing.Any]) -> Chromosome:
+        """
+        Convert one row of a genome matrix into a chromosome.
+        """
+        return self.chromosome(genome.tolist())
+
+    def fingerprints(self, genomes: npt.NDArray[typing.Any]) -> list[bytes]:
+        """
+        Hash each row of the genome matrix, equivalent genomes (the ones
+        which are the same solution) must have the same hash.
+        """
+        return [genome_key(genome) for genome in genomes]
+
+    def genome_distance(
+        self,
+        genomes1: npt.NDArray[typing.Any],
+        genomes2: npt.NDArray[typing.Any],
+    ) -> npt.NDArray[np.float64]:
+        """
+        Calculate distance (in [0, 1]) between each row of genomes1 and
+        the same row of genomes2, it is the normalized hamming distance.
+        """
+        if genomes1.shape[1] == 0:
+            return np.zeros(len(genomes1))
+        return np.mean(genomes1 != genomes2, axis=1)
+
+    def initial_genomes(
+        self,
+        mu: int,
+        rng: np.random.Generator | None = None,
+    ) -> npt.NDArray[typing.Any]:
+        """
+        Generate the initial chromosomes as a genome matrix.
+        """
+        return self.encode(self.initial_population(mu, rng))
+
+    def batch_fitness(
+        self,
+        genomes: npt.NDArray[typing.Any],
+    ) -> npt.NDArray[np.float64]:
+        """
+        Calculate the fitness of each row of the genome matrix.
+        """
+        return np.fromiter(
+            (self.decode(genome).fitness() for genome in genomes),
+            dtype=np.float64,
+            count=len(genomes),
+        )
+
+    def batch_mutate(
+        self,
+        genomes: npt.NDArray[typing.Any],
+        prob: float,
+        rng: np.random.Generator | None = None,
+    ) -> None:
+        """
+        Mutate each row of the genome matrix in place.
+        """
+        for i, genome in enumerate(genomes):
+            chromosome = self.decode(genome)
+            chromosome.mutate(prob, rng)
+            genomes[i] = np.asarray(chromosome.genes)
+
+    def batch_crossover(
+        self,
+        parents1: npt.NDArray[typing.Any],
+        parents2: npt.NDArray[typing.Any],
+        prob: float,
+        rng: np.random.Generator | None = None,
+    ) -> tuple[npt.NDArray[typing.Any], npt.NDArray[typing.Any]]:
+        """
+        Crossover each row of parents1 with the same row of parents2.
+        """
+        children1 = np.empty_like(parents1)
+        children2 = np.empty_like(parents2)
+
+        for i, (parent1, parent2) in enumerate(zip(parents1, parents2, strict=True)):
+            chromosome1 = self.decode(parent1)
+            chromosome1, chromosome2 = type(chromosome1).crossover(
+                chromosome1,
+                self.decode(parent2),
+                prob,
+                rng,
+            )
+            children1[i] = np.asarray(chromosome1.genes)
+            children2[i] = np.asarray(chromosome2.genes)
+
+        return children1, children2
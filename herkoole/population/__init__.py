@@ -0,0 +1,3 @@
+from .population import ArrayPopulation as ArrayPopulation
+from .population import ChromosomePopulation as ChromosomePopulation
+from .population import Population as Population
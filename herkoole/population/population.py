@@ -0,0 +1,440 @@
+"""
+Population backends for the evolutionary algorithm.
+
+A population is an ordered collection of chromosomes. The evolutionary
+algorithm only talks to its population using indices, so the chromosomes
+can be stored either as python objects or as one contiguous genome matrix.
+"""
+
+from __future__ import annotations
+
+import abc
+import typing
+
+import numpy as np
+import numpy.typing as npt
+
+from herkoole.chromosome import genome_key
+
+if typing.TYPE_CHECKING:
+    from herkoole.chromosome import Chromosome
+    from herkoole.ea.cache import FitnessCache
+    from herkoole.model import Model
+
+    type Evaluate = typing.Callable[
+        [Population, npt.NDArray[np.intp]],
+        npt.NDArray[np.float64],
+    ]
+    type AsyncEvaluate = typing.Callable[
+        [Population, npt.NDArray[np.intp]],
+        typing.Awaitable[npt.NDArray[np.float64]],
+    ]
+
+
+class Population(abc.ABC):
+    """
+    Population stores the chromosomes of one generation.
+    """
+
+    @abc.abstractmethod
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def __getitem__(self, index: int) -> Chromosome:
+        raise NotImplementedError
+
+    def __iter__(self) -> typing.Iterator[Chromosome]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def fitness(
+        self,
+        cache: FitnessCache | None = None,
+        evaluate: Evaluate | None = None,
+    ) -> npt.NDArray[np.float64]:
+        """
+        returns fitness of each chromosome in the population order.
+        only chromosomes without a memoized fitness are evaluated
+        (by the given evaluate function or serially),
+        and the given cache is checked before evaluating them.
+        """
+        if evaluate is None:
+            evaluate = type(self).evaluate
+
+        steps = self._fitness(cache)
+        indices = next(steps)
+        try:
+            steps.send(evaluate(self, indices))
+        except StopIteration as stop:
+            return stop.value
+
+        msg = "fitness steps must finish after one evaluation"
+        raise RuntimeError(msg)
+
+    async def fitness_async(
+        self,
+        cache: FitnessCache | None = None,
+        evaluate: AsyncEvaluate | None = None,
+    ) -> npt.NDArray[np.float64]:
+        """
+        is the same as fitness but evaluates the chromosomes
+        with a coroutine, e.g. by calling a remote service.
+        """
+        if evaluate is None:
+            evaluate = type(self).evaluate_async
+
+        steps = self._fitness(cache)
+        indices = next(steps)
+        try:
+            steps.send(await evaluate(self, indices))
+        except StopIteration as stop:
+            return stop.value
+
+        msg = "fitness steps must finish after one evaluation"
+        raise RuntimeError(msg)
+
+    def _fitness(
+        self,
+        cache: FitnessCache | None,
+    ) -> typing.Generator[
+        npt.NDArray[np.intp],
+        npt.NDArray[np.float64],
+        npt.NDArray[np.float64],
+    ]:
+        """
+        yields indices of the chromosomes that must be evaluated once,
+        receives their fitness and returns fitness of the population,
+        so the sync and async evaluations share the cache logic.
+        """
+        fitness = self.known_fitness()
+        missing = np.flatnonzero(np.isnan(fitness))
+
+        if cache is None or cache.maxsize <= 0:
+            fitness[missing] = yield missing
+            if cache is not None:
+                cache.reused += len(fitness) - len(missing)
+                cache.misses += len(missing)
+            self.store_fitness(missing, fitness[missing])
+            return fitness
+
+        cache.reused += len(fitness) - len(missing)
+
+        # duplicated genomes in the missing ones are evaluated once.
+        pending: dict[bytes, list[int]] = {}
+        for i, key in zip(missing, self.keys(missing), strict=True):
+            value = cache.get(key)
+            if value is not None:
+                fitness[i] = value
+                cache.hits += 1
+            elif key in pending:
+                pending[key].append(i)
+                cache.hits += 1
+            else:
+                pending[key] = [i]
+
+        values = yield np.array([v[0] for v in pending.values()], np.intp)
+        cache.misses += len(values)
+        for (key, indices), value in zip(pending.items(), values, strict=True):
+            fitness[indices] = value
+            cache.put(key, float(value))
+
+        self.store_fitness(missing, fitness[missing])
+        return fitness
+
+    @abc.abstractmethod
+    def known_fitness(self) -> npt.NDArray[np.float64]:
+        """
+        returns memoized fitness of each chromosome or nan
+        for the ones that are not evaluated yet.
+        """
+
+    @abc.abstractmethod
+    def store_fitness(
+        self,
+        indices: npt.NDArray[np.intp],
+        fitness: npt.NDArray[np.float64],
+    ) -> None:
+        """
+        memoizes fitness of the chromosomes on the given indices.
+        """
+
+    @abc.abstractmethod
+    def evaluate(self, indices: npt.NDArray[np.intp]) -> npt.NDArray[np.float64]:
+        """
+        calculates fitness of the chromosomes on the given indices.
+        """
+
+    async def evaluate_async(
+        self,
+        indices: npt.NDArray[np.intp],
+    ) -> npt.NDArray[np.float64]:
+        """
+        calculates fitness of the chromosomes on the given indices
+        concurrently using their async fitness protocol.
+        """
+        chromosomes = [self[i] for i in indices]
+        if len(chromosomes) == 0:
+            return np.empty(0)
+        values = await type(chromosomes[0]).evaluate_batch_async(chromosomes)
+        return np.asarray(values, dtype=np.float64)
+
+    @abc.abstractmethod
+    def keys(self, indices: npt.NDArray[np.intp]) -> list[bytes]:
+        """
+        returns genome hash of the chromosomes on the given indices.
+        """
+
+    @abc.abstractmethod
+    def fingerprints(self, indices: npt.NDArray[np.intp]) -> list[bytes]:
+        """
+        returns hash of the chromosomes on the given indices which is
+        the same for the equivalent genomes, e.g. to find duplicates.
+        """
+
+    @abc.abstractmethod
+    def genome(self, index: int) -> npt.NDArray[typing.Any]:
+        """
+        returns genes of the chromosome on the given index as an array.
+        """
+
+    @abc.abstractmethod
+    def set_genome(self, index: int, genome: npt.NDArray[typing.Any]) -> None:
+        """
+        replaces genes of the chromosome on the given index
+        and drops its memoized fitness.
+        """
+
+    @abc.abstractmethod
+    def replace(self, indices: npt.NDArray[np.intp], other: Population) -> None:
+        """
+        replaces the chromosomes on the given indices in place with the
+        chromosomes of the other population (in order) and their
+        memoized fitness. Later ones win for the repeated indices.
+        """
+
+    @abc.abstractmethod
+    def take(self, indices: npt.NDArray[np.intp]) -> Population:
+        """
+        returns a new population from the chromosomes on the given indices.
+        """
+
+    @abc.abstractmethod
+    def concat(self, other: Population) -> Population:
+        """
+        returns a new population which has chromosomes of both populations.
+        """
+
+    @abc.abstractmethod
+    def offspring(
+        self,
+        size: int,
+        crossover_prob: float,
+        mutation_prob: float,
+        rng: np.random.Generator | None = None,
+    ) -> Population:
+        """
+        creates (at most) size children by crossing over each consecutive
+        pair of chromosomes and mutating the results.
+        """
+
+
+class ChromosomePopulation(Population):
+    """
+    ChromosomePopulation keeps each chromosome as a python object, so
+    it works with every chromosome without any support from its model.
+    """
+
+    def __init__(self, chromosomes: list[Chromosome]) -> None:
+        self.chromosomes = chromosomes
+
+    def __len__(self) -> int:
+        return len(self.chromosomes)
+
+    def __getitem__(self, index: int) -> Chromosome:
+        return self.chromosomes[index]
+
+    def known_fitness(self) -> npt.NDArray[np.float64]:
+        return np.fromiter(
+            (
+                np.nan if c.cached_fitness is None else c.cached_fitness
+                for c in self.chromosomes
+            ),
+            dtype=np.float64,
+            count=len(self.chromosomes),
+        )
+
+    def store_fitness(
+        self,
+        indices: npt.NDArray[np.intp],
+        fitness: npt.NDArray[np.float64],
+    ) -> None:
+        for i, f in zip(indices, fitness, strict=True):
+            self.chromosomes[i].cached_fitness = float(f)
+
+    def evaluate(self, indices: npt.NDArray[np.intp]) -> npt.NDArray[np.float64]:
+        return np.fromiter(
+            (self.chromosomes[i].fitness() for i in indices),
+            dtype=np.float64,
+            count=len(indices),
+        )
+
+    def keys(self, indices: npt.NDArray[np.intp]) -> list[bytes]:
+        return [self.chromosomes[i].key() for i in indices]
+
+    def fingerprints(self, indices: npt.NDArray[np.intp]) -> list[bytes]:
+        return [self.chromosomes[i].fingerprint() for i in indices]
+
+    def genome(self, index: int) -> npt.NDArray[typing.Any]:
+        return np.asarray(self.chromosomes[index].genes)
+
+    def set_genome(self, index: int, genome: npt.NDArray[typing.Any]) -> None:
+        self.chromosomes[index].assign(genome)
+
+    def replace(self, indices: npt.NDArray[np.intp], other: Population) -> None:
+        for i, chromosome in zip(indices, other, strict=True):
+            self.chromosomes[i] = chromosome
+
+    def take(self, indices: npt.NDArray[np.intp]) -> ChromosomePopulation:
+        return ChromosomePopulation([self.chromosomes[i] for i in indices])
+
+    def concat(self, other: Population) -> ChromosomePopulation:
+        return ChromosomePopulation([*self.chromosomes, *other])
+
+    def offspring(
+        self,
+        size: int,
+        crossover_prob: float,
+        mutation_prob: float,
+        rng: np.random.Generator | None = None,
+    ) -> ChromosomePopulation:
+        children: list[Chromosome] = []
+
+        if len(self.chromosomes) == 0:
+            return ChromosomePopulation(children)
+
+        chromosome_type: type[Chromosome] = type(self.chromosomes[0])
+
+        for i in range(0, len(self.chromosomes) - 1, 2):
+            chromosome1, chromosome2 = chromosome_type.crossover(
+                self.chromosomes[i],
+                self.chromosomes[i + 1],
+                crossover_prob,
+                rng,
+            )
+            chromosome1.mutate(mutation_prob, rng)
+            chromosome2.mutate(mutation_prob, rng)
+            children.extend([chromosome1, chromosome2])
+            if len(children) >= size:
+                break
+
+        return ChromosomePopulation(children[:size])
+
+
+class ArrayPopulation(Population):
+    """
+    ArrayPopulation keeps the genes of the whole population in one
+    (population x genes) matrix, so fitness, mutation and crossover
+    run as batched array operations provided by the model.
+    Chromosome objects are only created when someone asks for them.
+    Memoized fitness values are kept in a vector beside the genomes.
+    """
+
+    def __init__(
+        self,
+        model: Model,
+        genomes: npt.NDArray[typing.Any],
+        fitness_values: npt.NDArray[np.float64] | None = None,
+    ) -> None:
+        self.model = model
+        self.genomes = genomes
+        if fitness_values is None:
+            fitness_values = np.full(len(genomes), np.nan)
+        self.fitness_values = fitness_values
+
+    def __len__(self) -> int:
+        return len(self.genomes)
+
+    def __getitem__(self, index: int) -> Chromosome:
+        chromosome = self.model.decode(self.genomes[index])
+        if not np.isnan(self.fitness_values[index]):
+            chromosome.cached_fitness = float(self.fitness_values[index])
+        return chromosome
+
+    def known_fitness(self) -> npt.NDArray[np.float64]:
+        return self.fitness_values.copy()
+
+    def store_fitness(
+        self,
+        indices: npt.NDArray[np.intp],
+        fitness: npt.NDArray[np.float64],
+    ) -> None:
+        self.fitness_values[indices] = fitness
+
+    def evaluate(self, indices: npt.NDArray[np.intp]) -> npt.NDArray[np.float64]:
+        if len(indices) == 0:
+            return np.empty(0)
+        return self.model.batch_fitness(self.genomes[indices])
+
+    def keys(self, indices: npt.NDArray[np.intp]) -> list[bytes]:
+        return [genome_key(self.genomes[i]) for i in indices]
+
+    def fingerprints(self, indices: npt.NDArray[np.intp]) -> list[bytes]:
+        return self.model.fingerprints(self.genomes[indices])
+
+    def genome(self, index: int) -> npt.NDArray[typing.Any]:
+        return self.genomes[index]
+
+    def set_genome(self, index: int, genome: npt.NDArray[typing.Any]) -> None:
+        self.genomes[index] = genome
+        self.fitness_values[index] = np.nan
+
+    def replace(self, indices: npt.NDArray[np.intp], other: Population) -> None:
+        if isinstance(other, ArrayPopulation):
+            genomes = other.genomes
+        else:
+            genomes = self.model.encode(list(other))
+        self.genomes[indices] = genomes
+        self.fitness_values[indices] = other.known_fitness()
+
+    def take(self, indices: npt.NDArray[np.intp]) -> ArrayPopulation:
+        return ArrayPopulation(
+            self.model,
+            self.genomes[indices],
+            self.fitness_values[indices],
+        )
+
+    def concat(self, other: Population) -> ArrayPopulation:
+        if isinstance(other, ArrayPopulation):
+            genomes = other.genomes
+        else:
+            genomes = self.model.encode(list(other))
+        return ArrayPopulation(
+            self.model,
+            np.concatenate((self.genomes, genomes)),
+            np.concatenate((self.fitness_values, other.known_fitness())),
+        )
+
+    def offspring(
+        self,
+        size: int,
+        crossover_prob: float,
+        mutation_prob: float,
+        rng: np.random.Generator | None = None,
+    ) -> ArrayPopulation:
+        pairs = min(len(self.genomes) // 2, (size + 1) // 2)
+
+        children1, children2 = self.model.batch_crossover(
+            self.genomes[0 : 2 * pairs : 2],
+            self.genomes[1 : 2 * pairs : 2],
+            crossover_prob,
+            rng,
+        )
+
+        children = np.empty((2 * pairs, *self.genomes.shape[1:]), self.genomes.dtype)
+        children[0::2] = children1
+        children[1::2] = children2
+
+        self.model.batch_mutate(children, mutation_prob, rng)
+
+        return ArrayPopulation(self.model, children[:size])
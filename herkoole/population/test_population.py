@@ -0,0 +1,67 @@
+import numpy as np
+
+from herkoole.ea.cache import FitnessCache
+from herkoole.knapsack import Model
+
+from .population import ArrayPopulation, ChromosomePopulation
+
+
+def test_array_population() -> None:
+    m = Model([1, 2, 3, 4], [4, 3, 2, 1], 5)
+
+    chromosomes = m.initial_population(6)
+    population = ArrayPopulation(m, m.encode(chromosomes))
+
+    assert population.genomes.shape == (6, 4)
+    assert population.genomes.dtype == np.bool_
+    assert np.allclose(
+        population.fitness(),
+        ChromosomePopulation(chromosomes).fitness(),
+    )
+    for i, chromosome in enumerate(chromosomes):
+        assert population[i] == chromosome
+
+    children = population.offspring(5, 1, 1)
+    assert len(children) == 5
+    assert children.genomes.shape == (5, 4)
+
+    items = population.concat(children).take(np.array([0, 6]))
+    assert items[0] == chromosomes[0]
+    assert np.array_equal(items.genomes[1], children.genomes[0])
+
+
+def test_fitness_cache() -> None:
+    m = Model([1, 2, 3, 4], [4, 3, 2, 1], 5)
+
+    genomes = np.array([[True, False, False, True]] * 3 + [[False, True, True, False]])
+    population = ArrayPopulation(m, genomes)
+    cache = FitnessCache(10)
+
+    fitness = population.fitness(cache)
+    assert fitness.tolist() == [5, 5, 5, 5]
+    assert (cache.misses, cache.hits, cache.reused) == (2, 2, 0)
+
+    population.fitness(cache)
+    assert (cache.misses, cache.hits, cache.reused) == (2, 2, 4)
+
+    children = ArrayPopulation(m, genomes[1:3].copy())
+    children.fitness(cache)
+    assert (cache.misses, cache.hits, cache.reused) == (2, 4, 4)
+    assert cache.hit_rate == 0.8
+
+
+def test_replace() -> None:
+    m = Model([1, 2, 3, 4], [4, 3, 2, 1], 5)
+
+    for population in (
+        ChromosomePopulation(m.initial_population(4)),
+        ArrayPopulation(m, m.initial_genomes(4)),
+    ):
+        others = ArrayPopulation(m, m.initial_genomes(2))
+        fitness = others.fitness()
+        population.replace(np.array([3, 1]), others)
+
+        assert population[3] == others[0]
+        assert population[1] == others[1]
+        # memoized fitness of the others is moved with them.
+        assert np.array_equal(population.known_fitness()[[3, 1]], fitness)
@@ -0,0 +1,42 @@
+"""
+Random number generators. The evolutionary algorithm spawns independent
+generators for each of its components from one seed sequence, so a run
+is reproduced from its seed. Functions which are called without
+a generator use the process-wide default one.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+type Seed = int | np.random.SeedSequence | None
+
+_default = np.random.default_rng()
+
+
+def generator(rng: np.random.Generator | None = None) -> np.random.Generator:
+    """
+    returns the given generator or the process-wide default one.
+    """
+    return _default if rng is None else rng
+
+
+def seed(value: Seed = None) -> None:
+    """
+    seeds the process-wide default generator, e.g. in worker processes
+    which must not share the random state of their parent.
+    """
+    global _default  # noqa: PLW0603
+    _default = np.random.default_rng(value)
+
+
+def sequence(value: Seed = None) -> np.random.SeedSequence:
+    """
+    returns the seed sequence of a seed. Without a seed, it is drawn from
+    the default generator, so seeding the process also seeds its runs.
+    """
+    if isinstance(value, np.random.SeedSequence):
+        return value
+    if value is None:
+        return np.random.SeedSequence(int(_default.integers(2**63)))
+    return np.random.SeedSequence(value)
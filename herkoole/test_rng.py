@@ -0,0 +1,38 @@
+import numpy as np
+
+from herkoole import rng
+from herkoole.ea import (
+    EvolutionaryAlgorithm,
+    QTournament,
+    StochasticUniversalSampling,
+)
+from herkoole.knapsack import Model
+
+
+def test_seeded_runs() -> None:
+    m = Model(np.arange(1, 51), np.arange(50, 0, -1), 400)
+
+    def run(seed: rng.Seed, *, vectorized: bool) -> list[float]:
+        ea = EvolutionaryAlgorithm(
+            10,
+            20,
+            10,
+            m,
+            parent_selector=StochasticUniversalSampling.new(),
+            remaining_population_selector=QTournament.new(q=2),
+            threshold=0,
+            vectorized=vectorized,
+            seed=seed,
+        )
+        ea.run()
+        return ea.average_fitness
+
+    for vectorized in (False, True):
+        assert run(7, vectorized=vectorized) == run(7, vectorized=vectorized)
+        assert run(7, vectorized=vectorized) != run(8, vectorized=vectorized)
+
+    # runs without a seed draw it from the default generator.
+    rng.seed(7)
+    expected = run(None, vectorized=False)
+    rng.seed(7)
+    assert run(None, vectorized=False) == expected
@@ -1,2 +1,7 @@
+from .city import Cities as Cities
 from .city import City as City
+from .distance import DenseDistances as DenseDistances
+from .distance import LazyDistances as LazyDistances
+from .loader import load as load
+from .local_search import LocalSearch as LocalSearch
 from .model import Model as Model
@@ -1,4 +1,12 @@
+from __future__ import annotations
+
+import collections.abc
 import dataclasses
+import typing
+
+if typing.TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
 
 
 @dataclasses.dataclass(repr=True)
@@ -9,3 +17,37 @@ class City:
 
     def __str__(self) -> str:
         return f"{self.identifier}: ({self.x}, {self.y})"
+
+
+class Cities(collections.abc.Sequence[City]):
+    """
+    Cities keeps identifiers and coordinates of the cities as arrays,
+    so large instances do not need a City object per city.
+    City objects are created on access.
+    """
+
+    def __init__(
+        self,
+        identifiers: npt.NDArray[np.int64],
+        coordinates: npt.NDArray[np.float64],
+    ) -> None:
+        if coordinates.shape != (len(identifiers), 2):
+            msg = "coordinates must be a (cities x 2) matrix"
+            raise ValueError(msg)
+        self.identifiers = identifiers
+        self.coordinates = coordinates
+
+    def __len__(self) -> int:
+        return len(self.identifiers)
+
+    @typing.overload
+    def __getitem__(self, index: int) -> City: ...
+
+    @typing.overload
+    def __getitem__(self, index: slice) -> Cities: ...
+
+    def __getitem__(self, index: int | slice) -> City | Cities:
+        if isinstance(index, slice):
+            return Cities(self.identifiers[index], self.coordinates[index])
+        x, y = self.coordinates[index]
+        return City(int(self.identifiers[index]), float(x), float(y))
@@ -0,0 +1,190 @@
+"""
+Crossover operators for permutations (tours).
+
+Each operator accepts a pair of tours or a pair of (pairs x cities)
+tour matrices and creates the children of all pairs together.
+"""
+
+from __future__ import annotations
+
+import functools
+import math
+import typing
+
+import numpy as np
+import numpy.typing as npt
+
+from herkoole.rng import generator
+
+type Tours = npt.NDArray[np.integer]
+type Operator = typing.Callable[
+    [Tours, Tours, np.random.Generator | None],
+    tuple[Tours, Tours],
+]
+
+
+def positions(tours: Tours) -> Tours:
+    """
+    returns the inverse permutation of each tour,
+    i.e. position of each city in the tour.
+    """
+    inverse = np.empty_like(tours)
+    np.put_along_axis(
+        inverse,
+        tours,
+        np.broadcast_to(np.arange(tours.shape[-1]), tours.shape),
+        axis=-1,
+    )
+    return inverse
+
+
+def _batched(
+    operator: typing.Callable[[Tours, Tours, np.random.Generator], tuple[Tours, Tours]],
+) -> Operator:
+    @functools.wraps(operator)
+    def _operator(
+        parents1: Tours,
+        parents2: Tours,
+        rng: np.random.Generator | None = None,
+    ) -> tuple[Tours, Tours]:
+        if parents1.ndim == 1:
+            children1, children2 = operator(
+                parents1[np.newaxis],
+                parents2[np.newaxis],
+                generator(rng),
+            )
+            return children1[0], children2[0]
+        return operator(parents1, parents2, generator(rng))
+
+    return _operator
+
+
+def _cuts(
+    pairs: int,
+    length: int,
+    rng: np.random.Generator,
+) -> tuple[Tours, Tours]:
+    """
+    returns two random cut points (a < b) for each pair.
+    """
+    a = rng.integers(length, size=pairs)
+    b = rng.integers(length, size=pairs)
+    return np.minimum(a, b), np.maximum(a, b) + 1
+
+
+@_batched
+def cycle_crossover(
+    parents1: Tours,
+    parents2: Tours,
+    rng: np.random.Generator,  # noqa: ARG001
+) -> tuple[Tours, Tours]:
+    """
+    Cycle crossover (CX), positions of the odd cycles keep the genes
+    of their parent and positions of the even cycles swap them.
+    It is deterministic, the generator is accepted like other operators.
+    """
+    length = parents1.shape[-1]
+
+    # following position i in the cycle leads to the position of
+    # parents2[i] in parents1.
+    successor = np.take_along_axis(positions(parents1), parents2, axis=-1)
+
+    # label each position with the smallest position in its cycle
+    # by pointer jumping, it needs log(n) steps for all cycles.
+    label = np.broadcast_to(np.arange(length), parents1.shape).copy()
+    for _ in range(max(1, math.ceil(math.log2(length)))):
+        label = np.minimum(label, np.take_along_axis(label, successor, axis=-1))
+        successor = np.take_along_axis(successor, successor, axis=-1)
+
+    # cycles are numbered in the order of their smallest position.
+    number = np.cumsum(label == np.arange(length), axis=-1)
+    odd = np.take_along_axis(number, label, axis=-1) % 2 == 1
+
+    return np.where(odd, parents1, parents2), np.where(odd, parents2, parents1)
+
+
+@_batched
+def order_crossover(
+    parents1: Tours,
+    parents2: Tours,
+    rng: np.random.Generator,
+) -> tuple[Tours, Tours]:
+    """
+    Order crossover (OX), each child keeps a random segment of one parent
+    and the remaining cities are filled in the order of the other parent.
+    """
+    pairs, length = parents1.shape
+    a, b = _cuts(pairs, length, rng)
+
+    segment = (np.arange(length) >= a[:, np.newaxis]) & (
+        np.arange(length) < b[:, np.newaxis]
+    )
+    # positions (and also genes of the other parent) starting after
+    # the segment and wrapping around.
+    rolled = (b[:, np.newaxis] + np.arange(length)) % length
+    free = ~np.take_along_axis(segment, rolled, axis=-1)
+    rows = np.broadcast_to(np.arange(pairs)[:, np.newaxis], parents1.shape)
+
+    def _child(parent1: Tours, parent2: Tours) -> Tours:
+        child = np.where(segment, parent1, -1).astype(parent1.dtype)
+
+        genes = np.take_along_axis(parent2, rolled, axis=-1)
+        kept = np.take_along_axis(
+            np.take_along_axis(segment, positions(parent1), axis=-1),
+            genes,
+            axis=-1,
+        )
+        # both masks have the same number of items in each row.
+        child[rows[free], rolled[free]] = genes[~kept]
+        return child
+
+    return _child(parents1, parents2), _child(parents2, parents1)
+
+
+@_batched
+def partially_mapped_crossover(
+    parents1: Tours,
+    parents2: Tours,
+    rng: np.random.Generator,
+) -> tuple[Tours, Tours]:
+    """
+    Partially mapped crossover (PMX), each child keeps a random segment of
+    one parent and the other positions come from the other parent, genes
+    which are already in the segment are replaced using the segment mapping.
+    """
+    pairs, length = parents1.shape
+    a, b = _cuts(pairs, length, rng)
+
+    segment = (np.arange(length) >= a[:, np.newaxis]) & (
+        np.arange(length) < b[:, np.newaxis]
+    )
+
+    def _child(parent1: Tours, parent2: Tours) -> Tours:
+        position = positions(parent1)
+        in_segment = np.take_along_axis(segment, position, axis=-1)
+
+        # a gene in the segment of parent1 is mapped to the gene on the
+        # same position in parent2 until it reaches a gene outside
+        # the segment, chains are resolved by pointer jumping.
+        mapping = np.where(
+            in_segment,
+            np.take_along_axis(parent2, position, axis=-1),
+            np.arange(length),
+        )
+        for _ in range(max(1, math.ceil(math.log2(length)))):
+            mapping = np.take_along_axis(mapping, mapping, axis=-1)
+
+        return np.where(
+            segment,
+            parent1,
+            np.take_along_axis(mapping, parent2, axis=-1),
+        ).astype(parent1.dtype)
+
+    return _child(parents1, parents2), _child(parents2, parents1)
+
+
+CROSSOVERS: dict[str, Operator] = {
+    "cycle": cycle_crossover,
+    "order": order_crossover,
+    "pmx": partially_mapped_crossover,
+}
@@ -0,0 +1,170 @@
+"""
+Travel costs between cities. Distances never change during a run,
+so they are computed from the city coordinates once and then
+looked up with fancy indexing.
+
+The cost between two cities is their squared euclidean distance.
+"""
+
+from __future__ import annotations
+
+import abc
+import collections
+
+import numpy as np
+import numpy.typing as npt
+
+# bytes of the temporary arrays for a block of rows, it bounds
+# the memory of computing costs for large instances.
+BLOCK_BYTES = 64 * 2**20
+
+
+def block_size(length: int) -> int:
+    """
+    returns number of rows which are computed together, so their
+    float64 temporaries (about three per row) fit into BLOCK_BYTES.
+    """
+    return max(1, BLOCK_BYTES // (3 * np.dtype(np.float64).itemsize * max(length, 1)))
+
+
+# bytes of the cached rows of lazy distances.
+CACHE_BYTES = 256 * 2**20
+
+
+class Distances(abc.ABC):
+    def __init__(self, coordinates: npt.NDArray[np.float64]) -> None:
+        self.coordinates = coordinates
+        self.length = len(coordinates)
+
+    @abc.abstractmethod
+    def __call__(
+        self,
+        a: npt.NDArray[np.integer],
+        b: npt.NDArray[np.integer],
+    ) -> npt.NDArray[np.float32]:
+        """
+        returns cost between a[i] and b[i] cities (element-wise).
+        """
+
+    @abc.abstractmethod
+    def row(self, i: int) -> npt.NDArray[np.float32]:
+        """
+        returns cost between city i and every city.
+        """
+
+    def pair(self, a: int, b: int) -> float:
+        """
+        returns cost between two cities, it is used in scalar loops.
+        """
+        x = self.coordinates[a] - self.coordinates[b]
+        return float(x[0] * x[0] + x[1] * x[1])
+
+    def rows(self, start: int, stop: int) -> npt.NDArray[np.float32]:
+        """
+        returns cost between cities in [start, stop) and every city.
+        """
+        x, y = self.coordinates[:, 0], self.coordinates[:, 1]
+        # differences of x and y are computed separately, so temporaries
+        # are (rows x cities) instead of (rows x cities x 2).
+        costs = x[start:stop, np.newaxis] - x
+        np.multiply(costs, costs, out=costs)
+        diff = y[start:stop, np.newaxis] - y
+        np.multiply(diff, diff, out=diff)
+        costs += diff
+        return costs.astype(np.float32)
+
+    def nearest(self, k: int, block: int | None = None) -> npt.NDArray[np.intp]:
+        """
+        returns k nearest cities of each city sorted by their cost.
+        rows are computed in blocks which are sized by BLOCK_BYTES by default.
+        """
+        block = block or block_size(self.length)
+        k = min(k, self.length - 1)
+        nearest = np.empty((self.length, k), dtype=np.intp)
+        if k <= 0:
+            return nearest
+
+        for start in range(0, self.length, block):
+            stop = min(start + block, self.length)
+            costs = self.rows(start, stop).copy()
+            costs[np.arange(stop - start), np.arange(start, stop)] = np.inf
+
+            candidates = np.argpartition(costs, k - 1, axis=1)[:, :k]
+            order = np.argsort(np.take_along_axis(costs, candidates, 1), axis=1)
+            nearest[start:stop] = np.take_along_axis(candidates, order, axis=1)
+
+        return nearest
+
+
+class DenseDistances(Distances):
+    """
+    DenseDistances stores the whole (cities x cities) matrix as float32.
+    """
+
+    def __init__(self, coordinates: npt.NDArray[np.float64]) -> None:
+        super().__init__(coordinates)
+
+        self.matrix = np.empty((self.length, self.length), dtype=np.float32)
+        block = block_size(self.length)
+        for start in range(0, self.length, block):
+            stop = min(start + block, self.length)
+            self.matrix[start:stop] = super().rows(start, stop)
+
+    def __call__(
+        self,
+        a: npt.NDArray[np.integer],
+        b: npt.NDArray[np.integer],
+    ) -> npt.NDArray[np.float32]:
+        return self.matrix[a, b]
+
+    def row(self, i: int) -> npt.NDArray[np.float32]:
+        return self.matrix[i]
+
+    def pair(self, a: int, b: int) -> float:
+        return float(self.matrix[a, b])
+
+    def rows(self, start: int, stop: int) -> npt.NDArray[np.float32]:
+        return self.matrix[start:stop]
+
+
+class LazyDistances(Distances):
+    """
+    LazyDistances is used for large instances which their matrix does not
+    fit into the memory. Pairs are computed from coordinates on demand
+    and rows are filled lazily into a bounded (LRU) cache. By default
+    the cache keeps as many rows as fit into CACHE_BYTES, so its memory
+    does not grow with the number of cities.
+    """
+
+    def __init__(
+        self,
+        coordinates: npt.NDArray[np.float64],
+        max_rows: int | None = None,
+    ) -> None:
+        super().__init__(coordinates)
+
+        row_bytes = np.dtype(np.float32).itemsize * max(self.length, 1)
+        self.max_rows = max_rows or max(1, CACHE_BYTES // row_bytes)
+        self.cache: collections.OrderedDict[int, npt.NDArray[np.float32]] = (
+            collections.OrderedDict()
+        )
+
+    def __call__(
+        self,
+        a: npt.NDArray[np.integer],
+        b: npt.NDArray[np.integer],
+    ) -> npt.NDArray[np.float32]:
+        diff = self.coordinates[a] - self.coordinates[b]
+        return np.einsum("...k,...k->...", diff, diff).astype(np.float32)
+
+    def row(self, i: int) -> npt.NDArray[np.float32]:
+        if i in self.cache:
+            self.cache.move_to_end(i)
+            return self.cache[i]
+
+        row = self.rows(i, i + 1)[0]
+        self.cache[i] = row
+        if len(self.cache) > self.max_rows:
+            self.cache.popitem(last=False)
+
+        return row
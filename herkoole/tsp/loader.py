@@ -0,0 +1,101 @@
+"""
+Loader of tsp instances, it accepts the following format:
+
+    <city id> <city x coordinate> <city y coordinate>
+    ...
+
+and TSPLIB files which their cities have euclidean coordinates
+(EUC_2D in NODE_COORD_SECTION). Tours are scored with the squared
+euclidean distance between cities (see distance.py) like the other
+instances, not with the rounded euclidean distance of TSPLIB, so their
+lengths are not comparable with the published optima. Other edge weight
+types (e.g. GEO or ATT) are rejected because their cities are not points
+of a plane.
+"""
+
+from __future__ import annotations
+
+import io
+import typing
+
+import numpy as np
+
+from herkoole.model import load_array
+
+from .city import Cities
+from .model import Model
+
+if typing.TYPE_CHECKING:
+    import pathlib
+
+    import numpy.typing as npt
+
+# edge weight types which their cities are points of a plane,
+# they are scored with the squared euclidean distance.
+TSPLIB_COORDINATES = ("EUC_2D",)
+
+
+def _tsplib(text: str) -> npt.NDArray[np.float64]:
+    header, _, body = text.partition("NODE_COORD_SECTION")
+
+    specification: dict[str, str] = {}
+    for line in header.splitlines():
+        key, colon, value = line.partition(":")
+        if colon:
+            specification[key.strip().upper()] = value.strip()
+
+    edge_weight_type = specification.get("EDGE_WEIGHT_TYPE", "")
+    if edge_weight_type not in TSPLIB_COORDINATES:
+        msg = f"tsplib edge weight type {edge_weight_type!r} is not supported"
+        raise ValueError(msg)
+
+    # optional sections (e.g. DISPLAY_DATA_SECTION) come after coordinates.
+    body = body.split("EOF", 1)[0]
+    for section in ("DISPLAY_DATA_SECTION", "TOUR_SECTION"):
+        body = body.split(section, 1)[0]
+
+    data = np.loadtxt(io.StringIO(body), dtype=np.float64, ndmin=2)
+
+    dimension = int(specification.get("DIMENSION", len(data)))
+    if len(data) != dimension:
+        msg = f"tsplib instance has {len(data)} cities instead of {dimension}"
+        raise ValueError(msg)
+
+    return data
+
+
+def parse(path: pathlib.Path) -> npt.NDArray[np.float64]:
+    """
+    returns cities as a (cities x 3) matrix of identifier, x and y.
+    """
+    text = path.read_text(encoding="utf-8")
+
+    if "NODE_COORD_SECTION" in text:
+        data = _tsplib(text)
+    else:
+        data = np.loadtxt(io.StringIO(text), dtype=np.float64, ndmin=2)
+
+    if data.shape[1] != 3:  # noqa: PLR2004
+        msg = f"{path} is not a tsp instance"
+        raise ValueError(msg)
+
+    return data
+
+
+def load(
+    path: str | pathlib.Path,
+    *,
+    cache: bool = True,
+    dense_limit: int = 4096,
+    crossover: typing.Literal["cycle", "order", "pmx"] = "cycle",
+) -> Model:
+    """
+    reads a problem instance from a given file.
+    """
+    data = load_array(path, parse, cache=cache)
+
+    return Model(
+        Cities(data[:, 0].astype(np.int64), data[:, 1:]),
+        dense_limit=dense_limit,
+        crossover=crossover,
+    )
@@ -0,0 +1,249 @@
+"""
+Local search for tsp tours which turns the evolutionary algorithm into
+a memetic algorithm by improving each child after variation.
+
+Moves are 2-opt (reversing a segment) and Or-opt (moving a segment of up
+to three cities). Only moves which make a city adjacent to one of its k
+nearest neighbours are considered, and each move is evaluated in O(1)
+using the changed edges, so looking for an improvement of a city costs
+O(k). Cities whose neighbourhood has no improving move are skipped
+(don't-look bits) until one of their edges changes.
+
+Applying a move updates the tour and city positions in place only
+between its changed edges, so it costs the length of the reversed
+(2-opt) or shifted (Or-opt) span, which is O(n) in the worst case.
+"""
+
+from __future__ import annotations
+
+import collections
+import time
+import typing
+
+from herkoole.ea.evolutionary_algorithm import PostVariation
+
+from .model import Model
+
+if typing.TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+    from herkoole.ea import EvolutionaryAlgorithm
+    from herkoole.population import Population
+
+# improvements smaller than epsilon are rounding errors.
+EPSILON = 1e-9
+
+# or-opt moves segments with at most this number of cities.
+SEGMENT_LENGTH = 3
+
+
+class LocalSearch(PostVariation):
+    """
+    LocalSearch improves children using 2-opt and (optionally) Or-opt moves.
+    It stops after max_moves improving moves or time_budget seconds
+    in each generation.
+    """
+
+    def __init__(
+        self,
+        ea: EvolutionaryAlgorithm,
+        k: int = 8,
+        *,
+        or_opt: bool = True,
+        max_moves: int | None = None,
+        time_budget: float | None = None,
+    ) -> None:
+        if not isinstance(ea.model, Model):
+            msg = "local search only works with tsp model"
+            raise TypeError(msg)
+        self.model = ea.model
+        self.neighbours: list[list[int]] = self.model.neighbours(k).tolist()
+        self.or_opt = or_opt
+        self.max_moves = max_moves
+        self.time_budget = time_budget
+
+        # number of improving moves in the whole run.
+        self.moves = 0
+
+        super().__init__(ea)
+
+    def apply(self, children: Population) -> Population:
+        deadline = None
+        if self.time_budget is not None:
+            deadline = time.perf_counter() + self.time_budget
+        budget = self.max_moves
+
+        for index in range(len(children)):
+            if budget is not None and budget <= 0:
+                break
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+
+            tour = children.genome(index).copy()
+            moves = self.improve(tour, budget, deadline)
+            if moves > 0:
+                children.set_genome(index, tour)
+                self.moves += moves
+                if budget is not None:
+                    budget -= moves
+
+        return children
+
+    def improve(
+        self,
+        tour: npt.NDArray[np.integer],
+        max_moves: int | None = None,
+        deadline: float | None = None,
+    ) -> int:
+        """
+        improves the tour in place and returns number of the applied moves.
+        """
+        search = _Search(self, tour.tolist())
+        moves = search.run(max_moves, deadline)
+        tour[:] = search.tour
+        return moves
+
+
+class _Search:
+    """
+    _Search keeps state of improving one tour. Tour is an open path,
+    so the (missing) edges before the first and after
+    the last city cost nothing.
+    """
+
+    def __init__(self, local_search: LocalSearch, tour: list[int]) -> None:
+        self.pair = local_search.model.distances.pair
+        self.neighbours = local_search.neighbours
+        self.or_opt = local_search.or_opt
+
+        self.tour = tour
+        self.length = len(tour)
+        self.position = [0] * self.length
+        for i, city in enumerate(tour):
+            self.position[city] = i
+
+        self.active: collections.deque[int] = collections.deque(tour)
+        self.looking = [True] * self.length
+
+    def at(self, i: int) -> int:
+        if 0 <= i < self.length:
+            return self.tour[i]
+        return -1
+
+    def cost(self, a: int, b: int) -> float:
+        if a < 0 or b < 0:
+            return 0.0
+        return self.pair(a, b)
+
+    def run(self, max_moves: int | None, deadline: float | None) -> int:
+        moves = 0
+
+        while self.active:
+            if max_moves is not None and moves >= max_moves:
+                break
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+
+            city = self.active.popleft()
+            self.looking[city] = False
+
+            if self.two_opt(city) or (self.or_opt and self.segment_move(city)):
+                moves += 1
+                self.wake(city)
+
+        return moves
+
+    def wake(self, *cities: int) -> None:
+        for city in cities:
+            if city >= 0 and not self.looking[city]:
+                self.looking[city] = True
+                self.active.append(city)
+
+    def two_opt(self, city: int) -> bool:
+        """
+        reverses tour[s..e] to make city adjacent to one of its neighbours.
+        """
+        for neighbour in self.neighbours[city]:
+            i, j = self.position[city], self.position[neighbour]
+            lo, hi = min(i, j), max(i, j)
+
+            for s, e in ((lo + 1, hi), (lo, hi - 1)):
+                if s >= e:
+                    continue
+
+                before, first = self.at(s - 1), self.tour[s]
+                last, after = self.tour[e], self.at(e + 1)
+                delta = (
+                    self.cost(before, last)
+                    + self.cost(first, after)
+                    - self.cost(before, first)
+                    - self.cost(last, after)
+                )
+                if delta < -EPSILON:
+                    self.tour[s : e + 1] = self.tour[s : e + 1][::-1]
+                    for p in range(s, e + 1):
+                        self.position[self.tour[p]] = p
+                    self.wake(before, first, last, after)
+                    return True
+
+        return False
+
+    def segment_move(self, city: int) -> bool:
+        """
+        moves a segment starting with city between one of its neighbours
+        and the city before or after that neighbour.
+        """
+        i = self.position[city]
+
+        for size in range(1, SEGMENT_LENGTH + 1):
+            if i + size > self.length:
+                break
+
+            first, last = self.tour[i], self.tour[i + size - 1]
+            before, after = self.at(i - 1), self.at(i + size)
+            removed = (
+                self.cost(before, first)
+                + self.cost(last, after)
+                - self.cost(before, after)
+            )
+
+            for neighbour in self.neighbours[city]:
+                j = self.position[neighbour]
+                # insert between positions (q, q + 1) outside the segment.
+                for q in (j - 1, j):
+                    if i - 1 <= q <= i + size - 1:
+                        continue
+
+                    u, v = self.at(q), self.at(q + 1)
+                    forward = self.cost(u, first) + self.cost(last, v)
+                    backward = self.cost(u, last) + self.cost(first, v)
+                    delta = min(forward, backward) - self.cost(u, v) - removed
+
+                    if delta < -EPSILON:
+                        self.move(i, size, q, reverse=backward < forward)
+                        self.wake(before, after, first, last, u, v)
+                        return True
+
+        return False
+
+    def move(self, i: int, size: int, q: int, *, reverse: bool) -> None:
+        """
+        moves tour[i..i + size - 1] between positions q and q + 1,
+        only the cities between them are shifted.
+        """
+        segment = self.tour[i : i + size]
+        if reverse:
+            segment.reverse()
+
+        # q is a position in the tour before removing the segment.
+        at = q + 1 if q < i else q + 1 - size
+        if at < i:
+            start, stop = at, i + size
+            self.tour[start:stop] = segment + self.tour[at:i]
+        else:
+            start, stop = i, at + size
+            self.tour[start:stop] = self.tour[i + size : at + size] + segment
+
+        for p in range(start, stop):
+            self.position[self.tour[p]] = p
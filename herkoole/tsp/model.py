@@ -1,34 +1,174 @@
 from __future__ import annotations
 
-import random
+import array
+import typing
 from typing import TYPE_CHECKING
 
+import numpy as np
+import numpy.typing as npt
+
 import herkoole.chromosome
 import herkoole.model
+from herkoole.chromosome import genome_key
+from herkoole.rng import generator
+
+from .city import Cities
+from .crossover import CROSSOVERS
+from .distance import DenseDistances, Distances, LazyDistances
 
 if TYPE_CHECKING:
     from .city import City
 
 
 class Model(herkoole.model.Model):
-    def __init__(self, cities: list[City]) -> None:
+    genome_dtype = np.int32
+
+    def __init__(
+        self,
+        cities: typing.Sequence[City],
+        dense_limit: int = 4096,
+        crossover: typing.Literal["cycle", "order", "pmx"] = "cycle",
+    ) -> None:
+        """
+        distances are stored as a dense matrix when there are at most
+        dense_limit cities, otherwise they are computed lazily.
+        crossover is the permutation crossover operator of chromosomes.
+        """
         self.cities = cities
         self.length = len(cities)
-
-    def initial_population(self, mu: int) -> list[herkoole.chromosome.Chromosome]:
+        self.crossover = CROSSOVERS[crossover]
+        self.candidates: dict[int, npt.NDArray[np.intp]] = {}
+
+        coordinates = (
+            np.asarray(cities.coordinates, dtype=np.float64)
+            if isinstance(cities, Cities)
+            else np.array([(c.x, c.y) for c in cities], dtype=np.float64)
+        )
+        self.distances: Distances
+        if self.length <= dense_limit:
+            self.distances = DenseDistances(coordinates.reshape(-1, 2))
+        else:
+            self.distances = LazyDistances(coordinates.reshape(-1, 2))
+
+    def initial_population(
+        self,
+        mu: int,
+        rng: np.random.Generator | None = None,
+    ) -> list[herkoole.chromosome.Chromosome]:
         population: list[herkoole.chromosome.Chromosome] = []
         for _ in range(mu):
             chromosome = Chromosome(self)
-            chromosome.random()
+            chromosome.random(rng)
             population.append(chromosome)
         return population
 
+    def neighbours(self, k: int) -> npt.NDArray[np.intp]:
+        """
+        returns (and caches) candidate lists of the k nearest cities.
+        """
+        if k not in self.candidates:
+            self.candidates[k] = self.distances.nearest(k)
+        return self.candidates[k]
+
+    def tour_length(self, genomes: npt.NDArray[np.int32]) -> npt.NDArray[np.float64]:
+        """
+        returns length of the tour (last axis) for a tour or a batch of tours.
+        """
+        return np.sum(
+            self.distances(genomes[..., :-1], genomes[..., 1:]),
+            axis=-1,
+            dtype=np.float64,
+        )
+
+    def batch_fitness(self, genomes: npt.NDArray[np.int32]) -> npt.NDArray[np.float64]:
+        return 1 / self.tour_length(genomes)
+
+    def fingerprints(self, genomes: npt.NDArray[np.int32]) -> list[bytes]:
+        """
+        returns hash of the canonical direction of each tour, a tour and
+        its reverse have the same length so they are the same solution.
+        Tours are open paths, so their rotations are not the same.
+        """
+        reverse = genomes[:, 0] > genomes[:, -1]
+        canonical = np.where(reverse[:, np.newaxis], genomes[:, ::-1], genomes)
+        return [genome_key(np.ascontiguousarray(tour)) for tour in canonical]
+
+    def genome_distance(
+        self,
+        genomes1: npt.NDArray[np.int32],
+        genomes2: npt.NDArray[np.int32],
+    ) -> npt.NDArray[np.float64]:
+        """
+        returns ratio of the edges of each tour in genomes1 which are
+        not in the same tour of genomes2 (in any direction).
+        """
+        if self.length < 2:  # noqa: PLR2004
+            return np.zeros(len(genomes1))
+
+        rows = np.arange(len(genomes2))[:, np.newaxis]
+        following = np.full(genomes2.shape, -1, dtype=genomes2.dtype)
+        preceding = np.full(genomes2.shape, -1, dtype=genomes2.dtype)
+        following[rows, genomes2[:, :-1]] = genomes2[:, 1:]
+        preceding[rows, genomes2[:, 1:]] = genomes2[:, :-1]
+
+        start, end = genomes1[:, :-1], genomes1[:, 1:]
+        shared = (np.take_along_axis(following, start, axis=1) == end) | (
+            np.take_along_axis(preceding, start, axis=1) == end
+        )
+        return 1 - np.mean(shared, axis=1)
+
+    def chromosome(self, genes: list[typing.Any]) -> Chromosome:
+        chromosome = Chromosome(self)
+        chromosome.assign(np.asarray(genes))
+        return chromosome
+
+    def batch_mutate(
+        self,
+        genomes: npt.NDArray[np.int32],
+        prob: float,
+        rng: np.random.Generator | None = None,
+    ) -> None:
+        rng = generator(rng)
+        rows = np.flatnonzero(rng.random(len(genomes)) < prob)
+        # swap two distinct genes of each mutated row.
+        i = rng.integers(self.length, size=len(rows))
+        j = (i + rng.integers(1, self.length, size=len(rows))) % self.length
+        genomes[rows, i], genomes[rows, j] = genomes[rows, j], genomes[rows, i]
+
+    def batch_crossover(
+        self,
+        parents1: npt.NDArray[np.int32],
+        parents2: npt.NDArray[np.int32],
+        prob: float,
+        rng: np.random.Generator | None = None,
+    ) -> tuple[npt.NDArray[np.int32], npt.NDArray[np.int32]]:
+        rng = generator(rng)
+        children1, children2 = parents1.copy(), parents2.copy()
+
+        rows = np.flatnonzero(rng.random(len(parents1)) < prob)
+        if len(rows) > 0:
+            children1[rows], children2[rows] = self.crossover(
+                parents1[rows],
+                parents2[rows],
+                rng,
+            )
+
+        return children1, children2
+
 
 class Chromosome(herkoole.chromosome.Chromosome[int]):
+    """
+    Chromosome represents a tour, genes are stored as a (32-bit) integer
+    array instead of a list of python integers.
+    """
+
+    __slots__ = ("model",)
+
     def __init__(self, model: Model) -> None:
         self.model = model
 
         super().__init__()
+        self.genes: array.array[int] = array.array("i")
 
     def __str__(self) -> str:
         res = " -> ".join(str(self.model.cities[gene]) for gene in self.genes)
@@ -37,25 +177,51 @@ class Chromosome(herkoole.chromosome.Chromosome[int]):
 
         return res
 
-    def random(self) -> None:
-        self.genes = list(range(self.model.length))
-        random.shuffle(self.genes)
-
-    def fitness(self) -> float:
-        distance = 0.0
-
-        for i in range(1, self.model.length):
-            c1 = self.model.cities[self.genes[i - 1]]
-            c2 = self.model.cities[self.genes[i]]
-            distance += (c1.x - c2.x) ** 2 + (c1.y - c2.y) ** 2
-
-        return 1 / distance
-
-    def mutate(self, prob: float) -> None:
-        rand = random.random()
+    def random(self, rng: np.random.Generator | None = None) -> None:
+        genes = generator(rng).permutation(self.model.length).astype(np.int32)
+        self.genes = array.array("i", genes.tobytes())
+
+    def assign(self, genome: npt.NDArray[typing.Any]) -> None:
+        self.genes = array.array("i", genome.astype(np.int32).tobytes())
+        self.invalidate()
+
+    def fingerprint(self) -> bytes:
+        return self.model.fingerprints(np.asarray(self.genes)[np.newaxis])[0]
+
+    def evaluate(self) -> float:
+        self.state = float(self.model.tour_length(np.asarray(self.genes)))
+        return 1 / self.state
+
+    def delta(
+        self,
+        positions: npt.NDArray[np.intp],
+        previous: npt.NDArray[np.int32],
+    ) -> float | None:
+        tour = np.asarray(self.genes)
+        before = tour.copy()
+        before[positions] = previous
+
+        # only edges which have a changed endpoint are evaluated.
+        edges = np.unique(np.concatenate((positions - 1, positions)))
+        edges = edges[(edges >= 0) & (edges < self.model.length - 1)]
+
+        self.state += float(
+            np.sum(self.model.distances(tour[edges], tour[edges + 1]), dtype=np.float64)
+            - np.sum(
+                self.model.distances(before[edges], before[edges + 1]),
+                dtype=np.float64,
+            ),
+        )
+        return 1 / self.state
+
+    def mutate(self, prob: float, rng: np.random.Generator | None = None) -> None:
+        rng = generator(rng)
+        rand = rng.random()
         if rand < prob:
-            i, j = random.sample(range(self.model.length), 2)
+            i, j = rng.choice(self.model.length, 2, replace=False).tolist()
+            previous = [self.genes[i], self.genes[j]]
             self.genes[i], self.genes[j] = self.genes[j], self.genes[i]
+            self.update([i, j], previous)
 
     @classmethod
     def crossover(
@@ -63,36 +229,21 @@ class Chromosome(herkoole.chromosome.Chromosome[int]):
         parent1: herkoole.chromosome.Chromosome,
         parent2: herkoole.chromosome.Chromosome,
         prob: float,
+        rng: np.random.Generator | None = None,
     ) -> tuple[herkoole.chromosome.Chromosome, herkoole.chromosome.Chromosome]:
-        if not isinstance(parent1, Chromosome) or isinstance(parent2, Chromosome):
+        if not isinstance(parent1, Chromosome) or not isinstance(parent2, Chromosome):
             raise TypeError
 
-        rand = random.random()
-        if rand >= prob:
-            return parent1, parent2
-
-        cycles = [-1] * parent1.model.length
-        cycle_no = 1
-        cyclestart = (i for i, v in enumerate(cycles) if v < 0)
-
-        for pos in cyclestart:
-            _pos = pos
-            while cycles[_pos] < 0:
-                cycles[_pos] = cycle_no
-                _pos = parent1.genes.index(parent2.genes[_pos])
-
-        cycle_no += 1
-
-        child1 = Chromosome(parent1.model)
-        child2 = Chromosome(parent1.model)
-
-        child1.genes = [
-            parent1.genes[i] if n % 2 else parent2.genes[i]
-            for i, n in enumerate(cycles)
-        ]
-        child2.genes = [
-            parent2.genes[i] if n % 2 else parent1.genes[i]
-            for i, n in enumerate(cycles)
-        ]
+        genes1, genes2 = np.asarray(parent1.genes), np.asarray(parent2.genes)
+
+        rng = generator(rng)
+        rand = rng.random()
+        if rand < prob:
+            genes1, genes2 = parent1.model.crossover(genes1, genes2, rng)
+
+        child1 = parent1.model.chromosome(genes1)
+        child2 = parent1.model.chromosome(genes2)
+        child1.derive(parent1, parent2)
+        child2.derive(parent1, parent2)
 
         return child1, child2
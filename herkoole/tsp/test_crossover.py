@@ -0,0 +1,29 @@
+import numpy as np
+
+from .crossover import cycle_crossover, order_crossover, partially_mapped_crossover
+
+
+def test_cycle_crossover() -> None:
+    parent1 = np.array([0, 1, 2, 3, 4, 5, 6, 7, 8])
+    parent2 = np.array([8, 5, 1, 4, 7, 6, 2, 3, 0])
+
+    # cycles: {0, 8}, {1, 2, 6, 5}, {3, 7, 4}
+    child1, child2 = cycle_crossover(parent1, parent2)
+
+    assert child1.tolist() == [0, 5, 1, 3, 4, 6, 2, 7, 8]
+    assert child2.tolist() == [8, 1, 2, 4, 7, 5, 6, 3, 0]
+
+
+def test_batched_crossovers() -> None:
+    parents1 = np.array([np.random.permutation(100) for _ in range(30)])
+    parents2 = np.array([np.random.permutation(100) for _ in range(30)])
+
+    for crossover in (cycle_crossover, order_crossover, partially_mapped_crossover):
+        children1, children2 = crossover(parents1, parents2)
+
+        assert np.all(np.sort(children1, axis=1) == np.arange(100))
+        assert np.all(np.sort(children2, axis=1) == np.arange(100))
+        # each gene comes from one of the parents on the same position
+        # except for the reordered ones.
+        if crossover is cycle_crossover:
+            assert np.all((children1 == parents1) | (children1 == parents2))
@@ -0,0 +1,47 @@
+import pathlib
+
+import numpy as np
+import pytest
+
+from .city import City
+from .loader import load
+
+TSPLIB = """NAME : square
+COMMENT : four cities on a square
+TYPE : TSP
+DIMENSION : 4
+EDGE_WEIGHT_TYPE : EUC_2D
+NODE_COORD_SECTION
+1 0 0
+2 1 0
+3 1 1
+4 0 1
+EOF
+"""
+
+
+def test_load(tmp_path: pathlib.Path) -> None:
+    plain = tmp_path / "square.txt"
+    plain.write_text("1 0 0\n2 1 0\n3 1 1\n4 0 1\n", encoding="utf-8")
+    tsplib = tmp_path / "square.tsp"
+    tsplib.write_text(TSPLIB, encoding="utf-8")
+
+    for path in (plain, tsplib):
+        for _ in range(2):
+            m = load(path)
+            assert path.with_name(f"{path.name}.npy").exists()
+            assert m.length == 4
+            assert m.cities[2] == City(3, 1, 1)
+            assert m.tour_length(np.array([0, 1, 2, 3])) == 3
+
+
+def test_load_edge_weight_type(tmp_path: pathlib.Path) -> None:
+    # cities of other types are not scored with the euclidean distance.
+    for edge_weight_type in ("GEO", "ATT", "CEIL_2D", "MAN_2D"):
+        path = tmp_path / f"{edge_weight_type}.tsp"
+        path.write_text(
+            TSPLIB.replace("EUC_2D", edge_weight_type),
+            encoding="utf-8",
+        )
+        with pytest.raises(ValueError, match=edge_weight_type):
+            load(path, cache=False)
@@ -0,0 +1,65 @@
+import numpy as np
+
+from herkoole.ea import EvolutionaryAlgorithm, QTournament, StochasticUniversalSampling
+
+from .city import City
+from .local_search import LocalSearch, _Search
+from .model import Model
+
+
+def test_local_search() -> None:
+    rng = np.random.default_rng(7)
+    cities = [City(i, x, y) for i, (x, y) in enumerate(rng.random((200, 2)))]
+    m = Model(cities)
+
+    ea = EvolutionaryAlgorithm(
+        4,
+        4,
+        1,
+        m,
+        parent_selector=StochasticUniversalSampling.new(),
+        remaining_population_selector=QTournament.new(q=2),
+        post_variation=LocalSearch.new(k=6),
+    )
+    assert isinstance(ea.post_variation, LocalSearch)
+
+    tour = rng.permutation(200)
+    before = m.tour_length(tour)
+    moves = ea.post_variation.improve(tour)
+
+    assert moves > 0
+    assert sorted(tour.tolist()) == list(range(200))
+    assert m.tour_length(tour) < before / 5
+
+    # don't-look bits may skip a few moves, but those never worsen the tour.
+    after = m.tour_length(tour)
+    ea.post_variation.improve(tour)
+    assert m.tour_length(tour) <= after
+
+    ea.run()
+    assert ea.post_variation.moves > 0
+
+
+def test_segment_move() -> None:
+    cities = [City(i, i, 0) for i in range(10)]
+    ea = EvolutionaryAlgorithm(
+        4,
+        4,
+        1,
+        Model(cities),
+        parent_selector=StochasticUniversalSampling.new(),
+        remaining_population_selector=QTournament.new(q=2),
+        post_variation=LocalSearch.new(k=3),
+    )
+    assert isinstance(ea.post_variation, LocalSearch)
+
+    tour = list(range(10))
+    for i, size, q, reverse, expected in (
+        (2, 3, 6, False, [0, 1, 5, 6, 2, 3, 4, 7, 8, 9]),
+        (5, 2, 0, True, [0, 6, 5, 1, 2, 3, 4, 7, 8, 9]),
+        (7, 3, -1, False, [7, 8, 9, 0, 1, 2, 3, 4, 5, 6]),
+    ):
+        search = _Search(ea.post_variation, tour.copy())
+        search.move(i, size, q, reverse=reverse)
+        assert search.tour == expected
+        assert all(search.tour[p] == city for city, p in enumerate(search.position))
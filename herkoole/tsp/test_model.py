@@ -1,4 +1,7 @@
+import numpy as np
+
 from .city import City
+from .distance import DenseDistances, LazyDistances
 from .model import Chromosome, Model
 
 
@@ -36,3 +39,108 @@ def test_initiation() -> None:
             diff += 1
     assert diff == 2
     assert genes != ch.genes
+
+
+def test_distances() -> None:
+    cities = [
+        City(1, 0, 0),
+        City(2, 1, 0),
+        City(3, 1, 1),
+        City(4, 0, 2),
+    ]
+
+    dense = Model(cities)
+    lazy = Model(cities, dense_limit=0)
+    assert isinstance(dense.distances, DenseDistances)
+    assert isinstance(lazy.distances, LazyDistances)
+
+    tours = np.array([[0, 1, 2, 3], [3, 2, 1, 0], [0, 2, 1, 3]])
+    for m in (dense, lazy):
+        assert m.tour_length(tours).tolist() == [4, 4, 8]
+        assert m.tour_length(tours[2]) == 8
+        assert m.distances.row(3).tolist() == [4, 5, 2, 0]
+
+        fitness = m.batch_fitness(tours)
+        for tour, f in zip(tours, fitness, strict=True):
+            assert m.decode(tour).fitness() == f
+
+
+def test_crossover() -> None:
+    cities = [City(i, i, i % 7) for i in range(50)]
+
+    for crossover in ("cycle", "order", "pmx"):
+        m = Model(cities, crossover=crossover)
+        parents = m.encode(m.initial_population(20))
+
+        children1, children2 = m.batch_crossover(parents[:10], parents[10:], 1)
+        for child in (*children1, *children2):
+            assert sorted(child.tolist()) == list(range(50))
+
+        p1, p2 = m.initial_population(2)
+        c1, c2 = Chromosome.crossover(p1, p2, 1)
+        assert c1 is not p1
+        assert sorted(c1.genes) == list(range(50))
+        assert sorted(c2.genes) == list(range(50))
+
+
+def test_delta_fitness() -> None:
+    cities = [City(i, float(i % 5), float(i * i % 7)) for i in range(1, 11)]
+    m = Model(cities)
+
+    parent1, parent2 = m.initial_population(2)
+    parent1.fitness()
+    parent2.fitness()
+
+    for _ in range(20):
+        child1, child2 = Chromosome.crossover(parent1, parent2, 1)
+        for ch in (child1, child2):
+            ch.mutate(1)
+            assert ch.cached_fitness is not None
+            assert np.isclose(ch.cached_fitness, m.chromosome(ch.genes[:]).fitness())
+
+
+def test_fingerprints() -> None:
+    m = Model([City(i, i, i * i) for i in range(6)])
+    tours = np.array(
+        [[0, 1, 2, 3, 4, 5], [5, 4, 3, 2, 1, 0], [1, 2, 3, 4, 5, 0]],
+        dtype=np.int32,
+    )
+
+    fingerprints = m.fingerprints(tours)
+    # reversed tour has the same length, rotated one does not.
+    assert fingerprints[0] == fingerprints[1]
+    assert fingerprints[0] != fingerprints[2]
+    assert m.chromosome(tours[1].tolist()).fingerprint() == fingerprints[0]
+
+    # the rotated tour shares all of the edges except one.
+    distance = m.genome_distance(tours[[0, 0]], tours[[1, 2]])
+    assert np.allclose(distance, [0, 1 / 5])
+
+
+def test_nearest() -> None:
+    rng = np.random.default_rng(5)
+    cities = [City(i, *rng.random(2) * 100) for i in range(300)]
+    dense = Model(cities)
+    lazy = Model(cities, dense_limit=0)
+
+    expected = dense.distances.nearest(6)
+    # blocks of a few rows give the same candidates as the whole matrix.
+    for block in (1, 7, None):
+        assert np.array_equal(lazy.distances.nearest(6, block=block), expected)
+    assert np.array_equal(lazy.distances.rows(0, 300), dense.distances.matrix)
+
+
+def test_row_cache() -> None:
+    rng = np.random.default_rng(2)
+    coordinates = rng.random((50, 2))
+    lazy = LazyDistances(coordinates, max_rows=3)
+    dense = DenseDistances(coordinates)
+
+    for i in (0, 1, 2, 0, 3, 4):
+        assert np.array_equal(lazy.row(i), dense.row(i))
+    # the least recently used rows are dropped first.
+    assert list(lazy.cache) == [0, 3, 4]
+    assert lazy.row(3) is lazy.cache[3]
+
+    # the default cache is bounded by bytes instead of rows.
+    assert LazyDistances(rng.random((2**20, 2))).max_rows == 64
@@ -1,53 +1,17 @@
-import io
 import logging
 import pathlib
+import typing
 
 import click
 
-from herkoole.ea import EvolutionaryAlgorithm, QTournament, StochasticUniversalSampling
-from herkoole.knapsack import Model as KModel
-from herkoole.model import Model
-from herkoole.tsp import City
-from herkoole.tsp import Model as TModel
-
-
-def tsp(f: io.TextIOBase) -> Model:
-    """
-    reads a problem instance from a given file.
-    """
-
-    cities: list[City] = []
-    while True:
-        line = f.readline()
-        if line == "":
-            break
-        coordinate = line.split()
-        identifier = int(coordinate[0])
-        x = float(coordinate[1])
-        y = float(coordinate[2])
-        city = City(identifier, x, y)
-        cities.append(city)
-
-    return TModel(cities)
-
-
-def knapsack(f: io.TextIOBase) -> Model:
-    """
-    reads a problem instance from a given file.
-    """
-    l1 = f.readline().split()
-    chromosome_length = int(l1[0])
-    max_weight = int(l1[1])
-
-    weights: list[int] = []
-    values: list[int] = []
-
-    for _ in range(chromosome_length):
-        value_weight = f.readline().split()
-        values.append(int(value_weight[0]))
-        weights.append(int(value_weight[1]))
-
-    return KModel(weights, values, max_weight)
+from herkoole import knapsack, tsp
+from herkoole.ea import (
+    Checkpoint,
+    EvolutionaryAlgorithm,
+    QTournament,
+    StochasticUniversalSampling,
+    load_checkpoint,
+)
 
 
 @click.command()
@@ -60,41 +24,103 @@ def knapsack(f: io.TextIOBase) -> Model:
 )
 @click.option("--iterations", "-t", default=100, type=int)
 @click.option("--verbose", "-v", default=False, is_flag=True)
-def main(
+@click.option(
+    "--checkpoint",
+    "-c",
+    default=None,
+    type=click.Path(dir_okay=False),
+    help="save the run state into this file periodically.",
+)
+@click.option("--checkpoint-interval", default=10, type=int)
+@click.option(
+    "--resume",
+    "-r",
+    default=False,
+    is_flag=True,
+    help="continue the run from its checkpoint when it exists.",
+)
+@click.option(
+    "--seeding",
+    default="random",
+    type=click.Choice(["random", "greedy", "randomized_greedy"]),
+    help="initial population of knapsack.",
+)
+@click.option(
+    "--repair",
+    default=False,
+    is_flag=True,
+    help="repair overweight knapsack children.",
+)
+@click.option(
+    "--eliminate-duplicates",
+    default=False,
+    is_flag=True,
+    help="reject children which are already in the population.",
+)
+@click.option(
+    "--seed",
+    "-s",
+    default=None,
+    type=int,
+    help="seed of the run, runs with the same seed are the same.",
+)
+def main(  # noqa: PLR0913, PLR0917
     info: str,
     problem: str,
     iterations: int,
     verbose: bool,  # noqa: FBT001
+    checkpoint: str | None,
+    checkpoint_interval: int,
+    resume: bool,  # noqa: FBT001
+    seeding: typing.Literal["random", "greedy", "randomized_greedy"],
+    repair: bool,  # noqa: FBT001
+    eliminate_duplicates: bool,  # noqa: FBT001
+    seed: int | None,
 ) -> None:
     if verbose is True:
         logging.basicConfig(level=logging.INFO)
 
-    with pathlib.Path(info).open(encoding="utf-8") as f:
-        match problem:
-            case "knapsack":
-                m = knapsack(f)
-            case "tsp":
-                m = tsp(f)
-            case _:
-                return
-
-    print(  # noqa: T201
-        EvolutionaryAlgorithm(
-            10,
-            20,
-            iterations,
-            m,
-            parent_selector=StochasticUniversalSampling.new(),
-            remaining_population_selector=QTournament.new(q=2),
-            threshold=0.0001,
-            # the following line actually disables the similarity
-            # check between generations.
-            # window_size=iterations,  # noqa: ERA001
-            crossover_propability=0.1,
-            mutation_propability=0.5,
-        ).run(),
+    # parsed instances are cached beside their files.
+    match problem:
+        case "knapsack":
+            m = knapsack.load(info, seeding=seeding)
+        case "tsp":
+            m = tsp.load(info)
+        case _:
+            return
+
+    ea = EvolutionaryAlgorithm(
+        10,
+        20,
+        iterations,
+        m,
+        parent_selector=StochasticUniversalSampling.new(),
+        remaining_population_selector=QTournament.new(q=2),
+        threshold=0.0001,
+        # the following line actually disables the similarity
+        # check between generations.
+        # window_size=iterations,  # noqa: ERA001
+        crossover_propability=0.1,
+        mutation_propability=0.5,
+        post_variation=knapsack.Repair.new()
+        if repair is True and problem == "knapsack"
+        else None,
+        observers=[Checkpoint.new(checkpoint, checkpoint_interval)]
+        if checkpoint is not None
+        else None,
+        seed=seed,
+        eliminate_duplicates=eliminate_duplicates,
     )
 
+    if resume is True:
+        if checkpoint is None:
+            msg = "resume needs a checkpoint file"
+            raise click.UsageError(msg)
+        if pathlib.Path(checkpoint).exists():
+            load_checkpoint(ea, checkpoint)
+
+    print(ea.run())  # noqa: T201
+
 
 if __name__ == "__main__":
     main()